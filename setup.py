@@ -55,4 +55,9 @@ setup(
         "apispec-webframeworks>=0.5.2,<0.6",
         "taipy-core@git+https://git@github.com/Avaiga/taipy-core.git@develop",
     ],
+    extras_require={
+        "compression": ["brotli>=1.1", "zstandard>=0.22"],
+        "production": ["gunicorn>=21.2,<24"],
+        "websocket": ["flask-sock>=0.7,<0.8"],
+    },
 )
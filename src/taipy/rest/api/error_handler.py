@@ -25,7 +25,16 @@ from taipy.core.exceptions.exceptions import (
     NonExistingTaskConfig,
 )
 
-from .exceptions.exceptions import ConfigIdMissingException, ScenarioIdMissingException, SequenceNameMissingException
+from .exceptions.exceptions import (
+    BatchSizeExceededException,
+    ConfigIdMissingException,
+    DataNodeIOBusyException,
+    JobIdMissingException,
+    ScenarioIdMissingException,
+    SequenceNameMissingException,
+    StreamsBusyException,
+    SubmissionNotFoundException,
+)
 from .views import blueprint
 
 
@@ -48,6 +57,11 @@ def handle_config_id_missing_exception(e):
     return jsonify({"message": e.message}), 400
 
 
+@blueprint.errorhandler(JobIdMissingException)
+def handle_job_id_missing_exception(e):
+    return jsonify({"message": e.message}), 400
+
+
 @blueprint.errorhandler(ScenarioIdMissingException)
 def handle_scenario_id_missing_exception(e):
     return jsonify({"message": e.message}), 400
@@ -58,6 +72,21 @@ def handle_sequence_name_missing_exception(e):
     return jsonify({"message": e.message}), 400
 
 
+@blueprint.errorhandler(BatchSizeExceededException)
+def handle_batch_size_exceeded_exception(e):
+    return jsonify({"message": e.message}), 400
+
+
+@blueprint.errorhandler(DataNodeIOBusyException)
+def handle_data_node_io_busy_exception(e):
+    return jsonify({"message": e.message}), 503, {"Retry-After": str(e.retry_after)}
+
+
+@blueprint.errorhandler(StreamsBusyException)
+def handle_streams_busy_exception(e):
+    return jsonify({"message": e.message}), 503, {"Retry-After": str(e.retry_after)}
+
+
 @blueprint.errorhandler(NonExistingDataNode)
 def handle_data_node_not_found(e):
     return _create_404(e)
@@ -106,3 +135,8 @@ def handle_task_not_found(e):
 @blueprint.errorhandler(NonExistingTaskConfig)
 def handle_task_config_not_found(e):
     return _create_404(e)
+
+
+@blueprint.errorhandler(SubmissionNotFoundException)
+def handle_submission_not_found(e):
+    return _create_404(e)
@@ -23,3 +23,35 @@ class ScenarioIdMissingException(Exception):
 class SequenceNameMissingException(Exception):
     def __init__(self):
         self.message = "Sequence name is missing."
+
+
+class JobIdMissingException(Exception):
+    def __init__(self):
+        self.message = "Job id is missing."
+
+
+class JobNotCancelledException(Exception):
+    def __init__(self, job_id: str):
+        self.message = f"Job {job_id} is already finished and cannot be cancelled."
+
+
+class BatchSizeExceededException(Exception):
+    def __init__(self, size: int, max_size: int):
+        self.message = f"Batch of {size} entries exceeds the maximum size of {max_size}."
+
+
+class SubmissionNotFoundException(Exception):
+    def __init__(self, submission_id: str):
+        self.message = f"Submission {submission_id} not found."
+
+
+class DataNodeIOBusyException(Exception):
+    def __init__(self, retry_after: int):
+        self.message = "Too many data node reads and writes in progress, retry later."
+        self.retry_after = retry_after
+
+
+class StreamsBusyException(Exception):
+    def __init__(self, retry_after: int):
+        self.message = "Too many job event streams, job waits and WebSocket connections in progress, retry later."
+        self.retry_after = retry_after
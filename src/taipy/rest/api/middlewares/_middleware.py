@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import util
 
 from taipy.core.common._utils import _load_fct
@@ -26,6 +26,7 @@ def _middleware(f):
     return wrapper
 
 
+@lru_cache(maxsize=1)
 def _using_enterprise():
     return util.find_spec("taipy.enterprise") is not None
 
@@ -9,11 +9,24 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from .batch import BatchResource
 from .cycle import CycleList, CycleResource
 from .datanode import DataNodeList, DataNodeReader, DataNodeResource, DataNodeWriter
-from .job import JobExecutor, JobList, JobResource
-from .scenario import ScenarioExecutor, ScenarioList, ScenarioResource
-from .sequence import SequenceExecutor, SequenceList, SequenceResource
+from .job import (
+    JobEvents,
+    JobExecutor,
+    JobList,
+    JobListExecutor,
+    JobListWaiter,
+    JobResource,
+    JobRetention,
+    JobStacktrace,
+    JobStatistics,
+    JobWaiter,
+)
+from .scenario import ScenarioBulkCreator, ScenarioBulkExecutor, ScenarioExecutor, ScenarioList, ScenarioResource
+from .sequence import SequenceBulkExecutor, SequenceExecutor, SequenceList, SequenceResource
+from .submission import SubmissionResource
 from .task import TaskExecutor, TaskList, TaskResource
 
 __all__ = [
@@ -27,12 +40,24 @@ __all__ = [
     "SequenceList",
     "SequenceResource",
     "SequenceExecutor",
+    "SequenceBulkExecutor",
     "ScenarioList",
     "ScenarioResource",
     "ScenarioExecutor",
+    "ScenarioBulkCreator",
+    "ScenarioBulkExecutor",
     "CycleResource",
     "CycleList",
     "JobResource",
     "JobList",
     "JobExecutor",
+    "JobListExecutor",
+    "JobEvents",
+    "JobWaiter",
+    "JobListWaiter",
+    "JobStatistics",
+    "JobRetention",
+    "JobStacktrace",
+    "BatchResource",
+    "SubmissionResource",
 ]
@@ -0,0 +1,205 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app, request, url_for
+from flask_restful import Resource
+
+from ..exceptions.exceptions import BatchSizeExceededException
+from ..middlewares._middleware import _middleware
+from ..schemas import BatchSchema
+
+_OPERATIONS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    "create": {
+        "cycle": ("POST", "api.cycles"),
+        "datanode": ("POST", "api.datanodes"),
+        "task": ("POST", "api.tasks"),
+        "sequence": ("POST", "api.sequences"),
+        "scenario": ("POST", "api.scenarios"),
+        "job": ("POST", "api.jobs"),
+    },
+    "write": {
+        "datanode": ("PUT", "api.datanode_writer"),
+    },
+    "submit": {
+        "task": ("POST", "api.task_submit"),
+        "sequence": ("POST", "api.sequence_submit"),
+        "scenario": ("POST", "api.scenario_submit"),
+    },
+    "delete": {
+        "cycle": ("DELETE", "api.cycle_by_id"),
+        "datanode": ("DELETE", "api.datanode_by_id"),
+        "task": ("DELETE", "api.task_by_id"),
+        "sequence": ("DELETE", "api.sequence_by_id"),
+        "scenario": ("DELETE", "api.scenario_by_id"),
+        "job": ("DELETE", "api.job_by_id"),
+    },
+}
+
+_ID_ARGUMENTS = {
+    "cycle": "cycle_id",
+    "datanode": "datanode_id",
+    "task": "task_id",
+    "sequence": "sequence_id",
+    "scenario": "scenario_id",
+    "job": "job_id",
+}
+
+_REFERENCE_PREFIX = "$"
+_NOT_FORWARDED_HEADERS = {"Accept-Encoding", "Content-Length", "Content-Type", "Content-Encoding", "Host"}
+
+
+class _OperationError(Exception):
+    def __init__(self, status: int, message: str):
+        self.status = status
+        self.message = message
+
+
+class BatchResource(Resource):
+    """Execute several operations in one request
+
+    ---
+    post:
+      tags:
+        - api
+      summary: Execute a batch of operations.
+      description: |
+        Execute a list of operations (`create`, `write`, `submit` or `delete`) on any entity in a single HTTP
+        request. Operations are executed in order and each of them returns its own status code and response body,
+        exactly as the corresponding single-entity endpoint would. The *id* of an operation can reference the entity
+        created by a previous operation of the same batch with `$<index>` (e.g. `$0`).
+
+        When *fail_fast* is true, the operations following the first failed one are skipped and reported with a
+        `424` status code. Otherwise, all the operations are executed.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), each
+          operation requires the role of the endpoint it corresponds to.
+
+        Code example:
+
+        ```shell
+          curl -X POST -H 'Content-Type: application/json' -d '{"operations": [{"operation": "create", "entity": "scenario", "params": {"config_id": "my_config"}}, {"operation": "submit", "entity": "scenario", "id": "$0"}]}' http://localhost:5000/api/v1/batch
+        ```
+
+      requestBody:
+        content:
+          application/json:
+            schema: BatchSchema
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  results:
+                    type: array
+                    items:
+                      type: object
+                      properties:
+                        operation:
+                          type: string
+                        entity:
+                          type: string
+                        status:
+                          type: integer
+                          description: HTTP status code of the operation.
+                        response:
+                          type: object
+                          description: Response body of the operation.
+        400:
+          description: The batch is malformed or contains too many operations.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def post(self):
+        schema = BatchSchema()
+        batch = schema.load(request.json)
+        operations = batch.get("operations")
+        max_size = current_app.config["BATCH_MAX_OPERATIONS"]
+        if len(operations) > max_size:
+            raise BatchSizeExceededException(len(operations), max_size)
+
+        headers = self.__forwarded_headers()
+        results: List[Dict] = []
+        failed = False
+        for operation in operations:
+            if failed and batch.get("fail_fast"):
+                results.append(self.__result(operation, 424, {"message": "Skipped after a previous failure."}))
+                continue
+            try:
+                status, response = self.__execute(operation, results, headers)
+            except _OperationError as e:
+                status, response = e.status, {"message": e.message}
+            failed = failed or status >= 400
+            results.append(self.__result(operation, status, response))
+
+        return {"results": results}
+
+    def __execute(self, operation: Dict, results: List[Dict], headers: Dict) -> Tuple[int, Optional[Dict]]:
+        entity = operation.get("entity")
+        method, endpoint = self.__resolve_endpoint(operation.get("operation"), entity)
+
+        view_args = {}
+        if operation.get("operation") != "create":
+            view_args[_ID_ARGUMENTS[entity]] = self.__resolve_id(operation.get("id"), results)
+        params = operation.get("params")
+        # The parameters starting with an underscore are reserved by `url_for`.
+        if reserved := sorted(key for key in params if key in view_args or key.startswith("_")):
+            raise _OperationError(400, f"Parameters {', '.join(reserved)} are reserved.")
+        url = url_for(endpoint, **view_args, **params)
+
+        with current_app.test_request_context(url, method=method, json=operation.get("data"), headers=headers):
+            try:
+                response = current_app.full_dispatch_request()
+            except Exception as e:
+                self.logger.error(f"Batch operation {method} {url} failed: {e}")
+                return 500, {"message": str(e)}
+        return response.status_code, response.get_json(silent=True)
+
+    @staticmethod
+    def __resolve_endpoint(operation: str, entity: str) -> Tuple[str, str]:
+        if endpoint := _OPERATIONS[operation].get(entity):
+            return endpoint
+        raise _OperationError(400, f"Operation {operation} is not supported on {entity}.")
+
+    @staticmethod
+    def __resolve_id(entity_id: Optional[str], results: List[Dict]) -> str:
+        if not entity_id:
+            raise _OperationError(400, "Entity id is missing.")
+        if not entity_id.startswith(_REFERENCE_PREFIX):
+            return entity_id
+
+        reference = entity_id[len(_REFERENCE_PREFIX) :]
+        if not reference.isdigit() or int(reference) >= len(results):
+            raise _OperationError(400, f"Reference {entity_id} does not match a previous operation.")
+        for value in (results[int(reference)].get("response") or {}).values():
+            if isinstance(value, dict) and value.get("id"):
+                return value["id"]
+        raise _OperationError(400, f"Operation {reference} did not return an entity.")
+
+    @staticmethod
+    def __forwarded_headers() -> Dict:
+        return {key: value for key, value in request.headers.items() if key not in _NOT_FORWARDED_HEADERS}
+
+    @staticmethod
+    def __result(operation: Dict, status: int, response: Optional[Dict]) -> Dict:
+        return {
+            "operation": operation.get("operation"),
+            "entity": operation.get("entity"),
+            "status": status,
+            "response": response,
+        }
@@ -18,6 +18,7 @@ from taipy.config.common.frequency import Frequency
 from taipy.core import Cycle
 from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
 from taipy.core.exceptions.exceptions import NonExistingCycle
+from taipy.core.notification import EventOperation, _publish_event
 
 from ...commons.to_from_model import _to_model
 from ..middlewares._middleware import _middleware
@@ -403,6 +404,7 @@ class CycleList(Resource):
 
         cycle = self.__create_cycle_from_schema(schema.load(request.json))
         manager._set(cycle)
+        _publish_event(manager._EVENT_ENTITY_TYPE, cycle.id, EventOperation.CREATION, None)
 
         return {
             "message": "Cycle was created.",
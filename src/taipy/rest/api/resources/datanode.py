@@ -9,11 +9,13 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import List
+import contextvars
+import json
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
 
-import numpy as np
-import pandas as pd
-from flask import request
+from flask import Response, request
 from flask_restful import Resource
 
 from taipy.config.config import Config
@@ -21,8 +23,12 @@ from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.operator import Operator
 from taipy.core.exceptions.exceptions import NonExistingDataNode, NonExistingDataNodeConfig
 
+from ...commons.encoder import _CustomEncoder
+from ...commons.read_pool import _to_serializable
+from ...commons.timing import annotate, phase
 from ...commons.to_from_model import _to_model
-from ..exceptions.exceptions import ConfigIdMissingException
+from ...extensions import data_node_io, data_node_reads, metrics, profiler
+from ..exceptions.exceptions import ConfigIdMissingException, DataNodeIOBusyException
 from ..middlewares._middleware import _middleware
 from ..schemas import (
     CSVDataNodeConfigSchema,
@@ -61,6 +67,63 @@ def _get_or_raise(data_node_id: str) -> None:
     return data_node
 
 
+def _make_operators(schema: DataNodeFilterSchema) -> List:
+    return [
+        (
+            x.get("key"),
+            x.get("value"),
+            Operator(getattr(Operator, x.get("operator", "").upper())),
+        )
+        for x in schema.get("operators")
+    ]
+
+
+def _count_rows(data: Any) -> Optional[int]:
+    return None if isinstance(data, (str, bytes, dict)) or not hasattr(data, "__len__") else len(data)
+
+
+def _submit_io(function: Callable, *args) -> Future:
+    """Run a blocking data node I/O on the bounded I/O pool, or reject it when the pool is saturated."""
+    # The function runs in the context of the request, which holds its timing, and is profiled as its endpoint.
+    if (future := data_node_io.submit(contextvars.copy_context().run, profiler.attributed(function), *args)) is None:
+        raise DataNodeIOBusyException(data_node_io.retry_after)
+    return future
+
+
+def _read(datanode_id: str, filters: Optional[Dict]) -> bytes:
+    """Return the JSON response body of the data read, serialized by the thread or the process reading it."""
+    started = time.perf_counter()
+    schema = DataNodeFilterSchema()
+    with phase("lookup"):
+        data_node = _get_or_raise(datanode_id)
+    operators = _make_operators(schema.load(filters)) if filters else []
+    annotate(storage_type=data_node.storage_type(), operators=operators)
+    if data_node_reads.accepts(data_node):
+        with phase("process"):
+            body = data_node_reads.read(data_node, operators)
+    else:
+        with phase("io"):
+            data = data_node.filter(operators)
+        annotate(rows=_count_rows(data))
+        with phase("transform"):
+            data = _to_serializable(data)
+        with phase("serialize"):
+            body = json.dumps({"data": data}, cls=_CustomEncoder).encode()
+    metrics.observe_data_node_io("read", data_node.storage_type(), started, len(body))
+    return body
+
+
+def _write(datanode_id: str, data: Any, size: Optional[int] = None) -> Dict:
+    started = time.perf_counter()
+    with phase("lookup"):
+        data_node = _get_or_raise(datanode_id)
+    annotate(storage_type=data_node.storage_type(), rows=_count_rows(data))
+    with phase("io"):
+        data_node.write(data)
+    metrics.observe_data_node_io("write", data_node.storage_type(), started, size)
+    return {"message": f"Data node {datanode_id} was successfully written."}
+
+
 class DataNodeResource(Resource):
     """Single object resource
 
@@ -499,6 +562,15 @@ class DataNodeReader(Resource):
         Returns the data read from the data node identified by *datanode_id*. If the data node does not exist,
         a 404 error is returned.
 
+        When served by the WSGI application, the data is read on a bounded pool of `DATANODE_IO_MAX_WORKERS`
+        threads, and at most `DATANODE_IO_MAX_QUEUE` reads and writes wait for a free thread. Beyond that, a 503 error
+        is returned with a `Retry-After` header. By default, the pool has one thread less than the request threads of
+        a server worker and no read or write waits, so that a request thread is always free for the other requests.
+        The ASGI application queues the reads and writes on its own pool of `ASGI_MAX_WORKERS` threads instead.
+
+        When `DATANODE_READ_PROCESSES` is set, the file based data nodes of at least `DATANODE_READ_PROCESS_MIN_SIZE`
+        bytes and the SQL data nodes are read, filtered and serialized by a pool of worker processes instead.
+
         !!! Example
 
             === "Curl"
@@ -574,33 +646,18 @@ class DataNodeReader(Resource):
                     description: The data read from the data node.
         404:
           description: No data node has the *datanode_id* identifier.
+        503:
+          description: Too many data node reads and writes are in progress. The request can be retried after the
+            number of seconds of the `Retry-After` header.
     """
 
     def __init__(self, **kwargs):
         self.logger = kwargs.get("logger")
 
-    def __make_operators(self, schema: DataNodeFilterSchema) -> List:
-        return [
-            (
-                x.get("key"),
-                x.get("value"),
-                Operator(getattr(Operator, x.get("operator", "").upper())),
-            )
-            for x in schema.get("operators")
-        ]
-
     @_middleware
     def get(self, datanode_id):
-        schema = DataNodeFilterSchema()
-        data = request.get_json(silent=True)
-        data_node = _get_or_raise(datanode_id)
-        operators = self.__make_operators(schema.load(data)) if data else []
-        data = data_node.filter(operators)
-        if isinstance(data, pd.DataFrame):
-            data = data.to_dict(orient="records")
-        elif isinstance(data, np.ndarray):
-            data = list(data)
-        return {"data": data}
+        body = _submit_io(_read, datanode_id, request.get_json(silent=True)).result()
+        return Response(body, mimetype="application/json")
 
 
 class DataNodeWriter(Resource):
@@ -614,6 +671,13 @@ class DataNodeWriter(Resource):
       description: |
         Write data from request body into a data node by *datanode_id*. If the data node does not exist, a 404 error is returned.
 
+        The data is written on the same bounded pool of threads as the reads. When the pool is saturated, a 503 error
+        is returned with a `Retry-After` header.
+
+        The request body can be compressed, with a `Content-Encoding: gzip` or `Content-Encoding: zstd` header. It is
+        decompressed while it is read, and a 413 error is returned if it exceeds `REQUEST_DECOMPRESSED_MAX_SIZE` bytes
+        once decompressed.
+
         !!! Note
           When the authorization feature is activated (available in the **Enterprise** edition only), this endpoint requires `TAIPY_EDITOR` role.
 
@@ -645,6 +709,11 @@ class DataNodeWriter(Resource):
                     description: Status message.
         404:
           description: No data node has the *datanode_id* identifier.
+        413:
+          description: The decompressed request body is too large.
+        503:
+          description: Too many data node reads and writes are in progress. The request can be retried after the
+            number of seconds of the `Retry-After` header.
     """
 
     def __init__(self, **kwargs):
@@ -652,7 +721,6 @@ class DataNodeWriter(Resource):
 
     @_middleware
     def put(self, datanode_id):
-        data = request.json
-        data_node = _get_or_raise(datanode_id)
-        data_node.write(data)
-        return {"message": f"Data node {datanode_id} was successfully written."}
+        with phase("decode"):
+            data = request.json
+        return _submit_io(_write, datanode_id, data, len(request.get_data())).result()
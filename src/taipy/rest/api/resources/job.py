@@ -9,21 +9,34 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
+import time
 import uuid
-from typing import Optional
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
-from flask import request
+from flask import Response, current_app, request
 from flask_restful import Resource
+from marshmallow import ValidationError
+from werkzeug.datastructures import MultiDict
 
 from taipy.config.config import Config
 from taipy.core import Job, JobId
-from taipy.core.exceptions.exceptions import NonExistingJob, NonExistingTaskConfig
+from taipy.core.exceptions.exceptions import JobNotDeletedException, NonExistingJob, NonExistingTaskConfig
 from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.status import Status
+from taipy.core.notification import EventOperation, _publish_event
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
-from ..exceptions.exceptions import ConfigIdMissingException
+from ...extensions import job_counters, job_events, job_pruner, streams
+from ..exceptions.exceptions import (
+    BatchSizeExceededException,
+    ConfigIdMissingException,
+    JobIdMissingException,
+    JobNotCancelledException,
+    StreamsBusyException,
+)
 from ..middlewares._middleware import _middleware
-from ..schemas import JobSchema
+from ..schemas import JobSchema, JobSelectionSchema
 
 
 def _get_or_raise(job_id: str):
@@ -34,6 +47,152 @@ def _get_or_raise(job_id: str):
     return job
 
 
+def _get_list_arg(name: str, args: Optional[MultiDict] = None) -> List[str]:
+    args = request.args if args is None else args
+    return list(dict.fromkeys(value for arg in args.getlist(name) for value in arg.split(",") if value))
+
+
+_FINISHED_STATUSES = {
+    status.name for status in (Status.COMPLETED, Status.SKIPPED, Status.FAILED, Status.CANCELED, Status.ABANDONED)
+}
+
+
+_STACKTRACE_MODES = ("none", "truncated", "full")
+
+
+def _dump_jobs(jobs: List[Job], args: Optional[MultiDict] = None, config: Optional[Mapping] = None) -> List[Dict]:
+    """Dump the jobs of a list response, without their stacktrace unless the *stacktrace* argument requests it."""
+    args = request.args if args is None else args
+    config = current_app.config if config is None else config
+    mode = args.get("stacktrace", "none")
+    if mode not in _STACKTRACE_MODES:
+        raise ValidationError({"stacktrace": [f"Must be one of: {', '.join(_STACKTRACE_MODES)}."]})
+    if mode == "none":
+        return JobSchema(many=True, exclude=("stacktrace",)).dump(jobs)
+
+    dumped = JobSchema(many=True).dump(jobs)
+    if mode == "truncated":
+        max_length = config["JOB_STACKTRACE_MAX_LENGTH"]
+        for job in dumped:
+            job["stacktrace"] = [
+                trace if len(trace) <= max_length else f"...{trace[-max_length:]}" for trace in job["stacktrace"] or []
+            ]
+    return dumped
+
+
+def _get_timeout(args: Optional[MultiDict] = None, config: Optional[Mapping] = None) -> float:
+    args = request.args if args is None else args
+    max_timeout = (current_app.config if config is None else config)["JOB_WAIT_MAX_TIMEOUT"]
+    timeout = args.get("timeout", type=float)
+    return max_timeout if timeout is None else min(max(timeout, 0.0), max_timeout)
+
+
+def _get_wait_mode(args: Optional[MultiDict] = None) -> str:
+    mode = (request.args if args is None else args).get("mode", "any")
+    if mode not in ("any", "all"):
+        raise ValidationError({"mode": ["Must be one of: any, all."]})
+    return mode
+
+
+class _JobWait:
+    """Jobs waited for until any or all of them are finished.
+
+    Only the job events relayed by the event broker are watched while waiting, the repository is read once when the
+    wait starts and once when it ends.
+    """
+
+    def __init__(self, job_ids: List[str], wait_all: bool):
+        self.last_id = job_events.last_id
+        self.jobs = [_get_or_raise(job_id) for job_id in job_ids]
+        self.pending = {job.id for job in self.jobs if not job.is_finished()}
+        self.wait_all = wait_all
+
+    def is_done(self) -> bool:
+        return not self.pending if self.wait_all else len(self.pending) < len(self.jobs)
+
+    def update(self, events: List[Dict]):
+        for event in events:
+            self.last_id = event["id"]
+            if event["entity_id"] in self.pending and (
+                event["operation"] == "DELETION" or event["status"] in _FINISHED_STATUSES
+            ):
+                self.pending.discard(event["entity_id"])
+
+    def reload(self) -> List[Job]:
+        manager = _JobManagerFactory._build_manager()
+        return [manager._get(job.id) or job for job in self.jobs]
+
+
+def _wait_for_jobs(job_ids: List[str], wait_all: bool, timeout: float) -> List[Job]:
+    """Wait until any or all the jobs are finished, at most *timeout* seconds, and return the jobs reloaded."""
+    if (release := streams.acquire()) is None:
+        raise StreamsBusyException(streams.retry_after)
+    try:
+        wait = _JobWait(job_ids, wait_all)
+        deadline = time.monotonic() + timeout
+        while not wait.is_done() and (remaining := deadline - time.monotonic()) > 0:
+            wait.update(job_events.wait(wait.last_id, remaining))
+        return wait.reload()
+    finally:
+        release()
+
+
+def _select_jobs(selection: Dict) -> Tuple[List[Job], List[str]]:
+    """Return the jobs matching the selection criteria and the selected job ids that do not exist.
+
+    The jobs are either the ones of *job_ids* or all the jobs, and they are filtered in a single pass. The jobs were
+    just loaded: they are filtered on their attributes rather than on their properties, which reload each job.
+    """
+    manager = _JobManagerFactory._build_manager()
+    missing_ids: List[str] = []
+    if "job_ids" in selection:
+        job_ids = list(dict.fromkeys(selection["job_ids"]))
+        max_size = current_app.config["BULK_MAX_SIZE"]
+        if len(job_ids) > max_size:
+            raise BatchSizeExceededException(len(job_ids), max_size)
+        jobs = []
+        for job_id in job_ids:
+            if job := manager._get(job_id):
+                jobs.append(job)
+            else:
+                missing_ids.append(job_id)
+    else:
+        jobs = manager._get_all()
+
+    statuses = set(selection.get("status", []))
+    task_config_ids = set(selection.get("task_config_id", []))
+    submission_ids = set(selection.get("submission_id", []))
+    older_than = selection.get("older_than")
+    if older_than and older_than.tzinfo:
+        older_than = older_than.astimezone().replace(tzinfo=None)
+
+    def _is_selected(job: Job) -> bool:
+        return (
+            (not statuses or job._status.name in statuses)
+            and (not task_config_ids or job._task.config_id in task_config_ids)
+            and (not submission_ids or job._submit_id in submission_ids)
+            and (not older_than or job._creation_date < older_than)
+        )
+
+    return [job for job in jobs if _is_selected(job)], missing_ids
+
+
+def _apply_to_jobs(action: Callable[[Job], str], selection: Dict, logger=None) -> List[Dict]:
+    """Apply the action to the jobs of the loaded *selection* and return one outcome per job."""
+    jobs, missing_ids = _select_jobs(selection)
+    results = [{"id": job_id, "status": 404, "message": NonExistingJob(job_id).message} for job_id in missing_ids]
+    for job in jobs:
+        try:
+            results.append({"id": job.id, "status": 200, "message": action(job)})
+        except (JobNotDeletedException, JobNotCancelledException) as e:
+            results.append({"id": job.id, "status": 409, "message": e.message})
+        except Exception as e:
+            if logger:
+                logger.error(f"Operation on {job.id} failed: {e}")
+            results.append({"id": job.id, "status": 500, "message": getattr(e, "message", str(e))})
+    return results
+
+
 class JobResource(Resource):
     """Single object resource
 
@@ -134,7 +293,7 @@ class JobList(Resource):
         - api
       summary: Get all jobs.
       description: |
-        Return an array of all jobs.
+        Return an array of all jobs. The stacktraces of the jobs are omitted unless requested with *stacktrace*.
 
         !!! Note
           When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
@@ -146,6 +305,16 @@ class JobList(Resource):
           curl -X GET http://localhost:5000/api/v1/jobs
         ```
 
+      parameters:
+        - in: query
+          name: stacktrace
+          schema:
+            type: string
+            enum: [none, truncated, full]
+          description: |
+            Omit the stacktraces of the jobs (`none`, the default), keep the end of each of them (`truncated`) or
+            return them entirely (`full`). The full stacktrace of a job is also available at
+            `/jobs/<job_id>/stacktrace`.
       responses:
         200:
           content:
@@ -192,6 +361,52 @@ class JobList(Resource):
                     type: string
                     description: Status message.
                   job: JobSchema
+    delete:
+      tags:
+        - api
+      summary: Delete several jobs.
+      description: |
+        Delete the jobs identified by *job_ids* or matching the given criteria: *status*, *task_config_id*,
+        *submission_id* and creation before *older_than*. When both ids and criteria are provided, only the given
+        jobs matching the criteria are deleted. Jobs that are not finished are only deleted if *force* is true.
+
+        The response holds one result per job: `200` if the job was deleted, `404` if it does not exist, `409` if it
+        is not finished.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_EDITOR` role.
+
+        Code example:
+
+        ```shell
+          curl -X DELETE -H 'Content-Type: application/json' -d '{"status": ["FAILED"], "older_than": "2024-01-01T00:00:00"}' http://localhost:5000/api/v1/jobs
+        ```
+
+      requestBody:
+        content:
+          application/json:
+            schema: JobSelectionSchema
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  results:
+                    type: array
+                    items:
+                      type: object
+                      properties:
+                        id:
+                          type: string
+                        status:
+                          type: integer
+                        message:
+                          type: string
+        400:
+          description: No selection criterion is provided or too many *job_ids* are given.
     """
 
     def __init__(self, **kwargs):
@@ -205,10 +420,9 @@ class JobList(Resource):
 
     @_middleware
     def get(self):
-        schema = JobSchema(many=True)
         manager = _JobManagerFactory._build_manager()
         jobs = manager._get_all()
-        return schema.dump(jobs)
+        return _dump_jobs(jobs)
 
     @_middleware
     def post(self):
@@ -222,11 +436,24 @@ class JobList(Resource):
         schema = JobSchema()
         job = self.__create_job_from_schema(task_config_id)
         manager._set(job)
+        _publish_event(manager._EVENT_ENTITY_TYPE, job.id, EventOperation.CREATION, None)
         return {
             "message": "Job was created.",
             "job": schema.dump(job),
         }, 201
 
+    @_middleware
+    def delete(self):
+        manager = _JobManagerFactory._build_manager()
+        selection = JobSelectionSchema().load(request.json or {})
+        force = selection["force"]
+
+        def _delete(job: Job) -> str:
+            manager._delete(job, force)
+            return f"Job {job.id} was deleted."
+
+        return {"results": _apply_to_jobs(_delete, selection, self.logger)}
+
     def __create_job_from_schema(self, task_config_id: str) -> Optional[Job]:
         task_manager = _TaskManagerFactory._build_manager()
         task = task_manager._bulk_get_or_create([self.fetch_config(task_config_id)])[0]
@@ -235,6 +462,61 @@ class JobList(Resource):
         )
 
 
+class JobStacktrace(Resource):
+    """Stacktrace of a job
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Get the stacktrace of a job.
+      description: |
+        Return the full stacktrace of a job as plain text, the stacktraces of its successive failures being separated
+        by blank lines. A part of the text can be requested with a `Range` header. If the job does not exist, a 404
+        error is returned.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET -H 'Range: bytes=0-4095' http://localhost:5000/api/v1/jobs/JOB_my_task_config_75750ed8-4e09-4e00-958d-e352ee426cc9/stacktrace
+        ```
+
+      parameters:
+        - in: path
+          name: job_id
+          schema:
+            type: string
+          description: The identifier of the job.
+      responses:
+        200:
+          content:
+            text/plain:
+              schema:
+                type: string
+        206:
+          description: The requested range of the stacktrace.
+        404:
+          description: No job has the *job_id* identifier.
+        416:
+          description: The requested range is not satisfiable.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self, job_id):
+        job = _get_or_raise(job_id)
+        stacktrace = "\n\n".join(job.stacktrace).encode()
+        response = Response(stacktrace, mimetype="text/plain")
+        response.add_etag()
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(stacktrace))
+
+
 class JobExecutor(Resource):
     """Cancel a job
 
@@ -285,3 +567,485 @@ class JobExecutor(Resource):
         job = _get_or_raise(job_id)
         manager._cancel(job)
         return {"message": f"Job {job_id} was cancelled."}
+
+
+class JobListExecutor(Resource):
+    """Cancel several jobs
+
+    ---
+    post:
+      tags:
+        - api
+      summary: Cancel several jobs.
+      description: |
+        Cancel the jobs identified by *job_ids* or matching the given criteria: *status*, *task_config_id*,
+        *submission_id* and creation before *older_than*. When both ids and criteria are provided, only the given
+        jobs matching the criteria are cancelled.
+
+        The response holds one result per job: `200` if the job was cancelled, `404` if it does not exist, `409` if it
+        is already finished.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_EXECUTOR` role.
+
+        Code example:
+
+        ```shell
+          curl -X POST -H 'Content-Type: application/json' -d '{"submission_id": ["SUBMISSION_75750ed8-4e09-4e00-958d-e352ee426cc9"]}' http://localhost:5000/api/v1/jobs/cancel
+        ```
+
+      requestBody:
+        content:
+          application/json:
+            schema: JobSelectionSchema
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  results:
+                    type: array
+                    items:
+                      type: object
+                      properties:
+                        id:
+                          type: string
+                        status:
+                          type: integer
+                        message:
+                          type: string
+        400:
+          description: No selection criterion is provided or too many *job_ids* are given.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def post(self):
+        manager = _JobManagerFactory._build_manager()
+
+        def _cancel(job: Job) -> str:
+            if job.is_finished() and not job.is_canceled():
+                raise JobNotCancelledException(job.id)
+            manager._cancel(job)
+            return f"Job {job.id} was cancelled."
+
+        return {"results": _apply_to_jobs(_cancel, JobSelectionSchema().load(request.json or {}), self.logger)}
+
+
+class JobEvents(Resource):
+    """Stream of job events
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Stream job events.
+      description: |
+        Open a Server-Sent Events stream of the job creations, status changes and deletions. Each event holds the
+        job id, its new status, its submission id and the ids of the scenarios it belongs to. Events can be filtered
+        by *submission_id*, *scenario_id* and *status*. Each filter accepts several comma-separated values.
+
+        Every event has an id. A client reconnecting with the `Last-Event-ID` header (or the *last_event_id* query
+        parameter) receives the events it missed, as long as they are still held by the server buffer. Without it,
+        only the new events are streamed. A comment line is sent regularly to keep the connection alive.
+
+        Served by the WSGI application, the request holds a request thread: at most `WSGI_MAX_STREAMS` job event
+        streams, job waits and WebSocket connections are served at once, and a 503 error is returned with a
+        `Retry-After` header beyond that. Serve the REST APIs with the ASGI application to follow many jobs at once.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -N http://localhost:5000/api/v1/jobs/events?status=COMPLETED,FAILED
+        ```
+
+      parameters:
+        - in: query
+          name: submission_id
+          schema:
+            type: string
+          description: The identifiers of the submissions to follow.
+        - in: query
+          name: scenario_id
+          schema:
+            type: string
+          description: The identifiers of the scenarios to follow.
+        - in: query
+          name: status
+          schema:
+            type: string
+          description: The job statuses to follow.
+        - in: query
+          name: last_event_id
+          schema:
+            type: integer
+          description: The id of the last event received.
+      responses:
+        200:
+          content:
+            text/event-stream:
+              schema:
+                type: string
+        503:
+          description: Too many job event streams, job waits and WebSocket connections are served.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self):
+        filters = {
+            "submission_id": set(_get_list_arg("submission_id")),
+            "scenario_ids": set(_get_list_arg("scenario_id")),
+            "status": {status.upper() for status in _get_list_arg("status")},
+        }
+        last_event_id = request.headers.get("Last-Event-ID", request.args.get("last_event_id"))
+        last_id = job_events.last_id
+        if last_event_id and last_event_id.isdigit():
+            # An id beyond the last event, sent by a client of a previous server process, would hide the new events.
+            last_id = min(int(last_event_id), last_id)
+        keepalive = current_app.config["JOB_EVENTS_KEEPALIVE"]
+        if (release := streams.acquire()) is None:
+            raise StreamsBusyException(streams.retry_after)
+
+        response = Response(self.__stream(last_id, filters, keepalive), mimetype="text/event-stream")
+        response.call_on_close(release)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    def __stream(last_id: int, filters: Dict[str, Set[str]], keepalive: float) -> Iterator[str]:
+        yield "retry: 3000\n\n"
+        while True:
+            events = job_events.wait(last_id, keepalive)
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                last_id = event["id"]
+                if JobEvents.__is_matching(event, filters):
+                    yield f"id: {event['id']}\nevent: job\ndata: {json.dumps(event)}\n\n"
+
+    @staticmethod
+    def __is_matching(event: Dict, filters: Dict[str, Set[str]]) -> bool:
+        for key, values in filters.items():
+            if not values:
+                continue
+            event_values = event.get(key)
+            event_values = set(event_values) if isinstance(event_values, list) else {event_values}
+            if not values & event_values:
+                return False
+        return True
+
+
+class JobWaiter(Resource):
+    """Wait for a job
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Wait for a job to finish.
+      description: |
+        Wait until the job identified by *job_id* is finished (completed, skipped, failed, canceled or abandoned),
+        or until *timeout* seconds have elapsed, then return the job. If the job does not exist, a 404 error is
+        returned.
+
+        Served by the WSGI application, the request holds a request thread: at most `WSGI_MAX_STREAMS` job event
+        streams, job waits and WebSocket connections are served at once, and a 503 error is returned with a
+        `Retry-After` header beyond that. Serve the REST APIs with the ASGI application to follow many jobs at once.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET http://localhost:5000/api/v1/jobs/JOB_my_task_config_75750ed8-4e09-4e00-958d-e352ee426cc9/wait?timeout=30
+        ```
+
+      parameters:
+        - in: path
+          name: job_id
+          schema:
+            type: string
+          description: The identifier of the job.
+        - in: query
+          name: timeout
+          schema:
+            type: number
+          description: The maximum number of seconds to wait, capped by the server.
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  job: JobSchema
+                  is_finished:
+                    type: boolean
+                    description: False if the timeout expired before the job was finished.
+        404:
+          description: No job has the *job_id* identifier.
+        503:
+          description: Too many job event streams, job waits and WebSocket connections are served.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self, job_id):
+        schema = JobSchema()
+        job = _wait_for_jobs([job_id], True, _get_timeout())[0]
+        return {"job": schema.dump(job), "is_finished": job.is_finished()}
+
+
+class JobListWaiter(Resource):
+    """Wait for several jobs
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Wait for several jobs to finish.
+      description: |
+        Wait until any (*mode* `any`, the default) or all (*mode* `all`) of the jobs identified by *job_id* are
+        finished, or until *timeout* seconds have elapsed, then return the jobs. If a job does not exist, a 404 error
+        is returned.
+
+        Served by the WSGI application, the request holds a request thread: at most `WSGI_MAX_STREAMS` job event
+        streams, job waits and WebSocket connections are served at once, and a 503 error is returned with a
+        `Retry-After` header beyond that. Serve the REST APIs with the ASGI application to follow many jobs at once.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET "http://localhost:5000/api/v1/jobs/wait?job_id=JOB_1,JOB_2&mode=all&timeout=30"
+        ```
+
+      parameters:
+        - in: query
+          name: job_id
+          schema:
+            type: string
+          description: The comma-separated identifiers of the jobs.
+        - in: query
+          name: mode
+          schema:
+            type: string
+            enum: [any, all]
+          description: Wait for any or all the jobs.
+        - in: query
+          name: timeout
+          schema:
+            type: number
+          description: The maximum number of seconds to wait, capped by the server.
+        - in: query
+          name: stacktrace
+          schema:
+            type: string
+            enum: [none, truncated, full]
+          description: |
+            Omit the stacktraces of the jobs (`none`, the default), keep the end of each of them (`truncated`) or
+            return them entirely (`full`). The full stacktrace of a job is also available at
+            `/jobs/<job_id>/stacktrace`.
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  jobs:
+                    type: array
+                    items:
+                      $ref: '#/components/schemas/JobSchema'
+                  is_finished:
+                    type: boolean
+                    description: False if the timeout expired before the wait condition was met.
+        400:
+          description: No *job_id* is given or the *mode* is invalid.
+        404:
+          description: One of the jobs does not exist.
+        503:
+          description: Too many job event streams, job waits and WebSocket connections are served.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self):
+        job_ids = _get_list_arg("job_id")
+        if not job_ids:
+            raise JobIdMissingException
+        mode = _get_wait_mode()
+
+        jobs = _wait_for_jobs(job_ids, mode == "all", _get_timeout())
+        finished = [job.is_finished() for job in jobs]
+        return {"jobs": _dump_jobs(jobs), "is_finished": all(finished) if mode == "all" else any(finished)}
+
+
+class JobStatistics(Resource):
+    """Job counts
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Count the jobs.
+      description: |
+        Return the number of jobs by status. The counts by status can also be grouped by task configuration
+        (`task_config`) and by submission (`submission`) with the *group_by* parameter.
+
+        The counts are maintained by the server as jobs are created, change status and are deleted, so this
+        endpoint does not read the jobs and can be called frequently.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET http://localhost:5000/api/v1/jobs/stats?group_by=task_config
+        ```
+
+      parameters:
+        - in: query
+          name: group_by
+          schema:
+            type: string
+            enum: [task_config, submission]
+          description: The comma-separated groups of the counts. Defaults to `task_config`.
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  total:
+                    type: integer
+                  by_status:
+                    type: object
+                    additionalProperties:
+                      type: integer
+                  by_task_config:
+                    type: object
+                    additionalProperties:
+                      type: object
+                  by_submission:
+                    type: object
+                    additionalProperties:
+                      type: object
+        400:
+          description: A *group_by* value is invalid.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self):
+        group_by = _get_list_arg("group_by") or ["task_config"]
+        if invalid := [group for group in group_by if group not in ("task_config", "submission")]:
+            raise ValidationError({"group_by": [f"Invalid groups: {', '.join(invalid)}."]})
+        return job_counters.get(group_by)
+
+
+class JobRetention(Resource):
+    """Retention policy of the jobs
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Get the job retention policy.
+      description: |
+        Return the retention policy of the finished jobs, configured with the `JOB_RETENTION` setting of the
+        application, and the metrics of the jobs pruned since the service started.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET http://localhost:5000/api/v1/jobs/retention
+        ```
+
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  policy:
+                    type: object
+                  metrics:
+                    type: object
+    post:
+      tags:
+        - api
+      summary: Prune the jobs.
+      description: |
+        Immediately delete, or archive, the finished jobs exceeding the retention policy, instead of waiting for the
+        next periodic pruning.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the endpoint
+          requires `TAIPY_EDITOR` role.
+
+        Code example:
+
+        ```shell
+          curl -X POST http://localhost:5000/api/v1/jobs/retention
+        ```
+
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  message:
+                    type: string
+                    description: Status message.
+                  pruned:
+                    type: object
+                    description: Number of jobs pruned by status.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self):
+        return {"policy": job_pruner.policy, "metrics": job_pruner.metrics}
+
+    @_middleware
+    def post(self):
+        pruned = job_pruner.prune()
+        return {"message": f"{sum(pruned.values())} jobs were pruned.", "pruned": pruned}
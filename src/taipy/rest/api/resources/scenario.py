@@ -9,17 +9,21 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from flask import request
+from flask import current_app, request
 from flask_restful import Resource
+from marshmallow import ValidationError
 
 from taipy.config.config import Config
-from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingScenarioConfig
+from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
+from taipy.core.exceptions.exceptions import NonExistingCycle, NonExistingScenario, NonExistingScenarioConfig
+from taipy.core.notification import EventOperation, _publish_event
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 
+from ...commons.submission import _submission_response, _submit_all
 from ...commons.to_from_model import _to_model
-from ..exceptions.exceptions import ConfigIdMissingException
+from ..exceptions.exceptions import BatchSizeExceededException, ConfigIdMissingException
 from ..middlewares._middleware import _middleware
-from ..schemas import ScenarioResponseSchema
+from ..schemas import ScenarioBulkSchema, ScenarioResponseSchema, ScenarioSubmissionSchema
 
 
 def _get_or_raise(scenario_id: str):
@@ -446,6 +450,130 @@ class ScenarioList(Resource):
         }, 201
 
 
+class ScenarioBulkCreator(Resource):
+    """Bulk creation
+
+    ---
+    post:
+      tags:
+        - api
+      summary: Create several scenarios.
+      description: |
+        Creates several scenarios from the same *config_id*. The configuration is looked up once for all the
+        scenarios. The request body either gives the number of scenarios to create (*count*) or the list of
+        scenarios to create (*scenarios*), each of them with an optional *name*, *creation_date*, *properties* and
+        *tags*. If the config does not exist, a 404 error is returned.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), this endpoint
+          requires `TAIPY_EDITOR` role.
+
+        Code example:
+
+        ```shell
+          curl -X POST -H 'Content-Type: application/json' -d '{"scenarios": [{"name": "january", "creation_date": "2022-01-01T00:00:00", "properties": {"region": "EU"}, "tags": ["baseline"]}]}' http://localhost:5000/api/v1/scenarios/bulk?config_id=my_scenario_config
+        ```
+
+      parameters:
+        - in: query
+          name: config_id
+          schema:
+            type: string
+          description: The identifier of the scenario configuration.
+      requestBody:
+        content:
+          application/json:
+            schema: ScenarioBulkSchema
+      responses:
+        201:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  message:
+                    type: string
+                    description: Status message.
+                  scenarios:
+                    type: array
+                    items:
+                      $ref: '#/components/schemas/ScenarioSchema'
+        400:
+          description: The request body is malformed or contains too many scenarios.
+        404:
+          description: No scenario configuration has the *config_id* identifier.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    def fetch_config(self, config_id):
+        config = Config.scenarios.get(config_id)
+        if not config:
+            raise NonExistingScenarioConfig(config_id)
+        return config
+
+    @_middleware
+    def post(self):
+        config_id = request.args.get("config_id")
+        if not config_id:
+            raise ConfigIdMissingException
+
+        data = ScenarioBulkSchema().load(request.json)
+        # The schema ensures that either scenarios or a positive count is given. The size is checked first, so
+        # that a large count is rejected before anything is allocated.
+        size = len(data["scenarios"]) if data.get("scenarios") else data["count"]
+        max_size = current_app.config["BULK_MAX_SIZE"]
+        if size > max_size:
+            raise BatchSizeExceededException(size, max_size)
+        items = data.get("scenarios") or [{}] * size
+
+        config = self.fetch_config(config_id)
+        manager = _ScenarioManagerFactory._build_manager()
+        self.__check_tags(manager, config, items)
+        response_schema = ScenarioResponseSchema(many=True)
+
+        scenarios = [self.__create(manager, config, item) for item in items]
+
+        return {
+            "message": f"{len(scenarios)} scenarios were created.",
+            "scenarios": response_schema.dump([_to_model(REPOSITORY, scenario) for scenario in scenarios]),
+        }, 201
+
+    @staticmethod
+    def __check_tags(manager, config, items):
+        """Check the tags of all the scenarios against the configuration, before any of them is created."""
+        if not (authorized := config.properties.get(manager._AUTHORIZED_TAGS_KEY)):
+            return
+        errors = {}
+        for i, item in enumerate(items):
+            if unauthorized := [tag for tag in item.get("tags", []) if tag not in authorized]:
+                errors[i] = {"tags": [f"Tags not authorized by the scenario configuration: {', '.join(unauthorized)}."]}
+        if errors:
+            raise ValidationError({"scenarios": errors})
+
+    @staticmethod
+    def __create(manager, config, item):
+        scenario = manager._create(config, item.get("creation_date"), item.get("name"))
+        properties, tags = item.get("properties"), item.get("tags")
+        if not properties and not tags:
+            return scenario
+
+        # The properties and the tags are written at once.
+        scenario._properties.data.update(properties or {})
+        for tag in tags or []:
+            # A tag is held by a single scenario of a cycle.
+            if scenario._cycle and (tagged := manager._get_by_tag(scenario._cycle, tag)):
+                manager._untag(tagged, tag)
+            scenario._tags.add(tag)
+        manager._set(scenario)
+        if properties:
+            _publish_event(manager._EVENT_ENTITY_TYPE, scenario.id, EventOperation.UPDATE, "properties")
+        if tags:
+            _publish_event(manager._EVENT_ENTITY_TYPE, scenario.id, EventOperation.UPDATE, "tags")
+        return scenario
+
+
 class ScenarioExecutor(Resource):
     """Execute a scenario
 
@@ -456,6 +584,10 @@ class ScenarioExecutor(Resource):
       description: |
         Executes a scenario by *scenario_id*. If the scenario does not exist, a 404 error is returned.
 
+        The request returns as soon as the jobs are created, without waiting for their execution. The `Location`
+        header of the response points to the submission status resource, which can be polled to follow the
+        execution.
+
         !!! Example
 
             === "Curl"
@@ -470,7 +602,9 @@ class ScenarioExecutor(Resource):
 
                 Here is the output message example:
                 ```
-                {"message": "Executed scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c."}
+                {"message": "Scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c was submitted.",
+                "submission_id": "SUBMISSION_4d0e4f2c-2b3c-4f14-9aa5-f2f3d1c5e2a1",
+                "job_ids": ["JOB_my_task_config_75750ed8-4e09-4e00-958d-e352ee426cc9"]}
                 ```
 
             === "Python"
@@ -488,7 +622,9 @@ class ScenarioExecutor(Resource):
                 Here is the output example:
                 ```
                 <Response [202]>
-                {"message": "Executed scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c."}
+                {"message": "Scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c was submitted.",
+                "submission_id": "SUBMISSION_4d0e4f2c-2b3c-4f14-9aa5-f2f3d1c5e2a1",
+                "job_ids": ["JOB_my_task_config_75750ed8-4e09-4e00-958d-e352ee426cc9"]}
                 ```
 
         !!! Note
@@ -503,6 +639,11 @@ class ScenarioExecutor(Resource):
           description: The identifier of the scenario to submit.
       responses:
         202:
+          headers:
+            Location:
+              description: URL of the submission status resource.
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -511,7 +652,14 @@ class ScenarioExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  scenario: ScenarioSchema
+                  submission_id:
+                    type: string
+                    description: Identifier of the submission.
+                  job_ids:
+                    type: array
+                    items:
+                      type: string
+                    description: Identifiers of the jobs created by the submission.
         404:
           description: No scenario has the *scenario_id* identifier.
     """
@@ -523,5 +671,93 @@ class ScenarioExecutor(Resource):
     def post(self, scenario_id):
         _get_or_raise(scenario_id)
         manager = _ScenarioManagerFactory._build_manager()
-        manager._submit(scenario_id)
-        return {"message": f"Scenario {scenario_id} was submitted."}
+        jobs = manager._submit(scenario_id, wait=False)
+        return _submission_response(f"Scenario {scenario_id} was submitted.", jobs)
+
+
+class ScenarioBulkExecutor(Resource):
+    """Execute several scenarios
+
+    ---
+    post:
+      tags:
+        - api
+      summary: Execute several scenarios.
+      description: |
+        Executes all the scenarios identified by *scenario_ids*, or all the scenarios of the cycle identified by
+        *cycle_id*. The scenarios are resolved once and their submissions are dispatched concurrently to the
+        orchestrator. The response holds one result per scenario, with the submission id and the ids of the jobs
+        created, or a `404` status if the scenario does not exist.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), this endpoint
+          requires `TAIPY_EXECUTOR` role.
+
+        Code example:
+
+        ```shell
+          curl -X POST -H 'Content-Type: application/json' -d '{"cycle_id": "CYCLE_863418_fdd1499a-8925-4540-93fd-9dbfb4f0846d"}' http://localhost:5000/api/v1/scenarios/submit
+        ```
+
+      requestBody:
+        content:
+          application/json:
+            schema: ScenarioSubmissionSchema
+      responses:
+        202:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  message:
+                    type: string
+                    description: Status message.
+                  submissions:
+                    type: array
+                    items:
+                      type: object
+                      properties:
+                        id:
+                          type: string
+                        status:
+                          type: integer
+                        submission_id:
+                          type: string
+                        job_ids:
+                          type: array
+                          items:
+                            type: string
+        404:
+          description: No cycle has the *cycle_id* identifier.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def post(self):
+        data = ScenarioSubmissionSchema().load(request.json)
+        manager = _ScenarioManagerFactory._build_manager()
+        if cycle_id := data.get("cycle_id"):
+            cycle = _CycleManagerFactory._build_manager()._get(cycle_id)
+            if cycle is None:
+                raise NonExistingCycle(cycle_id)
+            scenario_ids = [scenario.id for scenario in manager._get_all_by_cycle(cycle)]
+        else:
+            scenario_ids = list(dict.fromkeys(data.get("scenario_ids")))
+
+        max_size = current_app.config["BULK_MAX_SIZE"]
+        if len(scenario_ids) > max_size:
+            raise BatchSizeExceededException(len(scenario_ids), max_size)
+
+        submissions = _submit_all(
+            manager,
+            scenario_ids,
+            NonExistingScenario,
+            current_app.config["SUBMIT_MAX_WORKERS"],
+            self.logger,
+            force=data.get("force"),
+        )
+        submitted = sum(1 for submission in submissions if submission["status"] == 202)
+        return {"message": f"{submitted} scenarios were submitted.", "submissions": submissions}, 202
@@ -10,17 +10,18 @@
 # specific language governing permissions and limitations under the License.
 
 
-from flask import request
+from flask import current_app, request
 from flask_restful import Resource
 
 from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingSequence
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 from taipy.core.sequence._sequence_manager_factory import _SequenceManagerFactory
 
+from ...commons.submission import _submission_response, _submit_all
 from ...commons.to_from_model import _to_model
-from ..exceptions.exceptions import ScenarioIdMissingException, SequenceNameMissingException
+from ..exceptions.exceptions import BatchSizeExceededException, ScenarioIdMissingException, SequenceNameMissingException
 from ..middlewares._middleware import _middleware
-from ..schemas import SequenceResponseSchema
+from ..schemas import SequenceResponseSchema, SequenceSubmissionSchema
 
 
 def _get_or_raise(sequence_id: str):
@@ -249,6 +250,9 @@ class SequenceExecutor(Resource):
       description: |
         Execute a sequence from sequence_id. If the sequence does not exist, a 404 error is returned.
 
+        The request returns as soon as the jobs are created, without waiting for their execution. The `Location`
+        header of the response points to the submission status resource.
+
         !!! Note
           When the authorization feature is activated (available in the **Enterprise** edition only), This endpoint
           requires _TAIPY_EXECUTOR_ role.
@@ -265,7 +269,12 @@ class SequenceExecutor(Resource):
           schema:
             type: string
       responses:
-        204:
+        202:
+          headers:
+            Location:
+              description: URL of the submission status resource.
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -274,7 +283,14 @@ class SequenceExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  sequence: SequenceSchema
+                  submission_id:
+                    type: string
+                    description: Identifier of the submission.
+                  job_ids:
+                    type: array
+                    items:
+                      type: string
+                    description: Identifiers of the jobs created by the submission.
         404:
             description: No sequence has the *sequence_id* identifier.
     """
@@ -286,5 +302,93 @@ class SequenceExecutor(Resource):
     def post(self, sequence_id):
         _get_or_raise(sequence_id)
         manager = _SequenceManagerFactory._build_manager()
-        manager._submit(sequence_id)
-        return {"message": f"Sequence {sequence_id} was submitted."}
+        jobs = manager._submit(sequence_id, wait=False)
+        return _submission_response(f"Sequence {sequence_id} was submitted.", jobs)
+
+
+class SequenceBulkExecutor(Resource):
+    """Execute several sequences
+
+    ---
+    post:
+      tags:
+        - api
+      summary: Execute several sequences.
+      description: |
+        Execute all the sequences identified by *sequence_ids*, or all the sequences of the scenario identified by
+        *scenario_id*. The sequences are resolved once and their submissions are dispatched concurrently to the
+        orchestrator. The response holds one result per sequence, with the submission id and the ids of the jobs
+        created, or a `404` status if the sequence does not exist.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), This endpoint
+          requires _TAIPY_EXECUTOR_ role.
+
+        Code example:
+
+        ```shell
+          curl -X POST -H 'Content-Type: application/json' -d '{"scenario_id": "SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c"}' http://localhost:5000/api/v1/sequences/submit
+        ```
+
+      requestBody:
+        content:
+          application/json:
+            schema: SequenceSubmissionSchema
+      responses:
+        202:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  message:
+                    type: string
+                    description: Status message.
+                  submissions:
+                    type: array
+                    items:
+                      type: object
+                      properties:
+                        id:
+                          type: string
+                        status:
+                          type: integer
+                        submission_id:
+                          type: string
+                        job_ids:
+                          type: array
+                          items:
+                            type: string
+        404:
+            description: No scenario has the *scenario_id* identifier.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def post(self):
+        data = SequenceSubmissionSchema().load(request.json)
+        manager = _SequenceManagerFactory._build_manager()
+        if scenario_id := data.get("scenario_id"):
+            scenario = _ScenarioManagerFactory._build_manager()._get(scenario_id)
+            if scenario is None:
+                raise NonExistingScenario(scenario_id)
+            sequence_ids = [sequence.id for sequence in scenario.sequences.values()]
+        else:
+            sequence_ids = list(dict.fromkeys(data.get("sequence_ids")))
+
+        max_size = current_app.config["BULK_MAX_SIZE"]
+        if len(sequence_ids) > max_size:
+            raise BatchSizeExceededException(len(sequence_ids), max_size)
+
+        submissions = _submit_all(
+            manager,
+            sequence_ids,
+            NonExistingSequence,
+            current_app.config["SUBMIT_MAX_WORKERS"],
+            self.logger,
+            force=data.get("force"),
+        )
+        submitted = sum(1 for submission in submissions if submission["status"] == 202)
+        return {"message": f"{submitted} sequences were submitted.", "submissions": submissions}, 202
@@ -0,0 +1,109 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import List
+
+from flask_restful import Resource
+
+from taipy.core import Job
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.status import Status
+
+from ..exceptions.exceptions import SubmissionNotFoundException
+from ..middlewares._middleware import _middleware
+from ..schemas import SubmissionSchema
+
+# The first status of the list held by at least one job is the status of the submission.
+_SUBMISSION_STATUS_PRECEDENCE = [
+    (Status.FAILED, "FAILED"),
+    (Status.CANCELED, "CANCELED"),
+    (Status.ABANDONED, "ABANDONED"),
+    (Status.RUNNING, "RUNNING"),
+    (Status.PENDING, "PENDING"),
+    (Status.BLOCKED, "BLOCKED"),
+    (Status.SUBMITTED, "SUBMITTED"),
+]
+
+
+def _submission_status(jobs: List[Job]) -> str:
+    statuses = {job.status for job in jobs}
+    for status, submission_status in _SUBMISSION_STATUS_PRECEDENCE:
+        if status in statuses:
+            return submission_status
+    return "COMPLETED"
+
+
+def _get_or_raise(submission_id: str) -> List[Job]:
+    manager = _JobManagerFactory._build_manager()
+    jobs = manager._get_all_by([{"submit_id": submission_id}])
+    if not jobs:
+        raise SubmissionNotFoundException(submission_id)
+    return jobs
+
+
+class SubmissionResource(Resource):
+    """Single object resource
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Get the status of a submission.
+      description: |
+        Return the status of the submission identified by *submission_id*, computed from the status of its jobs. If
+        no job belongs to the submission, a 404 error is returned.
+
+        The submission endpoints (`/scenarios/submit`, `/sequences/submit` and `/tasks/submit`) return the
+        URL of this resource in their `Location` header.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the
+          endpoint requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET http://localhost:5000/api/v1/submissions/SUBMISSION_75750ed8-4e09-4e00-958d-e352ee426cc9
+        ```
+
+      parameters:
+        - in: path
+          name: submission_id
+          schema:
+            type: string
+          description: The identifier of the submission.
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  submission: SubmissionSchema
+        404:
+          description: No job has been submitted with the *submission_id* identifier.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self, submission_id):
+        schema = SubmissionSchema()
+        jobs = _get_or_raise(submission_id)
+        submission = {
+            "id": submission_id,
+            "entity_id": jobs[0].submit_entity_id,
+            "status": _submission_status(jobs),
+            "is_finished": all(job.is_finished() for job in jobs),
+            "jobs": [{"id": job.id, "task_id": job.task.id, "status": job.status.name} for job in jobs],
+        }
+        return {"submission": schema.dump(submission)}
@@ -16,6 +16,7 @@ from taipy.config.config import Config
 from taipy.core.exceptions.exceptions import NonExistingTask, NonExistingTaskConfig
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
+from ...commons.submission import _submission_response
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
@@ -237,6 +238,9 @@ class TaskExecutor(Resource):
       description: |
         Execute a task by *task_id*. If the task does not exist, a 404 error is returned.
 
+        The request returns as soon as the job is created, without waiting for its execution. The `Location`
+        header of the response points to the submission status resource.
+
         !!! Note
           When the authorization feature is activated (available in the **Enterprise** edition only), this endpoint
           requires `TAIPY_EXECUTOR` role.
@@ -253,7 +257,12 @@ class TaskExecutor(Resource):
           schema:
             type: string
       responses:
-        204:
+        202:
+          headers:
+            Location:
+              description: URL of the submission status resource.
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -262,7 +271,14 @@ class TaskExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  task: TaskSchema
+                  submission_id:
+                    type: string
+                    description: Identifier of the submission.
+                  job_ids:
+                    type: array
+                    items:
+                      type: string
+                    description: Identifiers of the jobs created by the submission.
         404:
           description: No task has the *task_id* identifier.
     """
@@ -274,5 +290,5 @@ class TaskExecutor(Resource):
     def post(self, task_id):
         manager = _TaskManagerFactory._build_manager()
         task = _get_or_raise(task_id)
-        manager._orchestrator().submit_task(task)
-        return {"message": f"Task {task_id} was submitted."}
+        job = manager._orchestrator().submit_task(task, wait=False)
+        return _submission_response(f"Task {task_id} was submitted.", [job])
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from .batch import BatchOperationSchema, BatchSchema
 from .cycle import CycleResponseSchema, CycleSchema
 from .datanode import (
     CSVDataNodeConfigSchema,
@@ -24,9 +25,16 @@ from .datanode import (
     SQLDataNodeConfigSchema,
     SQLTableDataNodeConfigSchema,
 )
-from .job import JobSchema
-from .scenario import ScenarioResponseSchema, ScenarioSchema
-from .sequence import SequenceResponseSchema, SequenceSchema
+from .job import JobSchema, JobSelectionSchema
+from .scenario import (
+    ScenarioBulkItemSchema,
+    ScenarioBulkSchema,
+    ScenarioResponseSchema,
+    ScenarioSchema,
+    ScenarioSubmissionSchema,
+)
+from .sequence import SequenceResponseSchema, SequenceSchema, SequenceSubmissionSchema
+from .submission import SubmissionJobSchema, SubmissionSchema
 from .task import TaskSchema
 
 __all__ = [
@@ -35,9 +43,18 @@ __all__ = [
     "TaskSchema",
     "SequenceSchema",
     "SequenceResponseSchema",
+    "SequenceSubmissionSchema",
     "ScenarioSchema",
     "ScenarioResponseSchema",
+    "ScenarioBulkSchema",
+    "ScenarioBulkItemSchema",
+    "ScenarioSubmissionSchema",
     "CycleSchema",
     "CycleResponseSchema",
     "JobSchema",
+    "JobSelectionSchema",
+    "BatchSchema",
+    "BatchOperationSchema",
+    "SubmissionSchema",
+    "SubmissionJobSchema",
 ]
@@ -0,0 +1,28 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from marshmallow import Schema, fields, validate
+
+OPERATIONS = ["create", "write", "submit", "delete"]
+ENTITIES = ["cycle", "datanode", "task", "sequence", "scenario", "job"]
+
+
+class BatchOperationSchema(Schema):
+    operation = fields.String(required=True, validate=validate.OneOf(OPERATIONS))
+    entity = fields.String(required=True, validate=validate.OneOf(ENTITIES))
+    id = fields.String()
+    params = fields.Dict(load_default=dict)
+    data = fields.Raw(allow_none=True)
+
+
+class BatchSchema(Schema):
+    operations = fields.List(fields.Nested(BatchOperationSchema), required=True)
+    fail_fast = fields.Boolean(load_default=False)
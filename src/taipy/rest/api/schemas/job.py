@@ -9,7 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from marshmallow import Schema, fields
+from marshmallow import Schema, ValidationError, fields, validate, validates_schema
+
+from taipy.core.job.status import Status
+
+
+class _StrictBoolean(fields.Boolean):
+    """Boolean field only accepting JSON booleans."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, bool):
+            raise self.make_error("invalid", input=value)
+        return value
 
 
 class CallableSchema(Schema):
@@ -25,3 +36,18 @@ class JobSchema(Schema):
     creation_date = fields.String()
     subscribers = fields.Nested(CallableSchema)
     stacktrace = fields.List(fields.String)
+
+
+class JobSelectionSchema(Schema):
+    job_ids = fields.List(fields.String)
+    status = fields.List(fields.String(validate=validate.OneOf([status.name for status in Status])))
+    task_config_id = fields.List(fields.String)
+    submission_id = fields.List(fields.String)
+    older_than = fields.DateTime()
+    # A string like "false" must not force the deletion.
+    force = _StrictBoolean(load_default=False)
+
+    @validates_schema
+    def validate_selection(self, data, **kwargs):
+        if not data.keys() - {"force"}:
+            raise ValidationError("At least one job selection criterion must be provided.")
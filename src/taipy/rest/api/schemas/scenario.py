@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from marshmallow import Schema, fields
+from marshmallow import Schema, ValidationError, fields, validate, validates_schema
 
 
 class ScenarioSchema(Schema):
@@ -25,3 +25,31 @@ class ScenarioResponseSchema(ScenarioSchema):
     subscribers = fields.List(fields.Dict)
     cycle = fields.String()
     creation_date = fields.String()
+
+
+class ScenarioBulkItemSchema(Schema):
+    name = fields.String()
+    creation_date = fields.DateTime()
+    properties = fields.Dict()
+    tags = fields.List(fields.String)
+
+
+class ScenarioBulkSchema(Schema):
+    scenarios = fields.List(fields.Nested(ScenarioBulkItemSchema))
+    count = fields.Integer(validate=validate.Range(min=1))
+
+    @validates_schema
+    def validate_size(self, data, **kwargs):
+        if not data.get("scenarios") and not data.get("count"):
+            raise ValidationError("Either scenarios or count must be provided.")
+
+
+class ScenarioSubmissionSchema(Schema):
+    scenario_ids = fields.List(fields.String)
+    cycle_id = fields.String()
+    force = fields.Boolean(load_default=False)
+
+    @validates_schema
+    def validate_selection(self, data, **kwargs):
+        if ("scenario_ids" in data) == ("cycle_id" in data):
+            raise ValidationError("Exactly one of scenario_ids or cycle_id must be provided.")
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from marshmallow import Schema, fields
+from marshmallow import Schema, ValidationError, fields, validates_schema
 
 
 class SequenceSchema(Schema):
@@ -23,3 +23,14 @@ class SequenceSchema(Schema):
 class SequenceResponseSchema(SequenceSchema):
     id = fields.String()
     subscribers = fields.List(fields.Dict)
+
+
+class SequenceSubmissionSchema(Schema):
+    sequence_ids = fields.List(fields.String)
+    scenario_id = fields.String()
+    force = fields.Boolean(load_default=False)
+
+    @validates_schema
+    def validate_selection(self, data, **kwargs):
+        if ("sequence_ids" in data) == ("scenario_id" in data):
+            raise ValidationError("Exactly one of sequence_ids or scenario_id must be provided.")
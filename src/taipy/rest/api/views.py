@@ -15,29 +15,55 @@ from flask_restful import Api
 from taipy.core.common._utils import _load_fct
 from taipy.logger._taipy_logger import _TaipyLogger
 
-from ..extensions import apispec
+from ..extensions import apispec, metrics, profiler, server_timing
 from .middlewares._middleware import _using_enterprise
 from .resources import (
+    BatchResource,
     CycleList,
     CycleResource,
     DataNodeList,
     DataNodeReader,
     DataNodeResource,
     DataNodeWriter,
+    JobEvents,
     JobExecutor,
     JobList,
+    JobListExecutor,
+    JobListWaiter,
     JobResource,
+    JobRetention,
+    JobStacktrace,
+    JobStatistics,
+    JobWaiter,
+    ScenarioBulkCreator,
+    ScenarioBulkExecutor,
     ScenarioExecutor,
     ScenarioList,
     ScenarioResource,
+    SequenceBulkExecutor,
     SequenceExecutor,
     SequenceList,
     SequenceResource,
+    SubmissionResource,
     TaskExecutor,
     TaskList,
     TaskResource,
 )
-from .schemas import CycleSchema, DataNodeSchema, JobSchema, ScenarioSchema, SequenceSchema, TaskSchema
+from .schemas import (
+    BatchSchema,
+    CycleSchema,
+    DataNodeSchema,
+    JobSchema,
+    JobSelectionSchema,
+    ScenarioBulkSchema,
+    ScenarioSchema,
+    ScenarioSubmissionSchema,
+    SequenceSchema,
+    SequenceSubmissionSchema,
+    SubmissionSchema,
+    TaskSchema,
+)
+from .websocket import register_websocket
 
 _logger = _TaipyLogger._get_logger()
 
@@ -107,6 +133,12 @@ api.add_resource(
     endpoint="sequence_submit",
     resource_class_kwargs={"logger": _logger},
 )
+api.add_resource(
+    SequenceBulkExecutor,
+    "/sequences/submit/",
+    endpoint="sequences_submit",
+    resource_class_kwargs={"logger": _logger},
+)
 
 api.add_resource(
     ScenarioResource,
@@ -120,12 +152,24 @@ api.add_resource(
     endpoint="scenarios",
     resource_class_kwargs={"logger": _logger},
 )
+api.add_resource(
+    ScenarioBulkCreator,
+    "/scenarios/bulk/",
+    endpoint="scenarios_bulk",
+    resource_class_kwargs={"logger": _logger},
+)
 api.add_resource(
     ScenarioExecutor,
     "/scenarios/submit/<string:scenario_id>/",
     endpoint="scenario_submit",
     resource_class_kwargs={"logger": _logger},
 )
+api.add_resource(
+    ScenarioBulkExecutor,
+    "/scenarios/submit/",
+    endpoint="scenarios_submit",
+    resource_class_kwargs={"logger": _logger},
+)
 
 api.add_resource(
     CycleResource,
@@ -147,12 +191,43 @@ api.add_resource(
     resource_class_kwargs={"logger": _logger},
 )
 api.add_resource(JobList, "/jobs/", endpoint="jobs", resource_class_kwargs={"logger": _logger})
+api.add_resource(
+    JobStacktrace,
+    "/jobs/<string:job_id>/stacktrace/",
+    endpoint="job_stacktrace",
+    resource_class_kwargs={"logger": _logger},
+)
+api.add_resource(JobEvents, "/jobs/events/", endpoint="job_events", resource_class_kwargs={"logger": _logger})
+api.add_resource(
+    JobWaiter,
+    "/jobs/<string:job_id>/wait/",
+    endpoint="job_wait",
+    resource_class_kwargs={"logger": _logger},
+)
+api.add_resource(JobListWaiter, "/jobs/wait/", endpoint="jobs_wait", resource_class_kwargs={"logger": _logger})
+api.add_resource(JobStatistics, "/jobs/stats/", endpoint="job_stats", resource_class_kwargs={"logger": _logger})
+api.add_resource(JobRetention, "/jobs/retention/", endpoint="job_retention", resource_class_kwargs={"logger": _logger})
 api.add_resource(
     JobExecutor,
     "/jobs/cancel/<string:job_id>/",
     endpoint="job_cancel",
     resource_class_kwargs={"logger": _logger},
 )
+api.add_resource(JobListExecutor, "/jobs/cancel/", endpoint="jobs_cancel", resource_class_kwargs={"logger": _logger})
+
+api.add_resource(
+    SubmissionResource,
+    "/submissions/<string:submission_id>/",
+    endpoint="submission_by_id",
+    resource_class_kwargs={"logger": _logger},
+)
+
+api.add_resource(BatchResource, "/batch/", endpoint="batch", resource_class_kwargs={"logger": _logger})
+
+register_websocket(blueprint)
+metrics.register(blueprint)
+server_timing.register(blueprint)
+profiler.register(blueprint)
 
 
 def load_enterprise_resources(api: Api):
@@ -182,23 +257,43 @@ def register_views():
     apispec.spec.path(view=TaskExecutor, app=current_app)
 
     apispec.spec.components.schema("SequenceSchema", schema=SequenceSchema)
+    apispec.spec.components.schema("SequenceSubmissionSchema", schema=SequenceSubmissionSchema)
     apispec.spec.path(view=SequenceResource, app=current_app)
     apispec.spec.path(view=SequenceList, app=current_app)
     apispec.spec.path(view=SequenceExecutor, app=current_app)
+    apispec.spec.path(view=SequenceBulkExecutor, app=current_app)
 
     apispec.spec.components.schema("ScenarioSchema", schema=ScenarioSchema)
+    apispec.spec.components.schema("ScenarioBulkSchema", schema=ScenarioBulkSchema)
+    apispec.spec.components.schema("ScenarioSubmissionSchema", schema=ScenarioSubmissionSchema)
     apispec.spec.path(view=ScenarioResource, app=current_app)
     apispec.spec.path(view=ScenarioList, app=current_app)
+    apispec.spec.path(view=ScenarioBulkCreator, app=current_app)
     apispec.spec.path(view=ScenarioExecutor, app=current_app)
+    apispec.spec.path(view=ScenarioBulkExecutor, app=current_app)
 
     apispec.spec.components.schema("CycleSchema", schema=CycleSchema)
     apispec.spec.path(view=CycleResource, app=current_app)
     apispec.spec.path(view=CycleList, app=current_app)
 
     apispec.spec.components.schema("JobSchema", schema=JobSchema)
+    apispec.spec.components.schema("JobSelectionSchema", schema=JobSelectionSchema)
     apispec.spec.path(view=JobResource, app=current_app)
     apispec.spec.path(view=JobList, app=current_app)
+    apispec.spec.path(view=JobStacktrace, app=current_app)
     apispec.spec.path(view=JobExecutor, app=current_app)
+    apispec.spec.path(view=JobListExecutor, app=current_app)
+    apispec.spec.path(view=JobEvents, app=current_app)
+    apispec.spec.path(view=JobWaiter, app=current_app)
+    apispec.spec.path(view=JobListWaiter, app=current_app)
+    apispec.spec.path(view=JobStatistics, app=current_app)
+    apispec.spec.path(view=JobRetention, app=current_app)
+
+    apispec.spec.components.schema("SubmissionSchema", schema=SubmissionSchema)
+    apispec.spec.path(view=SubmissionResource, app=current_app)
+
+    apispec.spec.components.schema("BatchSchema", schema=BatchSchema)
+    apispec.spec.path(view=BatchResource, app=current_app)
 
     apispec.spec.components.schema(
         "Any",
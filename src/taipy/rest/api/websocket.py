@@ -0,0 +1,141 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""WebSocket channel relaying the changes of the Core entities
+
+The channel is only available when the optional `flask-sock` package is installed.
+"""
+
+import json
+from functools import lru_cache
+from importlib import util
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+from flask import Blueprint, request
+
+from ..extensions import entity_events, streams
+from .exceptions.exceptions import StreamsBusyException
+from .middlewares._middleware import _middleware
+
+_FILTERS = ("entity_type", "entity_id", "operation")
+_CASE_INSENSITIVE_FILTERS = ("entity_type", "operation")
+_POLL_INTERVAL = 1.0
+
+
+def _websocket_available() -> bool:
+    return util.find_spec("flask_sock") is not None
+
+
+class _EntityEventSubscription:
+    """Subscription filters and position in the event stream of a WebSocket connection.
+
+    Connections do not queue events: they read the shared and bounded buffer of the event broker from the last event
+    they sent. A slow connection falling behind the buffer is told how many events it missed instead of holding them.
+    """
+
+    def __init__(self, filters: Optional[Mapping[str, Iterable[str]]] = None, last_id: Optional[int] = None):
+        self.filters = self._parse_filters(filters or {})
+        self.last_id = entity_events.last_id if last_id is None else last_id
+
+    @classmethod
+    def from_args(cls, args) -> "_EntityEventSubscription":
+        filters = {name: [value for arg in args.getlist(name) for value in arg.split(",")] for name in _FILTERS}
+        last_event_id = args.get("last_event_id")
+        return cls(filters, int(last_event_id) if last_event_id and last_event_id.isdigit() else None)
+
+    def update(self, message: str) -> Optional[Dict]:
+        """Apply a subscription message sent by the client and return an error message if it is invalid."""
+        try:
+            content = json.loads(message)
+            filters = content["subscribe"]
+            self.filters = self._parse_filters(filters)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return {"error": 'Expected a message like {"subscribe": {"entity_type": ["SCENARIO"]}}.'}
+        return None
+
+    def next_messages(self, timeout: float) -> List[Dict]:
+        """Wait at most *timeout* seconds for new events and return the ones matching the filters."""
+        events = entity_events.wait(self.last_id, timeout)
+        if not events:
+            return []
+        messages: List[Dict] = []
+        if missed := events[0]["id"] - self.last_id - 1:
+            messages.append({"dropped": missed})
+        messages.extend(event for event in events if self.__is_matching(event))
+        self.last_id = events[-1]["id"]
+        return messages
+
+    @staticmethod
+    def _parse_filters(filters: Mapping[str, Iterable[str]]) -> Dict[str, Set[str]]:
+        parsed = {}
+        for name in _FILTERS:
+            values = filters.get(name) or []
+            values = [values] if isinstance(values, str) else values
+            parsed[name] = {value.upper() if name in _CASE_INSENSITIVE_FILTERS else value for value in values if value}
+        return parsed
+
+    def __is_matching(self, event: Dict) -> bool:
+        return all(not values or event.get(name) in values for name, values in self.filters.items())
+
+
+def _entity_events(ws):
+    subscription = _EntityEventSubscription.from_args(request.args)
+    while True:
+        while (message := ws.receive(timeout=0)) is not None:
+            if error := subscription.update(message):
+                ws.send(json.dumps(error))
+        for message in subscription.next_messages(_POLL_INTERVAL):
+            ws.send(json.dumps(message))
+
+
+def register_websocket(blueprint: Blueprint):
+    """Register the `/events` WebSocket route on the blueprint, if `flask-sock` is installed.
+
+    Each message sent by the server is either an event (`entity_type`, `entity_id`, `operation`, `attribute_name`,
+    `timestamp` and `id`) or the number of events the connection missed (`dropped`). The client can replace its
+    subscription filters at any time by sending `{"subscribe": {"entity_type": [...], "entity_id": [...],
+    "operation": [...]}}`. The initial filters and the id of the last event received can be given as query parameters.
+    Each connection holds a request thread, at most `WSGI_MAX_STREAMS` long-lived requests are served at once.
+    """
+    if not _websocket_available():
+        return
+
+    blueprint.add_url_rule("/events/", "entity_events", _entity_events_route, websocket=True)
+
+
+@lru_cache(maxsize=1)
+def _websocket_view() -> Callable:
+    # `flask-sock` is imported on the first connection: it is not needed to serve the other routes.
+    from flask_sock import Sock
+
+    class _ViewCollector:
+        def __init__(self):
+            self.view = None
+
+        def route(self, path, **kwargs):
+            def _collect(view):
+                self.view = view
+
+            return _collect
+
+    collector = _ViewCollector()
+    Sock().route("/events/", bp=collector)(_middleware(_entity_events))
+    return collector.view
+
+
+def _entity_events_route(*args, **kwargs):
+    # The connection is admitted before the handshake, so that a rejected one gets a 503 response.
+    if (release := streams.acquire()) is None:
+        raise StreamsBusyException(streams.retry_after)
+    try:
+        return _websocket_view()(*args, **kwargs)
+    finally:
+        release()
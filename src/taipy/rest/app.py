@@ -15,7 +15,22 @@ from flask import Flask
 
 from . import api
 from .commons.encoder import _CustomEncoder
-from .extensions import apispec
+from .extensions import (
+    apispec,
+    compressor,
+    data_node_io,
+    data_node_reads,
+    entity_events,
+    job_counters,
+    job_events,
+    job_pruner,
+    metrics,
+    profiler,
+    request_decompressor,
+    server_timing,
+    slow_requests,
+    streams,
+)
 
 
 def create_app(testing=False, flask_env=None, secret_key=None):
@@ -28,19 +43,51 @@ def create_app(testing=False, flask_env=None, secret_key=None):
     )
     app.url_map.strict_slashes = False
     app.config["RESTFUL_JSON"] = {"cls": _CustomEncoder}
+    app.config.setdefault("BATCH_MAX_OPERATIONS", 1000)
+    app.config.setdefault("BULK_MAX_SIZE", 10000)
+    app.config.setdefault("SUBMIT_MAX_WORKERS", 8)
+    app.config.setdefault("JOB_EVENTS_KEEPALIVE", 15)
+    app.config.setdefault("JOB_WAIT_MAX_TIMEOUT", 60)
+    app.config.setdefault("JOB_STACKTRACE_MAX_LENGTH", 1000)
+    app.config.setdefault("ASGI_MAX_WORKERS", 32)
+    app.config.setdefault("ASGI_MAX_STREAMS", 64)
+    app.config.setdefault("ADMIN_TOKEN", os.getenv("TAIPY_REST_ADMIN_TOKEN"))
 
     configure_apispec(app)
+    job_events.init_app(app)
+    job_counters.init_app(app)
+    job_pruner.init_app(app)
+    data_node_io.init_app(app)
+    data_node_reads.init_app(app)
+    compressor.init_app(app)
+    request_decompressor.init_app(app)
+    metrics.init_app(app)
+    slow_requests.init_app(app)
+    server_timing.init_app(app)
+    profiler.init_app(app)
+    streams.init_app(app)
     register_blueprints(app)
-    with app.app_context():
-        api.views.register_views()
+    if _serves_entity_events(app):
+        entity_events.init_app(app)
+    apispec.register(api.views.register_views)
 
     return app
 
 
+def _serves_entity_events(app) -> bool:
+    """Return True if the application relays the entity events, on the WebSocket route registered when `flask-sock`
+    is installed."""
+    return "api.entity_events" in app.view_functions
+
+
 def configure_apispec(app):
-    """Configure APISpec for swagger support"""
+    """Configure APISpec for swagger support, the spec is built on first access"""
     apispec.init_app(app)
+    apispec.register(register_components)
+
 
+def register_components():
+    """Register the components shared by the API paths"""
     apispec.spec.components.schema(
         "PaginatedResult",
         {
@@ -0,0 +1,363 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""ASGI application serving the REST APIs
+
+The data node reads and writes and the job waits are served by coroutines: the data node I/O and the other blocking
+Core calls run on a bounded pool of `ASGI_MAX_WORKERS` threads, where they wait for a free thread instead of being
+rejected like on the data node I/O pool of the WSGI application, and waiting for jobs does not hold any thread. The
+other routes are served by the WSGI application through the same pool, except for the streamed responses, like the
+job events, which are iterated on a separate pool of `ASGI_MAX_STREAMS` threads so that they never hold the threads
+of the other requests. Unlike the WSGI application, which serves at most `WSGI_MAX_STREAMS` of them, the job event
+streams and the job waits are not bounded by the request threads. When the Enterprise edition is installed, all the
+routes are served by the WSGI application, so that its middleware applies.
+The request bodies larger than `MAX_CONTENT_LENGTH` or `REQUEST_DECOMPRESSED_MAX_SIZE` bytes are rejected with a 413
+error. The responses of the coroutines are compressed and recorded in the metrics like the ones of the WSGI
+application. The WebSocket connections, like the ones to the entity events route, are closed with the 1003 code: they
+are only served by the WSGI application.
+
+The application can be served by any ASGI server, for instance:
+
+```shell
+  uvicorn --factory taipy.rest.asgi:create_asgi_app
+```
+"""
+
+import asyncio
+import contextvars
+import io
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from marshmallow import ValidationError
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+
+from taipy.core.exceptions.exceptions import NonExistingDataNode, NonExistingJob
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from .api.exceptions.exceptions import JobIdMissingException
+from .api.middlewares._middleware import _using_enterprise
+from .api.resources.datanode import _read, _write
+from .api.resources.job import _dump_jobs, _get_list_arg, _get_timeout, _get_wait_mode, _JobWait
+from .api.schemas import JobSchema
+from .app import create_app
+from .commons.compression import _decompress
+from .commons.encoder import _CustomEncoder
+from .commons.streams import _ASGI_ENVIRON_KEY
+from .commons.timing import phase
+from .extensions import compressor, job_events, metrics, request_decompressor, server_timing
+
+_NOT_FOUND_EXCEPTIONS = (NonExistingDataNode, NonExistingJob)
+_BAD_REQUEST_EXCEPTIONS = (JobIdMissingException,)
+# Close code of the WebSocket connections, which are not served by the ASGI application.
+_WEBSOCKET_UNSUPPORTED = 1003
+
+
+class _Request:
+    def __init__(self, scope: Dict, body: bytes, path_args: Dict[str, str]):
+        self.scope = scope
+        self.body = body
+        self.path_args = path_args
+        self.args = MultiDict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        self.decoded_size: Optional[int] = None
+
+    def header(self, name: bytes) -> Optional[str]:
+        return next((value.decode("latin-1") for key, value in self.scope.get("headers", []) if key == name), None)
+
+    def json(self) -> Any:
+        body = _decompress(self.body, self.header(b"content-encoding"), request_decompressor.max_size)
+        self.decoded_size = len(body)
+        return json.loads(body) if body else None
+
+
+class _AsgiApplication:
+    def __init__(self, app, max_workers: int, max_streams: int):
+        self.app = app
+        self.logger = _TaipyLogger._get_logger()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thread-Taipy-Rest-Asgi")
+        self.stream_executor = ThreadPoolExecutor(
+            max_workers=max_streams, thread_name_prefix="Thread-Taipy-Rest-Asgi-Stream"
+        )
+        # Method, path, endpoint of the WSGI application serving the same route, and coroutine.
+        self.routes: List[Tuple[str, re.Pattern, str, Callable[[_Request], Awaitable[Tuple[int, Any]]]]] = []
+        if not _using_enterprise():
+            prefix = "/api/v1"
+            self.routes = [
+                (
+                    "GET",
+                    re.compile(rf"^{prefix}/datanodes/(?P<datanode_id>[^/]+)/read/?$"),
+                    "datanode_reader",
+                    self.read_data_node,
+                ),
+                (
+                    "PUT",
+                    re.compile(rf"^{prefix}/datanodes/(?P<datanode_id>[^/]+)/write/?$"),
+                    "datanode_writer",
+                    self.write_data_node,
+                ),
+                ("GET", re.compile(rf"^{prefix}/jobs/wait/?$"), "jobs_wait", self.wait_jobs),
+                ("GET", re.compile(rf"^{prefix}/jobs/(?P<job_id>[^/]+)/wait/?$"), "job_wait", self.wait_job),
+            ]
+
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            return await self.__lifespan(receive, send)
+        if scope["type"] == "websocket":
+            return await self.__reject_websocket(scope, receive, send)
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']}.")
+
+        try:
+            body = await self.__read_body(scope, receive, self.__max_body_size())
+        except RequestEntityTooLarge as e:
+            return await self.__send_json(send, 413, {"message": e.description}, {})
+        for method, pattern, endpoint, handler in self.routes:
+            if scope["method"] == method and (match := pattern.match(scope["path"])):
+                return await self.__serve(send, endpoint, handler, _Request(scope, body, match.groupdict()))
+        await self.__call_wsgi(scope, body, receive, send)
+
+    async def run(self, function: Callable, *args, executor: Optional[ThreadPoolExecutor] = None) -> Any:
+        """Run a blocking function on the bounded thread pool, in the context of the request."""
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor or self.executor, context.run, partial(function, *args)
+        )
+
+    async def read_data_node(self, request: _Request) -> Tuple[int, Any]:
+        return 200, await self.run(_read, request.path_args["datanode_id"], self.__json_or_none(request))
+
+    async def write_data_node(self, request: _Request) -> Tuple[int, Any]:
+        # The body may be large and compressed, it is decoded off the event loop.
+        def _decode():
+            with phase("decode"):
+                return request.json()
+
+        data = await self.run(_decode)
+        return 200, await self.run(_write, request.path_args["datanode_id"], data, request.decoded_size)
+
+    async def wait_job(self, request: _Request) -> Tuple[int, Any]:
+        jobs = await self.__wait([request.path_args["job_id"]], True, _get_timeout(request.args, self.app.config))
+
+        def _response():
+            return {"job": JobSchema().dump(jobs[0]), "is_finished": jobs[0].is_finished()}
+
+        return 200, await self.run(_response)
+
+    async def wait_jobs(self, request: _Request) -> Tuple[int, Any]:
+        job_ids = _get_list_arg("job_id", request.args)
+        if not job_ids:
+            raise JobIdMissingException
+        mode = _get_wait_mode(request.args)
+        jobs = await self.__wait(job_ids, mode == "all", _get_timeout(request.args, self.app.config))
+
+        def _response():
+            finished = [job.is_finished() for job in jobs]
+            return {
+                "jobs": _dump_jobs(jobs, request.args, self.app.config),
+                "is_finished": all(finished) if mode == "all" else any(finished),
+            }
+
+        return 200, await self.run(_response)
+
+    async def __wait(self, job_ids: List[str], wait_all: bool, timeout: float) -> List:
+        wait = await self.run(_JobWait, job_ids, wait_all)
+        deadline = time.monotonic() + timeout
+        while not wait.is_done() and (remaining := deadline - time.monotonic()) > 0:
+            wait.update(await job_events.wait_async(wait.last_id, remaining))
+        return await self.run(wait.reload)
+
+    async def __serve(self, send: Callable, endpoint: str, handler: Callable, request: _Request):
+        started = time.perf_counter()
+        metrics.inc("taipy_rest_requests_in_flight", {})
+        try:
+            timing = server_timing.start()
+            status, content, headers = await self.__handle(handler, request)
+            if timing is not None:
+                entity_id = next(iter(request.path_args.values()), None)
+                method, path = request.scope["method"], request.scope["path"]
+                if (header := server_timing.finish(timing, method, path, endpoint, status, entity_id)) is not None:
+                    headers["Server-Timing"] = header
+            size = await self.__send_json(send, status, content, headers, request.header(b"accept-encoding"))
+            metrics.observe_request(endpoint, request.scope["method"], status, started, size)
+        finally:
+            metrics.inc("taipy_rest_requests_in_flight", {}, -1)
+
+    async def __handle(self, handler: Callable, request: _Request) -> Tuple[int, Any, Dict[str, str]]:
+        try:
+            return (*await handler(request), {})
+        except _NOT_FOUND_EXCEPTIONS as e:
+            return 404, {"message": e.message}, {}
+        except _BAD_REQUEST_EXCEPTIONS as e:
+            return 400, {"message": e.message}, {}
+        except ValidationError as e:
+            return 400, e.messages, {}
+        except json.JSONDecodeError as e:
+            return 400, {"message": f"Invalid JSON body: {e}"}, {}
+        except HTTPException as e:
+            return e.code, {"message": e.description}, {}
+        except Exception as e:
+            self.logger.error(f"{request.scope['method']} {request.scope['path']} failed: {e}")
+            return 500, {"message": "Internal Server Error"}, {}
+
+    @staticmethod
+    def __dumps(content: Any) -> bytes:
+        return json.dumps(content, cls=_CustomEncoder).encode()
+
+    @staticmethod
+    def __json_or_none(request: _Request) -> Any:
+        try:
+            return request.json()
+        except json.JSONDecodeError:
+            return None
+
+    async def __send_json(
+        self, send: Callable, status: int, content: Any, headers: Dict[str, str], accept_encoding: Optional[str] = None
+    ) -> int:
+        """Send the response, compressed if the client accepts it, and return its size before compression."""
+        # The data read from data nodes is already serialized.
+        body = content if isinstance(content, bytes) else await self.run(self.__dumps, content)
+        size = len(body)
+        if 200 <= status < 300 and compressor.enabled and compressor.encodings:
+            headers["Vary"] = "Accept-Encoding"
+            if accept_encoding:
+                body, encoding = await self.run(compressor.compress_body, body, "application/json", accept_encoding)
+                if encoding is not None:
+                    headers["Content-Encoding"] = encoding
+        raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        raw_headers.extend((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items())
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
+        return size
+
+    async def __call_wsgi(self, scope: Dict, body: bytes, receive: Callable, send: Callable):
+        started: Dict[str, Any] = {}
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info=None):
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+            return lambda data: None
+
+        # Streamed responses, like the job events, stop as soon as the client disconnects.
+        disconnected = asyncio.Event()
+
+        async def watch_disconnect():
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.ensure_future(watch_disconnect())
+        iterable = await self.run(self.app.wsgi_app, self.__environ(scope, body), start_response)
+        # The responses of unknown length are streamed: each chunk may wait for an event for a long time.
+        streamed = all(name != b"content-length" for name, _ in started["headers"])
+        executor = self.stream_executor if streamed else self.executor
+        try:
+            iterator = iter(iterable)
+            chunk = await self.run(next, iterator, None, executor=executor)
+            await send({"type": "http.response.start", "status": started["status"], "headers": started["headers"]})
+            while chunk is not None and not disconnected.is_set():
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                chunk = await self.run(next, iterator, None, executor=executor)
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            watcher.cancel()
+            if hasattr(iterable, "close"):
+                await self.run(iterable.close, executor=executor)
+
+    @staticmethod
+    def __environ(scope: Dict, body: bytes) -> Dict:
+        server_name, server_port = scope.get("server") or ("localhost", 80)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode().decode("latin-1"),
+            "PATH_INFO": scope["path"].encode().decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server_name,
+            "SERVER_PORT": str(server_port),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": (scope.get("client") or ("", 0))[0],
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+            _ASGI_ENVIRON_KEY: True,
+        }
+        for name, value in scope.get("headers", []):
+            name, value = name.decode("latin-1").upper().replace("-", "_"), value.decode("latin-1")
+            key = name if name in ("CONTENT_TYPE", "CONTENT_LENGTH") else f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+    def __max_body_size(self) -> int:
+        # A compressed body is not expected to be larger than the decompressed body it is allowed to hold.
+        max_content_length = self.app.config.get("MAX_CONTENT_LENGTH")
+        if max_content_length is None:
+            return request_decompressor.max_size
+        return min(max_content_length, request_decompressor.max_size)
+
+    @staticmethod
+    async def __read_body(scope: Dict, receive: Callable, max_size: int) -> bytes:
+        """Read the request body, or raise `RequestEntityTooLarge` as soon as it exceeds *max_size* bytes."""
+        too_large = RequestEntityTooLarge(f"Request body exceeds {max_size} bytes.")
+        length = next((value for name, value in scope.get("headers", []) if name == b"content-length"), None)
+        if length is not None and length.isdigit() and int(length) > max_size:
+            raise too_large
+        body = bytearray()
+        while True:
+            message = await receive()
+            body.extend(message.get("body", b""))
+            if len(body) > max_size:
+                raise too_large
+            if not message.get("more_body"):
+                return bytes(body)
+
+    async def __reject_websocket(self, scope: Dict, receive: Callable, send: Callable):
+        message = await receive()
+        if message["type"] == "websocket.connect":
+            self.logger.warning(f"WebSocket connection to {scope['path']} rejected: it is only served by WSGI servers.")
+            await send({"type": "websocket.close", "code": _WEBSOCKET_UNSUPPORTED})
+
+    async def __lifespan(self, receive: Callable, send: Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                self.stream_executor.shutdown(wait=False)
+                return await send({"type": "lifespan.shutdown.complete"})
+
+
+def create_asgi_app(app=None, max_workers: Optional[int] = None, max_streams: Optional[int] = None) -> Callable:
+    """Create an ASGI application serving the REST APIs.
+
+    Parameters:
+        app: The Flask application serving the routes that are not natively asynchronous. A new one is created if
+            not provided.
+        max_workers (Optional[int]): The maximum number of threads running blocking calls. The default is the
+            `ASGI_MAX_WORKERS` setting of the Flask application.
+        max_streams (Optional[int]): The maximum number of threads iterating streamed responses. The default is the
+            `ASGI_MAX_STREAMS` setting of the Flask application.
+    """
+    app = app or create_app()
+    return _AsgiApplication(
+        app, max_workers or app.config["ASGI_MAX_WORKERS"], max_streams or app.config["ASGI_MAX_STREAMS"]
+    )
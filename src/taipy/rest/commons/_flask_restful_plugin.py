@@ -0,0 +1,36 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from apispec.exceptions import APISpecError
+from apispec_webframeworks.flask import FlaskPlugin
+
+
+class FlaskRestfulPlugin(FlaskPlugin):
+    """Small plugin override to handle flask-restful resources"""
+
+    @staticmethod
+    def _rule_for_view(view, app=None):
+        view_funcs = app.view_functions
+        endpoint = None
+
+        for ept, view_func in view_funcs.items():
+            if hasattr(view_func, "view_class"):
+                view_func = view_func.view_class
+
+            if view_func == view:
+                endpoint = ept
+
+        if not endpoint:
+            raise APISpecError("Could not find endpoint for view {0}".format(view))
+
+        # WARNING: Assume 1 rule per view function for now
+        rule = app.url_map._rules_by_endpoint[endpoint][0]
+        return rule
@@ -0,0 +1,37 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Protection of the administration endpoints, served under `/admin`"""
+
+import hmac
+from functools import wraps
+from typing import Callable
+
+from flask import abort, current_app, request
+
+
+def _admin_required(view: Callable) -> Callable:
+    """Serve *view* only to the requests bearing the `ADMIN_TOKEN` of the application.
+
+    The administration endpoints are not found when no token is configured.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = current_app.config.get("ADMIN_TOKEN")
+        if not token:
+            abort(404)
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(credentials.strip().encode(), token.encode()):
+            abort(401)
+        return view(*args, **kwargs)
+
+    return wrapper
@@ -9,41 +9,62 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
 from apispec import APISpec
-from apispec.exceptions import APISpecError
 from apispec.ext.marshmallow import MarshmallowPlugin
-from apispec_webframeworks.flask import FlaskPlugin
-from flask import Blueprint, jsonify, render_template
+from apispec.yaml_utils import dict_to_yaml
+from flask import Blueprint, Response, jsonify, render_template, request
+
+
+def __getattr__(name: str):
+    # The plugin is imported on demand: importing `apispec_webframeworks` takes a large share of the startup time.
+    if name == "FlaskRestfulPlugin":
+        from ._flask_restful_plugin import FlaskRestfulPlugin
 
+        return FlaskRestfulPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class FlaskRestfulPlugin(FlaskPlugin):
-    """Small plugin override to handle flask-restful resources"""
 
-    @staticmethod
-    def _rule_for_view(view, app=None):
-        view_funcs = app.view_functions
-        endpoint = None
+def _render_json(spec: APISpec) -> bytes:
+    return jsonify(spec.to_dict()).get_data()
 
-        for ept, view_func in view_funcs.items():
-            if hasattr(view_func, "view_class"):
-                view_func = view_func.view_class
 
-            if view_func == view:
-                endpoint = ept
+def _render_yaml(spec: APISpec) -> bytes:
+    # Inject ReDoc's Authentication legend in a copy of the spec dict, the spec itself must not change.
+    spec_dict = dict(spec.to_dict())
+    spec_dict["tags"] = [
+        *spec_dict.get("tags", []),
+        {"name": "authentication", "x-displayName": "Authentication", "description": "<SecurityDefinitions />"},
+    ]
+    return dict_to_yaml(spec_dict).encode()
 
-        if not endpoint:
-            raise APISpecError("Could not find endpoint for view {0}".format(view))
 
-        # WARNING: Assume 1 rule per view function for now
-        rule = app.url_map._rules_by_endpoint[endpoint][0]
-        return rule
+# Renderer and mimetype of the spec documents.
+_RENDERERS: Dict[str, Tuple[Callable[[APISpec], bytes], str]] = {
+    "json": (_render_json, "application/json"),
+    "yaml": (_render_yaml, "text/html"),
+}
 
 
 class APISpecExt:
-    """Very simple and small extension to use apispec with this API as a flask extension"""
+    """Very simple and small extension to use apispec with this API as a flask extension
+
+    The spec is built on first access, by the builders registered with `register()`, so that parsing every resource
+    docstring does not slow down the application startup. The JSON and YAML documents are rendered once and served
+    from a cache, with an entity tag.
+    """
 
     def __init__(self, app=None, **kwargs):
-        self.spec = None
+        self._app = None
+        self._kwargs: Dict = {}
+        self._lock = threading.RLock()
+        self._spec: Optional[APISpec] = None
+        self._building: Optional[APISpec] = None
+        self._builders: List[Callable[[], None]] = []
+        self._rendered: Dict[str, Tuple[bytes, str]] = {}
 
         if app is not None:
             self.init_app(app, **kwargs)
@@ -58,13 +79,12 @@ class APISpecExt:
         app.config.setdefault("REDOC_UI_URL", "/redoc-ui")
         app.config.setdefault("SWAGGER_URL_PREFIX", None)
 
-        self.spec = APISpec(
-            title=app.config["APISPEC_TITLE"],
-            version=app.config["APISPEC_VERSION"],
-            openapi_version=app.config["OPENAPI_VERSION"],
-            plugins=[MarshmallowPlugin(), FlaskRestfulPlugin()],
-            **kwargs
-        )
+        with self._lock:
+            self._app = app
+            self._kwargs = kwargs
+            self._spec = None
+            self._builders = []
+            self._rendered = {}
 
         blueprint = Blueprint(
             "swagger",
@@ -80,24 +100,71 @@ class APISpecExt:
 
         app.register_blueprint(blueprint)
 
+    def register(self, builder: Callable[[], None]):
+        """Register a function adding components or paths to the spec, called within an application context when
+        the spec is first accessed."""
+        with self._lock:
+            self._builders.append(builder)
+            self._spec = None
+            self._rendered = {}
+
+    @property
+    def spec(self) -> Optional[APISpec]:
+        if self._spec is None and self._app is not None:
+            with self._lock:
+                if self._spec is None:
+                    if self._building is not None:
+                        # Accessed by a builder while the spec is being built.
+                        return self._building
+                    self._spec = self.__build()
+        return self._spec
+
+    def preload(self):
+        """Build the spec and render its documents now, instead of on first access."""
+        with self._app.app_context():
+            for name in _RENDERERS:
+                self.__rendered(name)
+
     def swagger_json(self):
-        return jsonify(self.spec.to_dict())
+        return self.__cached_response("json")
 
     def swagger_ui(self):
         return render_template("swagger.j2")
 
     def openapi_yaml(self):
-        # Manually inject ReDoc's Authentication legend, then remove it
-        self.spec.tag(
-            {
-                "name": "authentication",
-                "x-displayName": "Authentication",
-                "description": "<SecurityDefinitions />",
-            }
-        )
-        redoc_spec = self.spec.to_yaml()
-        self.spec._tags.pop(0)
-        return redoc_spec
+        return self.__cached_response("yaml")
 
     def redoc_ui(self):
         return render_template("redoc.j2")
+
+    def __build(self) -> APISpec:
+        from ._flask_restful_plugin import FlaskRestfulPlugin
+
+        self._building = APISpec(
+            title=self._app.config["APISPEC_TITLE"],
+            version=self._app.config["APISPEC_VERSION"],
+            openapi_version=self._app.config["OPENAPI_VERSION"],
+            plugins=[MarshmallowPlugin(), FlaskRestfulPlugin()],
+            **self._kwargs,
+        )
+        try:
+            with self._app.app_context():
+                for builder in self._builders:
+                    builder()
+            return self._building
+        finally:
+            self._building = None
+
+    def __rendered(self, name: str) -> Tuple[bytes, str]:
+        if (rendered := self._rendered.get(name)) is None:
+            with self._lock:
+                if (rendered := self._rendered.get(name)) is None:
+                    body = _RENDERERS[name][0](self.spec)
+                    rendered = self._rendered[name] = body, hashlib.sha1(body).hexdigest()
+        return rendered
+
+    def __cached_response(self, name: str) -> Response:
+        body, etag = self.__rendered(name)
+        response = Response(body, mimetype=_RENDERERS[name][1])
+        response.set_etag(etag)
+        return response.make_conditional(request)
@@ -0,0 +1,262 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Response compression negotiated from the `Accept-Encoding` request header, and request body decompression
+
+The `gzip` encoding is always available. The `br` and `zstd` encodings rely on the optional `brotli` and
+`zstandard` packages.
+"""
+
+import gzip
+import io
+import zlib
+from importlib import util
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flask import Response, request
+from werkzeug.exceptions import BadRequest, HTTPException, RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.http import parse_accept_header
+from werkzeug.wsgi import LimitedStream, get_content_length
+
+# Compress a chunk and flush it, finish the stream.
+_StreamCompressor = Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+_DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+_DEFAULT_MIMETYPES = ["application/json", "text/plain", "text/csv", "text/event-stream"]
+
+
+def _gzip(level: int) -> _StreamCompressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def _brotli(level: int) -> _StreamCompressor:
+    import brotli
+
+    compressor = brotli.Compressor(quality=level)
+    return lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish
+
+
+def _zstd(level: int) -> _StreamCompressor:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return (
+        lambda chunk: compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+        compressor.flush,
+    )
+
+
+_COMPRESSORS: Dict[str, Tuple[str, Callable[[int], _StreamCompressor]]] = {
+    "zstd": ("zstandard", _zstd),
+    "br": ("brotli", _brotli),
+    "gzip": ("zlib", _gzip),
+}
+
+
+def _available_encodings() -> List[str]:
+    return [encoding for encoding, (module, _) in _COMPRESSORS.items() if util.find_spec(module) is not None]
+
+
+class Compressor:
+    """Compress the responses with the best encoding accepted by the client.
+
+    The encodings are tried in the order of `COMPRESS_ENCODINGS`, among the ones whose package is installed, and
+    compressed with the levels of `COMPRESS_LEVELS`. Only the responses whose mimetype is in `COMPRESS_MIMETYPES` are
+    compressed, and only if they are larger than `COMPRESS_MIN_SIZE` bytes. Streamed responses, whose size is
+    unknown, are compressed chunk by chunk and each chunk is flushed, so that the client receives it immediately.
+    Responses supporting byte ranges are never compressed.
+    """
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.encodings: List[str] = []
+        self.levels: Dict[str, int] = dict(_DEFAULT_LEVELS)
+        self.mimetypes: List[str] = list(_DEFAULT_MIMETYPES)
+        self.min_size = 500
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("COMPRESS_ENABLED", True)
+        app.config.setdefault("COMPRESS_ENCODINGS", list(_COMPRESSORS))
+        app.config.setdefault("COMPRESS_LEVELS", {})
+        app.config.setdefault("COMPRESS_MIMETYPES", list(_DEFAULT_MIMETYPES))
+        app.config.setdefault("COMPRESS_MIN_SIZE", 500)
+
+        available = _available_encodings()
+        self.encodings = [encoding for encoding in app.config["COMPRESS_ENCODINGS"] if encoding in available]
+        self.levels = {**_DEFAULT_LEVELS, **app.config["COMPRESS_LEVELS"]}
+        self.mimetypes = list(app.config["COMPRESS_MIMETYPES"])
+        self.min_size = app.config["COMPRESS_MIN_SIZE"]
+        self.enabled = app.config["COMPRESS_ENABLED"]
+        if self.enabled and self.compress not in app.after_request_funcs.get(None, []):
+            app.after_request(self.compress)
+
+    def compress(self, response: Response) -> Response:
+        if not self.encodings or not self.__is_compressible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        compress_chunk, finish = _COMPRESSORS[encoding][1](self.levels[encoding])
+        if response.is_streamed:
+            response.response = self.__compress_stream(response.response, compress_chunk, finish)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(compress_chunk(data) + finish())
+        response.headers["Content-Encoding"] = encoding
+        if response.headers.get("ETag"):
+            # The compressed representation is not byte-for-byte the one the strong entity tag was computed on.
+            etag, _ = response.get_etag()
+            response.set_etag(etag, weak=True)
+        return response
+
+    def compress_body(self, data: bytes, mimetype: str, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Compress the body *data* of a successful response served outside of Flask.
+
+        Return the body and its encoding, None if it is not compressed.
+        """
+        if not self.enabled or not self.encodings or mimetype not in self.mimetypes or len(data) < self.min_size:
+            return data, None
+        if (encoding := parse_accept_header(accept_encoding).best_match(self.encodings)) is None:
+            return data, None
+        compress_chunk, finish = _COMPRESSORS[encoding][1](self.levels[encoding])
+        return compress_chunk(data) + finish(), encoding
+
+    def __is_compressible(self, response: Response) -> bool:
+        return (
+            200 <= response.status_code < 300
+            and response.status_code != 204
+            and response.mimetype in self.mimetypes
+            and not response.direct_passthrough
+            and "Content-Encoding" not in response.headers
+            and "Content-Range" not in response.headers
+            and "bytes" not in response.headers.get("Accept-Ranges", "")
+            and "no-transform" not in response.headers.get("Cache-Control", "")
+        )
+
+    @staticmethod
+    def __compress_stream(chunks: Iterable, compress_chunk: Callable, finish: Callable) -> Iterator[bytes]:
+        try:
+            for chunk in chunks:
+                if data := compress_chunk(chunk.encode() if isinstance(chunk, str) else chunk):
+                    yield data
+            yield finish()
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+
+def _gzip_reader(stream: IO[bytes]) -> IO[bytes]:
+    return gzip.GzipFile(fileobj=stream, mode="rb")
+
+
+def _zstd_reader(stream: IO[bytes]) -> IO[bytes]:
+    import zstandard
+
+    return zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True)
+
+
+_DECOMPRESSORS: Dict[str, Tuple[str, Callable[[IO[bytes]], IO[bytes]]]] = {
+    "zstd": ("zstandard", _zstd_reader),
+    "gzip": ("zlib", _gzip_reader),
+}
+
+
+class _DecompressedStream(io.RawIOBase):
+    """Decompress a request body as it is read, and stop reading beyond *max_size* decompressed bytes."""
+
+    def __init__(self, reader: IO[bytes], max_size: int):
+        self._reader = reader
+        self._max_size = max_size
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            # Reading one more byte than allowed tells a body of exactly max_size bytes from a larger one.
+            data = self._reader.read(min(len(buffer), self._max_size - self._size + 1))
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise BadRequest(f"Invalid compressed request body: {e}") from e
+        self._size += len(data)
+        if self._size > self._max_size:
+            raise RequestEntityTooLarge(f"Decompressed request body exceeds {self._max_size} bytes.")
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _decompressed_stream(stream: IO[bytes], encoding: str, max_size: int) -> IO[bytes]:
+    """Return a stream reading the body *stream* encoded with *encoding*, or raise `UnsupportedMediaType`."""
+    if (encoding := encoding.strip().lower()) not in _DECOMPRESSORS or (
+        util.find_spec(_DECOMPRESSORS[encoding][0]) is None
+    ):
+        raise UnsupportedMediaType(f"Unsupported request Content-Encoding: {encoding}.")
+    return io.BufferedReader(_DecompressedStream(_DECOMPRESSORS[encoding][1](stream), max_size))
+
+
+def _decompress(body: bytes, encoding: Optional[str], max_size: int) -> bytes:
+    """Return the decompressed *body*, unchanged if *encoding* is empty or `identity`."""
+    if not encoding or encoding.strip().lower() == "identity":
+        return body
+    return _decompressed_stream(io.BytesIO(body), encoding, max_size).read()
+
+
+class RequestDecompressor:
+    """Decompress the request bodies sent with a `Content-Encoding` header, `gzip` or `zstd`.
+
+    The bodies are decompressed as they are read by the endpoints, so large uploads are never held compressed and
+    decompressed at once. Reading more than `REQUEST_DECOMPRESSED_MAX_SIZE` decompressed bytes fails with a 413
+    error, which protects the server against decompression bombs.
+    """
+
+    def __init__(self, app=None):
+        self.max_size = 2 * 1024**3
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("REQUEST_DECOMPRESSED_MAX_SIZE", 2 * 1024**3)
+
+        self.max_size = app.config["REQUEST_DECOMPRESSED_MAX_SIZE"]
+        if not getattr(app.wsgi_app, "_taipy_decompression", False):
+            app.wsgi_app = self.__middleware(app.wsgi_app)
+
+    def __middleware(self, wsgi_app: Callable) -> Callable:
+        def _wsgi_app(environ: Dict, start_response: Callable):
+            encoding = environ.get("HTTP_CONTENT_ENCODING", "")
+            if encoding and encoding.strip().lower() != "identity":
+                try:
+                    stream = environ["wsgi.input"]
+                    if "wsgi.input_terminated" not in environ and (length := get_content_length(environ)) is not None:
+                        stream = LimitedStream(stream, length)
+                    environ["wsgi.input"] = _decompressed_stream(stream, encoding, self.max_size)
+                except HTTPException as e:
+                    return e(environ, start_response)
+                # The decompressed length is unknown: the decompressed stream is read until its end instead.
+                environ.pop("CONTENT_LENGTH", None)
+                environ.pop("HTTP_CONTENT_ENCODING", None)
+                environ["wsgi.input_terminated"] = True
+            return wsgi_app(environ, start_response)
+
+        _wsgi_app._taipy_decompression = True  # type: ignore
+        return _wsgi_app
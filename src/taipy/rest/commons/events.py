@@ -0,0 +1,193 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Relay of Core events to the REST clients"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.status import Status
+from taipy.core.notification import CoreEventConsumerBase, EventEntityType, EventOperation, Notifier
+from taipy.core.notification.event import Event
+from taipy.logger._taipy_logger import _TaipyLogger
+
+
+class _EventConsumer(CoreEventConsumerBase):
+    def __init__(self, registration_id: str, queue, process: Callable[[Event], None]):
+        super().__init__(registration_id, queue)
+        self.registration_id = registration_id
+        self._process = process
+
+    def process_event(self, event: Event):
+        self._process(event)
+
+
+class EventBroker:
+    """Consume Core events in a background thread and keep the last ones in a bounded ring buffer.
+
+    Every recorded event gets a strictly increasing id, so that clients can resume from the last event they received.
+    Consumers either wait for new events with `wait()` or register a listener called for every recorded event.
+    """
+
+    _BUFFER_SIZE_CONFIG_KEY = "EVENTS_BUFFER_SIZE"
+    _DEFAULT_BUFFER_SIZE = 1000
+
+    def __init__(self, entity_type: Optional[EventEntityType] = None, app=None):
+        self._entity_type = entity_type
+        self._logger = _TaipyLogger._get_logger()
+        self._condition = threading.Condition()
+        self._buffer: Deque[Dict] = deque(maxlen=self._DEFAULT_BUFFER_SIZE)
+        self._last_id = 0
+        self._listeners: List[Callable[[Dict], None]] = []
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._consumer: Optional[_EventConsumer] = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault(self._BUFFER_SIZE_CONFIG_KEY, self._DEFAULT_BUFFER_SIZE)
+        with self._condition:
+            if self._consumer is not None:
+                if self._consumer.is_alive():
+                    return
+                # The consumer thread does not survive a fork, a new one is registered in the child process.
+                Notifier.unregister(self._consumer.registration_id)
+            self._buffer = deque(self._buffer, maxlen=app.config[self._BUFFER_SIZE_CONFIG_KEY])
+            registration_id, queue = Notifier.register(entity_type=self._entity_type)
+            self._consumer = _EventConsumer(registration_id, queue, self._process)
+            self._consumer.start()
+
+    def add_listener(self, listener: Callable[[Dict], None]):
+        with self._condition:
+            self._listeners.append(listener)
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def events_since(self, last_id: int) -> List[Dict]:
+        """Return the buffered events more recent than *last_id*, oldest first."""
+        with self._condition:
+            return self.__events_since(last_id)
+
+    def wait(self, last_id: int, timeout: Optional[float]) -> List[Dict]:
+        """Wait at most *timeout* seconds for events more recent than *last_id* and return them, oldest first."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._last_id > last_id, timeout)
+            return self.__events_since(last_id)
+
+    async def wait_async(self, last_id: int, timeout: Optional[float]) -> List[Dict]:
+        """Coroutine version of `wait()`, waiting without blocking a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            if self._last_id > last_id:
+                return self.__events_since(last_id)
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+        return self.events_since(last_id)
+
+    def _to_record(self, event: Event) -> Optional[Dict]:
+        return {
+            "entity_type": event.entity_type.name,
+            "entity_id": event.entity_id,
+            "operation": event.operation.name,
+            "attribute_name": event.attribute_name,
+            "timestamp": event.creation_date.isoformat(),
+        }
+
+    def _process(self, event: Event):
+        try:
+            record = self._to_record(event)
+        except Exception as e:
+            self._logger.error(f"Could not process event on {event.entity_id}: {e}")
+            return
+        if record is None:
+            return
+
+        with self._condition:
+            self._last_id += 1
+            record["id"] = self._last_id
+            self._buffer.append(record)
+            listeners = list(self._listeners)
+            self._condition.notify_all()
+            for loop, waiter in self._async_waiters:
+                try:
+                    loop.call_soon_threadsafe(waiter.set)
+                except RuntimeError:
+                    # The event loop of the waiter is closed.
+                    pass
+        for listener in listeners:
+            listener(record)
+
+    def __events_since(self, last_id: int) -> List[Dict]:
+        if last_id >= self._last_id:
+            return []
+        # Events older than the buffer are lost: the client receives all the buffered ones.
+        start = max(0, len(self._buffer) - (self._last_id - last_id))
+        return [self._buffer[i] for i in range(start, len(self._buffer))]
+
+
+class EntityEventBroker(EventBroker):
+    """Relay the creations, updates, deletions and submissions of all the Core entities."""
+
+    _BUFFER_SIZE_CONFIG_KEY = "ENTITY_EVENTS_BUFFER_SIZE"
+    _DEFAULT_BUFFER_SIZE = 10000
+
+    def __init__(self, app=None):
+        super().__init__(None, app)
+
+
+class JobEventBroker(EventBroker):
+    """Relay the job creations, status changes and deletions published by the Core service."""
+
+    _BUFFER_SIZE_CONFIG_KEY = "JOB_EVENTS_BUFFER_SIZE"
+
+    def __init__(self, app=None):
+        super().__init__(EventEntityType.JOB, app)
+
+    def _to_record(self, event: Event) -> Optional[Dict]:
+        if event.operation == EventOperation.UPDATE and event.attribute_name != "status":
+            return None
+        record = super()._to_record(event)
+        record.update({"status": None, "task_config_id": None, "submission_id": None, "scenario_ids": []})
+        if event.operation == EventOperation.DELETION:
+            return record
+
+        # The Core versions publishing the new status with the event give the status the job changed to, which the
+        # job read from the repository may already have left.
+        status = getattr(event, "attribute_value", None) if event.operation == EventOperation.UPDATE else None
+        if status is not None:
+            record["status"] = status.name if isinstance(status, Status) else str(status)
+        job = _JobManagerFactory._build_manager()._get(event.entity_id)
+        if job is None:
+            return record
+        scenario_ids = {parent_id for parent_id in job.task.parent_ids if parent_id.startswith("SCENARIO_")}
+        if job.submit_entity_id.startswith("SCENARIO_"):
+            scenario_ids.add(job.submit_entity_id)
+        record.update(
+            {
+                "status": record["status"] or job._status.name,
+                "task_config_id": job.task.config_id,
+                "submission_id": job.submit_id,
+                "scenario_ids": sorted(scenario_ids),
+            }
+        )
+        return record
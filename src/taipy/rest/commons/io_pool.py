@@ -0,0 +1,88 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Bounded thread pool running the blocking data node I/O"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class IOPool:
+    """Run blocking I/O on a dedicated pool of `DATANODE_IO_MAX_WORKERS` threads.
+
+    At most `DATANODE_IO_MAX_QUEUE` calls wait for a free thread. Beyond that, the calls are rejected so that a burst
+    of heavy reads or writes cannot hold every request thread. The rejected calls should be retried after
+    `DATANODE_IO_RETRY_AFTER` seconds.
+    Since a request thread waits for the I/O it submits, the calls admitted must leave request threads free: by
+    default, the pool runs one call less than the request threads of a worker of the production server, and no call
+    waits.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self.max_workers = 3
+        self.max_queue = 0
+        self.retry_after = 1
+        self._metrics: Dict[str, int] = {"running": 0, "rejected": 0}
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        from .server import _request_threads
+
+        app.config.setdefault("DATANODE_IO_MAX_WORKERS", max(_request_threads() - 1, 1))
+        app.config.setdefault("DATANODE_IO_MAX_QUEUE", 0)
+        app.config.setdefault("DATANODE_IO_RETRY_AFTER", 1)
+
+        with self._lock:
+            max_workers, max_queue = app.config["DATANODE_IO_MAX_WORKERS"], app.config["DATANODE_IO_MAX_QUEUE"]
+            if self._executor is not None and (max_workers, max_queue) != (self.max_workers, self.max_queue):
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self.max_workers, self.max_queue = max_workers, max_queue
+            self.retry_after = app.config["DATANODE_IO_RETRY_AFTER"]
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def submit(self, function: Callable, *args) -> Optional[Future]:
+        """Schedule *function* on the pool, or return None when the pool and its queue are full."""
+        with self._lock:
+            if self._executor is None:
+                # Created on first use so that forked worker processes do not inherit the threads of their parent.
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="Thread-Taipy-Rest-IO")
+                self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+            executor, slots = self._executor, self._slots
+        if not slots.acquire(blocking=False):
+            with self._lock:
+                self._metrics["rejected"] += 1
+            return None
+        with self._lock:
+            self._metrics["running"] += 1
+
+        def _release(_):
+            slots.release()
+            with self._lock:
+                self._metrics["running"] -= 1
+
+        try:
+            future = executor.submit(function, *args)
+        except BaseException:
+            _release(None)
+            raise
+        future.add_done_callback(_release)
+        return future
@@ -0,0 +1,167 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Retention policy of the finished jobs"""
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from taipy.core import Job
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.status import Status
+from taipy.logger._taipy_logger import _TaipyLogger
+
+_PRUNABLE_STATUSES = {
+    status.name for status in (Status.COMPLETED, Status.SKIPPED, Status.FAILED, Status.CANCELED, Status.ABANDONED)
+}
+
+
+class JobPruner:
+    """Delete, and optionally archive, the finished jobs exceeding the retention policy.
+
+    The policy is read from the `JOB_RETENTION` application config. It maps finished statuses to a maximum age in
+    seconds (`max_age`) and/or a maximum number of jobs (`max_count`), for instance
+    `{"COMPLETED": {"max_age": 86400}, "FAILED": {"max_count": 1000}}`. When the policy is not empty, a background
+    thread prunes the jobs every `JOB_RETENTION_INTERVAL` seconds, by batches of `JOB_RETENTION_BATCH_SIZE` jobs.
+    If `JOB_RETENTION_ARCHIVE_FOLDER` is set, the jobs are exported in this folder before being deleted.
+    Only one process of a production server runs the background thread: the worker processes `detach` from it.
+    """
+
+    def __init__(self, app=None):
+        self._logger = _TaipyLogger._get_logger()
+        self._lock = threading.Lock()
+        # Held while pruning, so that the background thread and an on-demand run never delete the same jobs.
+        self._pruning = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._background = True
+        self.policy: Dict[str, Dict[str, float]] = {}
+        self.interval = 300.0
+        self.batch_size = 500
+        self.archive_folder: Optional[str] = None
+        self._metrics: Dict = {
+            "runs": 0,
+            "errors": 0,
+            "pruned": Counter(),
+            "archived": 0,
+            "last_run": None,
+            "last_run_duration": None,
+        }
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("JOB_RETENTION", {})
+        app.config.setdefault("JOB_RETENTION_INTERVAL", 300)
+        app.config.setdefault("JOB_RETENTION_BATCH_SIZE", 500)
+        app.config.setdefault("JOB_RETENTION_ARCHIVE_FOLDER", None)
+
+        policy = {status.upper(): rules for status, rules in app.config["JOB_RETENTION"].items()}
+        if invalid := policy.keys() - _PRUNABLE_STATUSES:
+            raise ValueError(f"Job retention policy on unfinished or unknown statuses: {', '.join(sorted(invalid))}.")
+        for status, rules in policy.items():
+            if not rules or rules.keys() - {"max_age", "max_count"}:
+                raise ValueError(f"Job retention policy of {status} expects max_age and/or max_count.")
+
+        with self._lock:
+            self.policy = policy
+            self.interval = app.config["JOB_RETENTION_INTERVAL"]
+            self.batch_size = app.config["JOB_RETENTION_BATCH_SIZE"]
+            self.archive_folder = app.config["JOB_RETENTION_ARCHIVE_FOLDER"]
+            if self.policy and self._background and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(target=self.__run, name="Thread-Taipy-Rest-Job-Pruner", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def detach(self):
+        """Never prune in the background in this process, forked from the process pruning the jobs.
+
+        The locks are recreated, since the forking process may have held them while pruning.
+        """
+        self._background = False
+        self._lock = threading.Lock()
+        self._pruning = threading.Lock()
+
+    @property
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {**self._metrics, "pruned": dict(self._metrics["pruned"])}
+
+    def prune(self) -> Dict[str, int]:
+        """Prune the jobs exceeding the retention policy now, and return the number of jobs pruned by status.
+
+        A run waits for the one in progress, if any, to finish.
+        """
+        with self._pruning:
+            return self.__prune()
+
+    def __prune(self) -> Dict[str, int]:
+        started = time.perf_counter()
+        pruned: Counter = Counter()
+        archived, errors = 0, 0
+        manager = _JobManagerFactory._build_manager()
+        jobs = self.__jobs_to_prune(manager._get_all())
+        for start in range(0, len(jobs), self.batch_size):
+            if self._stop.is_set():
+                break
+            for job in jobs[start : start + self.batch_size]:
+                try:
+                    if self.archive_folder:
+                        manager._export(job.id, self.archive_folder)
+                        archived += 1
+                    manager._delete(job)
+                    pruned[job._status.name] += 1
+                except Exception as e:
+                    errors += 1
+                    self._logger.error(f"Could not prune {job.id}: {e}")
+
+        with self._lock:
+            self._metrics["runs"] += 1
+            self._metrics["errors"] += errors
+            self._metrics["archived"] += archived
+            self._metrics["pruned"].update(pruned)
+            self._metrics["last_run"] = datetime.now().isoformat()
+            self._metrics["last_run_duration"] = time.perf_counter() - started
+        if pruned:
+            self._logger.info(f"Pruned {sum(pruned.values())} jobs: {dict(pruned)}.")
+        return dict(pruned)
+
+    def __jobs_to_prune(self, jobs: List[Job]) -> List[Job]:
+        # Private attributes are read to avoid reloading every job from the repository.
+        by_status: Dict[str, List[Job]] = {status: [] for status in self.policy}
+        for job in jobs:
+            if (status := job._status.name) in by_status:
+                by_status[status].append(job)
+
+        now = datetime.now()
+        to_prune = []
+        for status, rules in self.policy.items():
+            status_jobs = sorted(by_status[status], key=lambda job: job._creation_date, reverse=True)
+            if (max_count := rules.get("max_count")) is not None:
+                to_prune.extend(status_jobs[int(max_count) :])
+                status_jobs = status_jobs[: int(max_count)]
+            if (max_age := rules.get("max_age")) is not None:
+                oldest = now - timedelta(seconds=max_age)
+                to_prune.extend(job for job in status_jobs if job._creation_date < oldest)
+        return sorted(to_prune, key=lambda job: job._creation_date)
+
+    def __run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.prune()
+            except Exception as e:
+                self._logger.error(f"Job pruning failed: {e}")
@@ -0,0 +1,116 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Job counters maintained from the job events"""
+
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+
+# Status, task config id and submission id of a job.
+_JobState = Tuple[str, str, str]
+
+
+class JobCounters:
+    """Count the jobs by status, task config and submission.
+
+    The counters are built with a single scan of the jobs on first use, then kept up to date by the job events relayed
+    by the job event broker, so that reading them never scans the jobs again.
+    """
+
+    def __init__(self, broker, app=None):
+        self._broker = broker
+        self._lock = threading.Lock()
+        self._registered = False
+        self.reset()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        with self._lock:
+            if not self._registered:
+                self._broker.add_listener(self._on_event)
+                self._registered = True
+
+    def reset(self):
+        """Drop the counters, they are rebuilt from the jobs on next use."""
+        with self._lock:
+            self._jobs: Optional[Dict[str, _JobState]] = None
+            self._by_status: Counter = Counter()
+            self._by_task_config: Dict[str, Counter] = {}
+            self._by_submission: Dict[str, Counter] = {}
+
+    def get(self, group_by: Iterable[str] = ("task_config", "submission")) -> Dict:
+        """Return the counts by status, and by status within each task config or submission of *group_by*."""
+        self.__build()
+        with self._lock:
+            counts = {"total": sum(self._by_status.values()), "by_status": dict(self._by_status)}
+            if "task_config" in group_by:
+                counts["by_task_config"] = {key: dict(counter) for key, counter in self._by_task_config.items()}
+            if "submission" in group_by:
+                counts["by_submission"] = {key: dict(counter) for key, counter in self._by_submission.items()}
+            return counts
+
+    def _on_event(self, event: Dict):
+        with self._lock:
+            if self._jobs is None:
+                # Not built yet: the event is replayed from the broker buffer when the counters are built.
+                return
+            self.__apply(event)
+
+    def __build(self):
+        if self._jobs is not None:
+            return
+        last_id = self._broker.last_id
+        jobs = _JobManagerFactory._build_manager()._get_all()
+        with self._lock:
+            if self._jobs is not None:
+                return
+            self._jobs = {}
+            for job in jobs:
+                self.__set(job.id, (job.status.name, job.task.config_id, job.submit_id))
+            # Applying an event is idempotent: replaying the ones already seen by the scan is harmless.
+            for event in self._broker.events_since(last_id):
+                self.__apply(event)
+
+    def __apply(self, event: Dict):
+        if event["operation"] == "DELETION":
+            if event["entity_id"] in self._jobs:
+                self.__set(event["entity_id"], None)
+            elif not str(event["entity_id"]).startswith("JOB_"):
+                # Several jobs were deleted at once, the counters are rebuilt on next use.
+                self._jobs = None
+                self._by_status, self._by_task_config, self._by_submission = Counter(), {}, {}
+        elif event["status"]:
+            self.__set(event["entity_id"], (event["status"], event["task_config_id"], event["submission_id"]))
+
+    def __set(self, job_id: str, state: Optional[_JobState]):
+        if previous := self._jobs.pop(job_id, None):
+            self.__count(previous, -1)
+        if state:
+            self._jobs[job_id] = state
+            self.__count(state, 1)
+
+    def __count(self, state: _JobState, increment: int):
+        status, task_config_id, submit_id = state
+        self._by_status[status] += increment
+        for counters, key in ((self._by_task_config, task_config_id), (self._by_submission, submit_id)):
+            counter = counters.setdefault(key, Counter())
+            counter[status] += increment
+            if counter[status] == 0:
+                del counter[status]
+            if not counter:
+                del counters[key]
+        if self._by_status[status] == 0:
+            del self._by_status[status]
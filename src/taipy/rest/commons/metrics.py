@@ -0,0 +1,230 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Request and data node I/O metrics, exposed in the Prometheus text format"""
+
+import bisect
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from flask import Blueprint, Response, g, request
+
+# Metric name and sorted label pairs.
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+# Type, help and histogram buckets of each metric.
+_METRICS: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {
+    "taipy_rest_requests_total": ("counter", "Number of requests by endpoint, method and status.", ()),
+    "taipy_rest_request_duration_seconds": (
+        "histogram",
+        "Duration of the requests until their response is returned, by endpoint, method and status.",
+        _DURATION_BUCKETS,
+    ),
+    "taipy_rest_response_size_bytes": (
+        "histogram",
+        "Size of the responses whose length is known, before compression, by endpoint.",
+        _SIZE_BUCKETS,
+    ),
+    "taipy_rest_requests_in_flight": ("gauge", "Number of requests being served.", ()),
+    "taipy_rest_datanode_io_bytes_total": (
+        "counter",
+        "Bytes read from or written to the data nodes, by operation and storage type.",
+        (),
+    ),
+    "taipy_rest_datanode_io_duration_seconds": (
+        "histogram",
+        "Duration of the data node reads and writes, by operation and storage type.",
+        _DURATION_BUCKETS,
+    ),
+}
+
+
+class _Store:
+    """Metric values updated by a single thread."""
+
+    __slots__ = ("values", "histograms")
+
+    def __init__(self):
+        self.values: Dict[_Key, float] = {}
+        # Count of each bucket (not cumulative) followed by the sum and the count of the observations.
+        self.histograms: Dict[_Key, List[float]] = {}
+
+    def merge(self, other: "_Store"):
+        for key, value in list(other.values.items()):
+            self.values[key] = self.values.get(key, 0) + value
+        for key, counts in list(other.histograms.items()):
+            if (merged := self.histograms.get(key)) is None:
+                self.histograms[key] = list(counts)
+            else:
+                for i, count in enumerate(list(counts)):
+                    merged[i] += count
+
+
+class Metrics:
+    """Collect the metrics of the requests served by the `api` blueprint and of the data node I/O.
+
+    Each thread updates its own store, so that recording a metric never takes a lock. The stores are only merged when
+    the metrics are exposed, on `METRICS_URL` (`/metrics` by default). The stores of the threads that ended are merged
+    once into a single one. The metrics are those of the current process: each worker process of the production server
+    exposes its own.
+    """
+
+    def __init__(self, app=None):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stores: List[Tuple[weakref.ref, _Store]] = []
+        self._retired = _Store()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("METRICS_ENABLED", True)
+        app.config.setdefault("METRICS_URL", "/metrics")
+
+        if app.config["METRICS_ENABLED"] and "metrics" not in app.view_functions:
+            app.add_url_rule(app.config["METRICS_URL"], "metrics", self.expose)
+
+    def register(self, blueprint: Blueprint):
+        """Record the metrics of the requests served by *blueprint*."""
+        blueprint.before_request(self._before_request)
+        blueprint.after_request(self._after_request)
+        blueprint.teardown_request(self._teardown_request)
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1):
+        values = self.__store().values
+        key = (name, tuple(sorted(labels.items())))
+        values[key] = values.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float):
+        histograms = self.__store().histograms
+        key = (name, tuple(sorted(labels.items())))
+        buckets = _METRICS[name][2]
+        if (counts := histograms.get(key)) is None:
+            counts = histograms[key] = [0] * (len(buckets) + 3)
+        counts[bisect.bisect_left(buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+    def observe_data_node_io(self, operation: str, storage_type: str, started: float, size: Optional[int]):
+        labels = {"operation": operation, "storage_type": storage_type}
+        self.observe("taipy_rest_datanode_io_duration_seconds", labels, time.perf_counter() - started)
+        if size is not None:
+            self.inc("taipy_rest_datanode_io_bytes_total", labels, size)
+
+    def collect(self) -> _Store:
+        """Return the metric values of all the threads."""
+        collected = _Store()
+        with self._lock:
+            collected.merge(self._retired)
+            for _, store in self._stores:
+                collected.merge(store)
+        return collected
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        collected = self.collect()
+        lines = []
+        for name, (metric_type, help_text, buckets) in _METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type == "histogram":
+                for (metric, labels), counts in sorted(collected.histograms.items()):
+                    if metric == name:
+                        lines.extend(self.__render_histogram(name, labels, buckets, counts))
+            else:
+                for (metric, labels), value in sorted(collected.values.items()):
+                    if metric == name:
+                        lines.append(f"{name}{self.__render_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def expose(self):
+        return Response(self.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+    def _before_request(self):
+        # The operations of a batch are nested requests sharing `g`: each request pushes its start time on a stack.
+        g.setdefault("taipy_metrics", []).append([request._get_current_object(), time.perf_counter()])
+        self.inc("taipy_rest_requests_in_flight", {})
+
+    def _after_request(self, response: Response) -> Response:
+        self.__record(response.status_code, response.content_length)
+        return response
+
+    def _teardown_request(self, exception: Optional[BaseException]):
+        if (measured := self.__measured()) is None:
+            return
+        if measured[1] is not None:
+            # The response was not returned, the request failed with an unhandled exception.
+            self.__record(500, None)
+        g.taipy_metrics.pop()
+        self.inc("taipy_rest_requests_in_flight", {}, -1)
+
+    def observe_request(self, endpoint: str, method: str, status: int, started: float, size: Optional[int]):
+        """Record a request served, started at the `time.perf_counter()` value *started*."""
+        labels = {"endpoint": endpoint, "method": method, "status": str(status)}
+        self.inc("taipy_rest_requests_total", labels)
+        self.observe("taipy_rest_request_duration_seconds", labels, time.perf_counter() - started)
+        if size is not None:
+            self.observe("taipy_rest_response_size_bytes", {"endpoint": endpoint}, size)
+
+    def __record(self, status: int, size: Optional[int]):
+        if (measured := self.__measured()) is None or (started := measured[1]) is None:
+            return
+        measured[1] = None
+        self.observe_request((request.endpoint or "unknown").rsplit(".", 1)[-1], request.method, status, started, size)
+
+    @staticmethod
+    def __measured() -> Optional[List]:
+        """Return the request and start time, None once recorded, of the current request, if it is measured."""
+        if (measured := g.get("taipy_metrics")) and measured[-1][0] is request._get_current_object():
+            return measured[-1]
+        return None
+
+    def __store(self) -> _Store:
+        if (store := getattr(self._local, "store", None)) is None:
+            store = self._local.store = _Store()
+            with self._lock:
+                alive = []
+                for thread, thread_store in self._stores:
+                    if (owner := thread()) is not None and owner.is_alive():
+                        alive.append((thread, thread_store))
+                    else:
+                        self._retired.merge(thread_store)
+                alive.append((weakref.ref(threading.current_thread()), store))
+                self._stores = alive
+        return store
+
+    @staticmethod
+    def __render_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        escaped = (
+            (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in labels
+        )
+        return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+    @classmethod
+    def __render_histogram(
+        cls, name: str, labels: Tuple[Tuple[str, str], ...], buckets: Tuple[float, ...], counts: List[float]
+    ) -> List[str]:
+        lines = []
+        cumulative = 0.0
+        for bound, count in zip((*(f"{bucket:g}" for bucket in buckets), "+Inf"), counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{cls.__render_labels((*labels, ('le', bound)))} {cumulative:g}")
+        lines.append(f"{name}_sum{cls.__render_labels(labels)} {counts[-2]:g}")
+        lines.append(f"{name}_count{cls.__render_labels(labels)} {counts[-1]:g}")
+        return lines
@@ -0,0 +1,185 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Sampling profiler of the threads serving requests, run on demand from `/admin/profile`"""
+
+import io
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from flask import Blueprint, Response, abort, g, request
+
+from .admin import _admin_required
+
+# File name, first line number and name of the code of a frame, as keyed by `pstats`.
+_Function = Tuple[str, int, str]
+# Endpoint served, followed by the functions of the stack from the outermost one.
+_Stack = Tuple[str, ...]
+
+
+def _function(frame) -> _Function:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _collapsed(samples: Dict[Tuple, int]) -> str:
+    """Return the samples in the collapsed stack format read by flame graph tools."""
+    lines = []
+    for (endpoint, *functions), count in sorted(samples.items()):
+        frames = [endpoint, *(f"{name} ({os.path.basename(file)}:{line})" for file, line, name in functions)]
+        lines.append(f"{';'.join(frame.replace(';', ':') for frame in frames)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def _pstats(samples: Dict[Tuple, int], interval: float) -> bytes:
+    """Return the samples as a `pstats` dump, each sample accounting for *interval* seconds.
+
+    The endpoint of each sample is the caller of its outermost function, so that `pstats` attributes the time to the
+    endpoints.
+    """
+    stats: Dict[_Function, List] = {}
+
+    def entry(function: _Function) -> List:
+        if (found := stats.get(function)) is None:
+            # Primitive calls, calls, own time, cumulative time and calls by caller.
+            found = stats[function] = [0, 0, 0.0, 0.0, Counter()]
+        return found
+
+    for (endpoint, *functions), count in samples.items():
+        stack: List[_Function] = [("~", 0, f"<{endpoint}>"), *functions]
+        for caller, callee in zip(stack, stack[1:]):
+            entry(callee)[4][caller] += count
+        for function in set(stack):
+            values = entry(function)
+            values[0] += count
+            values[1] += count
+            values[3] += count * interval
+        entry(stack[-1])[2] += count * interval
+
+    buffer = io.BytesIO()
+    marshal.dump(
+        {function: (cc, nc, tt, ct, dict(callers)) for function, (cc, nc, tt, ct, callers) in stats.items()}, buffer
+    )
+    return buffer.getvalue()
+
+
+class Profiler:
+    """Sample the stacks of the threads serving requests of the `api` blueprint, on demand.
+
+    `GET /admin/profile?seconds=10&interval=0.01&format=collapsed` samples the stack of each thread serving a request
+    every *interval* seconds, for *seconds* seconds (at most `PROFILE_MAX_SECONDS`), and returns the samples grouped
+    by endpoint, either in the collapsed stack format of flame graph tools or as a `pstats` dump (`format=pstats`).
+    The data node I/O run on behalf of a request is attributed to its endpoint.
+
+    The endpoint is protected by `ADMIN_TOKEN`, and only one profile runs at a time. Only the threads of the process
+    serving the profile request are sampled.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        # Endpoint served by each thread, by thread identifier.
+        self._threads: Dict[int, str] = {}
+        self.max_seconds = 60
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("PROFILE_MAX_SECONDS", 60)
+
+        self.max_seconds = app.config["PROFILE_MAX_SECONDS"]
+        if "admin_profile" not in app.view_functions:
+            app.add_url_rule("/admin/profile", "admin_profile", _admin_required(self.profile))
+
+    def register(self, blueprint: Blueprint):
+        """Attribute the samples of the threads serving *blueprint* to their endpoint."""
+        blueprint.before_request(self._before_request)
+        blueprint.teardown_request(self._teardown_request)
+
+    def attributed(self, function: Callable) -> Callable:
+        """Return *function*, attributing its samples to the endpoint served by the calling thread."""
+        if (endpoint := self._threads.get(threading.get_ident())) is None:
+            return function
+
+        def _attributed(*args, **kwargs):
+            ident = threading.get_ident()
+            self._threads[ident] = endpoint
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._threads.pop(ident, None)
+
+        return _attributed
+
+    def sample(self, seconds: float, interval: float) -> Optional[Dict[_Stack, int]]:
+        """Return the number of samples of each stack, or None if a profile is already running."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        samples: Counter = Counter()
+        try:
+            deadline = time.monotonic() + seconds
+            while (now := time.monotonic()) < deadline:
+                frames = sys._current_frames()
+                for ident, endpoint in list(self._threads.items()):
+                    frame = frames.get(ident)
+                    stack = []
+                    while frame is not None:
+                        stack.append(_function(frame))
+                        frame = frame.f_back
+                    if stack:
+                        samples[(endpoint, *reversed(stack))] += 1
+                del frames
+                time.sleep(max(0.0, interval - (time.monotonic() - now)))
+        finally:
+            self._lock.release()
+        return samples
+
+    def profile(self):
+        try:
+            seconds = float(request.args.get("seconds", 10))
+            interval = float(request.args.get("interval", 0.01))
+        except ValueError:
+            abort(400, "The seconds and interval parameters must be numbers.")
+        output = request.args.get("format", "collapsed")
+        if not 0 < seconds <= self.max_seconds or not 0.001 <= interval <= seconds:
+            abort(400, f"The profile must last between 0 and {self.max_seconds} seconds, sampled every 1ms or more.")
+        if output not in ("collapsed", "pstats"):
+            abort(400, "The format must be collapsed or pstats.")
+
+        samples = self.sample(seconds, interval)
+        if samples is None:
+            abort(409, "A profile is already running.")
+        if output == "pstats":
+            response = Response(_pstats(samples, interval), mimetype="application/octet-stream")
+            response.headers["Content-Disposition"] = "attachment; filename=profile.pstats"
+            return response
+        return Response(_collapsed(samples), mimetype="text/plain")
+
+    def _before_request(self):
+        ident = threading.get_ident()
+        # The operations of a batch are nested requests sharing `g`: each request pushes the endpoint the thread was
+        # serving, restored when it ends.
+        g.setdefault("taipy_profiled", []).append((request._get_current_object(), self._threads.get(ident)))
+        self._threads[ident] = (request.endpoint or "unknown").rsplit(".", 1)[-1]
+
+    def _teardown_request(self, exception: Optional[BaseException]):
+        if not (profiled := g.get("taipy_profiled")) or profiled[-1][0] is not request._get_current_object():
+            return
+        _, previous = profiled.pop()
+        if previous is None:
+            self._threads.pop(threading.get_ident(), None)
+        else:
+            self._threads[threading.get_ident()] = previous
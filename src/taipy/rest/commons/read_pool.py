@@ -0,0 +1,114 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Process pool reading, filtering and serializing large data nodes"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from taipy.core._entity._reload import _Reloader
+from taipy.core.data._abstract_file import _AbstractFileDataNode
+from taipy.core.data._abstract_sql import _AbstractSQLDataNode
+from taipy.core.data.data_node import DataNode
+
+from .encoder import _CustomEncoder
+
+
+def _to_serializable(data: Any) -> Any:
+    if isinstance(data, pd.DataFrame):
+        return data.to_dict(orient="records")
+    if isinstance(data, np.ndarray):
+        return list(data)
+    return data
+
+
+def _read_to_file(data_node: DataNode, operators: List, folder: Optional[str]) -> str:
+    """Read and filter the data node, and write the JSON response body in a temporary file returned by path."""
+    # The data node was loaded by the parent process, it must not be reloaded from the repository.
+    with _Reloader():
+        data = _to_serializable(data_node.filter(operators))
+    with tempfile.NamedTemporaryFile("w", suffix=".json", dir=folder, delete=False) as file:
+        json.dump({"data": data}, file, cls=_CustomEncoder)
+    return file.name
+
+
+class ReadProcessPool:
+    """Read the large data nodes in a pool of `DATANODE_READ_PROCESSES` worker processes.
+
+    Filtering and serializing a large data frame holds the GIL, so it stalls every other request served by the same
+    process. When the pool is enabled, the file based data nodes of at least `DATANODE_READ_PROCESS_MIN_SIZE` bytes
+    and the SQL data nodes are read, filtered and serialized to JSON by a worker process. The response body is
+    passed back through a temporary file created in `DATANODE_READ_PROCESS_FOLDER` (the system default if None).
+
+    The pool is disabled by default (`DATANODE_READ_PROCESSES` is 0).
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.processes = 0
+        self.min_size = 10 * 1024 * 1024
+        self.folder: Optional[str] = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("DATANODE_READ_PROCESSES", 0)
+        app.config.setdefault("DATANODE_READ_PROCESS_MIN_SIZE", 10 * 1024 * 1024)
+        app.config.setdefault("DATANODE_READ_PROCESS_FOLDER", None)
+
+        with self._lock:
+            if self._executor is not None and app.config["DATANODE_READ_PROCESSES"] != self.processes:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self.processes = app.config["DATANODE_READ_PROCESSES"]
+            self.min_size = app.config["DATANODE_READ_PROCESS_MIN_SIZE"]
+            self.folder = app.config["DATANODE_READ_PROCESS_FOLDER"]
+
+    def accepts(self, data_node: DataNode) -> bool:
+        """Return True if the pool is enabled and *data_node* is large enough to be read by a worker process."""
+        if not self.processes:
+            return False
+        if isinstance(data_node, _AbstractSQLDataNode):
+            return True
+        if isinstance(data_node, _AbstractFileDataNode):
+            path = data_node.path
+            return os.path.isfile(path) and os.path.getsize(path) >= self.min_size
+        return False
+
+    def read(self, data_node: DataNode, operators: List) -> bytes:
+        """Return the JSON response body of the data of *data_node* filtered by *operators*."""
+        with self._lock:
+            if self._executor is None:
+                # Worker processes are spawned rather than forked, the parent process runs many threads.
+                self._executor = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context("spawn"))
+            executor = self._executor
+        path = executor.submit(_read_to_file, data_node, operators, self.folder).result()
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        finally:
+            os.remove(path)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,143 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Production server running the REST application in several worker processes
+
+The server relies on the optional `gunicorn` package.
+"""
+
+import gc
+from importlib import util
+from typing import Any, Callable, Dict, Tuple
+
+from taipy.config import Config
+from taipy.core._version._version_manager_factory import _VersionManagerFactory
+from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.sequence._sequence_manager_factory import _SequenceManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from ..app import _serves_entity_events
+from ..extensions import apispec, entity_events, job_events, job_pruner
+
+# Gunicorn settings, with the global config property holding each of them and their default value.
+_SETTINGS: Dict[str, Tuple[str, int]] = {
+    "workers": ("rest_workers", 1),
+    "threads": ("rest_threads", 4),
+    "keepalive": ("rest_keepalive", 5),
+    "timeout": ("rest_timeout", 30),
+    "graceful_timeout": ("rest_graceful_timeout", 30),
+    "max_requests": ("rest_max_requests", 10000),
+    "max_requests_jitter": ("rest_max_requests_jitter", 1000),
+}
+
+
+def _production_server_available() -> bool:
+    return util.find_spec("gunicorn") is not None
+
+
+def _production_settings(host: str, port: int, **kwargs) -> Dict[str, Any]:
+    """Return the server settings, read from the global config unless overridden by *kwargs*."""
+    settings: Dict[str, Any] = {"bind": f"{host}:{port}"}
+    for name, (property_name, default) in _SETTINGS.items():
+        value = getattr(Config.global_config, property_name)
+        settings[name] = default if value is None else int(value)
+    preload = Config.global_config.rest_preload
+    settings["preload_app"] = preload is None or str(preload).lower() not in ("false", "0", "no")
+    settings.update(kwargs)
+    if settings["workers"] > 1:
+        _TaipyLogger._get_logger().warning(
+            "The REST server runs several worker processes. Each of them orchestrates the jobs it submits and only"
+            " notifies the job events, waits and event streams of these jobs. The job statistics of /jobs/stats/ are"
+            " also counted by each of them, and only cover the jobs of the worker serving the request."
+        )
+    return settings
+
+
+def _request_threads() -> int:
+    """Return the number of threads handling requests in each worker of the production server."""
+    name, default = _SETTINGS["threads"]
+    value = getattr(Config.global_config, name)
+    return default if value is None else int(value)
+
+
+def _warmup(app):
+    """Load everything the workers need in the server process, before it forks them.
+
+    The workers share the memory pages of the server process until they write to them. The garbage collector is
+    disabled while loading, then the objects loaded are frozen, so that collections in the server process and in the
+    workers do not write to these pages.
+    """
+    gc.disable()
+    for factory in (
+        _VersionManagerFactory,
+        _CycleManagerFactory,
+        _DataManagerFactory,
+        _TaskManagerFactory,
+        _JobManagerFactory,
+        _ScenarioManagerFactory,
+        _SequenceManagerFactory,
+    ):
+        factory._build_manager()
+    apispec.preload()
+    gc.collect()
+    gc.freeze()
+
+
+def _when_ready():
+    """Re-enable the garbage collector of the server process once the objects loaded are frozen."""
+    gc.enable()
+
+
+def _in_worker():
+    """Leave the pruning of the jobs to the server process, in a worker process it forked."""
+    job_pruner.detach()
+
+
+def _after_fork(app):
+    """Restart, in a worker process, the threads of the application loaded by the server process."""
+    gc.enable()
+    _in_worker()
+    if _serves_entity_events(app):
+        entity_events.init_app(app)
+    job_events.init_app(app)
+
+
+def _run_production_server(app_factory: Callable, settings: Dict[str, Any]):
+    """Start a pre-forking server running the application created by *app_factory*.
+
+    With the `preload_app` setting, the application is created and warmed up once by the server process, then shared
+    by the worker processes it forks. Otherwise, each worker process creates its own application.
+    In both cases, the jobs are only pruned by the server process.
+    The server gracefully reloads its workers on `SIGHUP` and recycles each worker after `max_requests` requests.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class _Application(BaseApplication):
+        def load_config(self):
+            for name, value in settings.items():
+                self.cfg.set(name, value)
+            if settings.get("preload_app"):
+                self.cfg.set("when_ready", lambda server: _when_ready())
+                self.cfg.set("post_fork", lambda server, worker: _after_fork(self.callable))
+            else:
+                self.cfg.set("post_fork", lambda server, worker: _in_worker())
+
+        def load(self):
+            app = app_factory()
+            if settings.get("preload_app"):
+                _warmup(app)
+            return app
+
+    _Application().run()
@@ -0,0 +1,107 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Log of the requests slower than a threshold, exposed at `/admin/slow-requests`"""
+
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from flask import jsonify
+
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from .admin import _admin_required
+
+
+def _operators(operators: List) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": value, "operator": operator.name} for key, value, operator in operators]
+
+
+class SlowRequestLog:
+    """Log the requests served in more than `SLOW_REQUEST_THRESHOLD` seconds, with their phase timings.
+
+    Each slow request is logged as a warning, with its endpoint, the identifier of the entity requested, and the
+    details recorded while serving it, like the storage type of the data node, the filter operators and the number of
+    rows read or written. The last `SLOW_REQUEST_LOG_SIZE` slow requests are kept in memory and returned, most recent
+    first, by the `/admin/slow-requests` endpoint, protected by `ADMIN_TOKEN`.
+
+    The log is disabled when `SLOW_REQUEST_THRESHOLD` is None, the default.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._requests: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._logger = _TaipyLogger._get_logger()
+        self.threshold: Optional[float] = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("SLOW_REQUEST_THRESHOLD", None)
+        app.config.setdefault("SLOW_REQUEST_LOG_SIZE", 100)
+
+        self.threshold = app.config["SLOW_REQUEST_THRESHOLD"]
+        with self._lock:
+            if self._requests.maxlen != app.config["SLOW_REQUEST_LOG_SIZE"]:
+                self._requests = deque(self._requests, maxlen=app.config["SLOW_REQUEST_LOG_SIZE"])
+        if "admin_slow_requests" not in app.view_functions:
+            app.add_url_rule("/admin/slow-requests", "admin_slow_requests", _admin_required(self.expose))
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold is not None
+
+    @property
+    def requests(self) -> List[Dict[str, Any]]:
+        """The slow requests kept, most recent first."""
+        with self._lock:
+            return list(reversed(self._requests))
+
+    def record(
+        self,
+        phases: Dict[str, float],
+        details: Dict[str, Any],
+        duration: float,
+        method: str,
+        path: str,
+        endpoint: Optional[str],
+        status: int,
+        entity_id: Optional[str],
+    ):
+        """Log the request if it lasted *duration* milliseconds or more than the threshold."""
+        if self.threshold is None or duration < self.threshold * 1000:
+            return
+        entry = {
+            "time": datetime.now().isoformat(),
+            "method": method,
+            "path": path,
+            "endpoint": endpoint,
+            "entity_id": entity_id,
+            "status": status,
+            "duration": duration,
+            "phases": dict(phases),
+            **details,
+        }
+        if "operators" in entry:
+            entry["operators"] = _operators(entry["operators"])
+        with self._lock:
+            self._requests.append(entry)
+        self._logger.warning(
+            f"Slow request {method} {path} took {duration:.3f}ms: "
+            + " ".join(f"{name}={value}" for name, value in entry.items() if name not in ("time", "method", "path")),
+            extra={"slow_request": entry},
+        )
+
+    def expose(self):
+        return jsonify({"threshold": self.threshold, "requests": self.requests})
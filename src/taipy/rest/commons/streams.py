@@ -0,0 +1,67 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Admission of the long-lived requests served by the WSGI application"""
+
+import threading
+from typing import Callable, Optional
+
+from flask import request
+
+# Set in the WSGI environment of the requests relayed by the ASGI application.
+_ASGI_ENVIRON_KEY = "taipy.rest.asgi"
+
+
+def _release_nothing():
+    pass
+
+
+class StreamLimiter:
+    """Bound the number of long-lived requests holding a request thread of the WSGI application.
+
+    The job event streams, the job waits and the WebSocket connections hold a request thread for as long as they last.
+    At most `WSGI_MAX_STREAMS` of them are served at once, by default half of the request threads of a worker of the
+    production server, so that the other requests are still served. The rejected requests should be retried after
+    `WSGI_STREAMS_RETRY_AFTER` seconds. The ASGI application, which does not hold a thread per connection, is the place
+    to serve many of them: the requests it relays are not bounded.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self.max_streams = 2
+        self.retry_after = 5
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        from .server import _request_threads
+
+        app.config.setdefault("WSGI_MAX_STREAMS", max(_request_threads() // 2, 1))
+        app.config.setdefault("WSGI_STREAMS_RETRY_AFTER", 5)
+
+        with self._lock:
+            if self._slots is None or app.config["WSGI_MAX_STREAMS"] != self.max_streams:
+                self.max_streams = app.config["WSGI_MAX_STREAMS"]
+                self._slots = threading.BoundedSemaphore(self.max_streams)
+            self.retry_after = app.config["WSGI_STREAMS_RETRY_AFTER"]
+
+    def acquire(self) -> Optional[Callable[[], None]]:
+        """Admit the current long-lived request and return the function to call when it ends, or None if too many
+        long-lived requests are served."""
+        if request.environ.get(_ASGI_ENVIRON_KEY):
+            return _release_nothing
+        with self._lock:
+            slots = self._slots
+        if slots is None:
+            return _release_nothing
+        return slots.release if slots.acquire(blocking=False) else None
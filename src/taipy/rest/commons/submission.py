@@ -0,0 +1,71 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Helpers to submit several submittable entities at once"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Type
+
+from flask import url_for
+
+from taipy.config.config import Config
+
+
+def _submission_response(message: str, jobs: List) -> Tuple[Dict, int, Dict]:
+    """Build the `202 Accepted` response of a submission, pointing to the submission status resource."""
+    submission_id = jobs[0].submit_id if jobs else None
+    headers = {"Location": url_for("api.submission_by_id", submission_id=submission_id)} if submission_id else {}
+    return {"message": message, "submission_id": submission_id, "job_ids": [job.id for job in jobs]}, 202, headers
+
+
+def _submission_result(entity_id: str, jobs: List) -> Dict:
+    return {
+        "id": entity_id,
+        "status": 202,
+        "submission_id": jobs[0].submit_id if jobs else None,
+        "job_ids": [job.id for job in jobs],
+    }
+
+
+def _submit_all(
+    manager, entity_ids: List[str], non_existing_exception: Type[Exception], max_workers: int, logger=None, **kwargs
+) -> List[Dict]:
+    """Submit all the entities and return one result per entity, in the order of *entity_ids*.
+
+    The existence of the entities is checked first, non-existing ones get a `404` result. Submissions are then
+    dispatched concurrently to the orchestrator, except in development mode where jobs are executed synchronously by
+    the submitting thread.
+    """
+
+    def _submit(entity_id: str) -> Dict:
+        try:
+            return _submission_result(entity_id, manager._submit(entity_id, **kwargs))
+        except Exception as e:
+            if logger:
+                logger.error(f"Submission of {entity_id} failed: {e}")
+            return {"id": entity_id, "status": 500, "message": getattr(e, "message", str(e))}
+
+    existing_ids = [entity_id for entity_id in entity_ids if manager._exists(entity_id)]
+    if Config.job_config.is_development or max_workers <= 1 or len(existing_ids) <= 1:
+        submitted = iter([_submit(entity_id) for entity_id in existing_ids])
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(existing_ids))) as executor:
+            submitted = iter(list(executor.map(_submit, existing_ids)))
+
+    existing = set(existing_ids)
+    return [
+        (
+            next(submitted)
+            if entity_id in existing
+            else {"id": entity_id, "status": 404, "message": non_existing_exception(entity_id).message}
+        )
+        for entity_id in entity_ids
+    ]
@@ -0,0 +1,162 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Opt-in timing of the phases of a request, returned in the `Server-Timing` response header and kept by the slow
+request log"""
+
+import contextlib
+import time
+from contextvars import ContextVar, Token
+from typing import Any, ContextManager, Dict, Iterator, Optional, Tuple
+
+from flask import Blueprint, Response, g, request
+
+from taipy.logger._taipy_logger import _TaipyLogger
+
+from .slow_requests import SlowRequestLog
+
+
+class _Timing:
+    """Durations, in milliseconds, of the phases of a request, and details on what the request did."""
+
+    __slots__ = ("started", "phases", "details")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.details: Dict[str, Any] = {}
+
+    @property
+    def total(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def header(self, total: float) -> str:
+        return ", ".join(f"{name};dur={duration:.3f}" for name, duration in (*self.phases.items(), ("total", total)))
+
+
+# Timing of the current request, None when the request is not timed. Context variables follow the request to the
+# threads of the data node I/O pool.
+_timing: ContextVar[Optional[_Timing]] = ContextVar("taipy_rest_timing", default=None)
+_NOT_TIMED = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _timed(timing: _Timing, name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.phases[name] = timing.phases.get(name, 0) + (time.perf_counter() - started) * 1000
+
+
+def phase(name: str) -> ContextManager:
+    """Time the block as the phase *name* of the current request, if the request is timed."""
+    if (timing := _timing.get()) is None:
+        return _NOT_TIMED
+    return _timed(timing, name)
+
+
+def annotate(**details):
+    """Record *details* on the current request, like the storage type of the data node read, if the request is
+    timed."""
+    if (timing := _timing.get()) is not None:
+        timing.details.update(details)
+
+
+class ServerTiming:
+    """Time the phases of the requests served by the `api` blueprint, like the data node lookup or the storage I/O.
+
+    When `SERVER_TIMING_ENABLED` is True, the durations of the phases are returned in the `Server-Timing` response
+    header and, if `SERVER_TIMING_LOG` is True, logged with the endpoint. The requests are also timed when the slow
+    request log is enabled. Timing is disabled by default, the phases are then not measured at all.
+    """
+
+    def __init__(self, slow_requests: SlowRequestLog, app=None):
+        self.slow_requests = slow_requests
+        self.enabled = False
+        self.log = True
+        self._logger = _TaipyLogger._get_logger()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("SERVER_TIMING_ENABLED", False)
+        app.config.setdefault("SERVER_TIMING_LOG", True)
+
+        self.enabled = app.config["SERVER_TIMING_ENABLED"]
+        self.log = app.config["SERVER_TIMING_LOG"]
+
+    def register(self, blueprint: Blueprint):
+        """Time the requests served by *blueprint*."""
+        blueprint.before_request(self._before_request)
+        blueprint.after_request(self._after_request)
+        blueprint.teardown_request(self._teardown_request)
+
+    def start(self) -> Optional[_Timing]:
+        """Start timing the current request, if timing or the slow request log is enabled."""
+        if not self.enabled and not self.slow_requests.enabled:
+            return None
+        timing = _Timing()
+        _timing.set(timing)
+        return timing
+
+    def finish(
+        self,
+        timing: _Timing,
+        method: str,
+        path: str,
+        endpoint: Optional[str],
+        status: int,
+        entity_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Return the `Server-Timing` header value of the request timed by *timing*, if timing is enabled, and log
+        it."""
+        total = timing.total
+        self.slow_requests.record(timing.phases, timing.details, total, method, path, endpoint, status, entity_id)
+        if not self.enabled:
+            return None
+        if self.log:
+            phases = {**timing.phases, "total": total}
+            self._logger.info(
+                f"{method} {path} timing: " + " ".join(f"{name}={duration:.3f}ms" for name, duration in phases.items()),
+                extra={"endpoint": endpoint, "method": method, "path": path, "timing": phases},
+            )
+        return timing.header(total)
+
+    def _before_request(self):
+        if not self.enabled and not self.slow_requests.enabled:
+            return
+        timing = _Timing()
+        # The operations of a batch are nested requests sharing `g`: each request pushes its timing on a stack, and
+        # restores the timing of the enclosing request when it ends.
+        g.setdefault("taipy_timings", []).append((request._get_current_object(), timing, _timing.set(timing)))
+
+    def _after_request(self, response: Response) -> Response:
+        if (timed := self.__timed()) is not None:
+            endpoint = (request.endpoint or "unknown").rsplit(".", 1)[-1]
+            entity_id = next(iter((request.view_args or {}).values()), None)
+            header = self.finish(timed[1], request.method, request.path, endpoint, response.status_code, entity_id)
+            if header is not None:
+                response.headers["Server-Timing"] = header
+        return response
+
+    def _teardown_request(self, exception: Optional[BaseException]):
+        if self.__timed() is not None:
+            _, _, token = g.taipy_timings.pop()
+            _timing.reset(token)
+
+    @staticmethod
+    def __timed() -> Optional[Tuple[Any, _Timing, Token]]:
+        """Return the request, timing and context variable token of the current request, if it is timed."""
+        if (timings := g.get("taipy_timings")) and timings[-1][0] is request._get_current_object():
+            return timings[-1]
+        return None
@@ -16,5 +16,29 @@ initialized in application factory
 """
 
 from .commons.apispec import APISpecExt
+from .commons.compression import Compressor, RequestDecompressor
+from .commons.events import EntityEventBroker, JobEventBroker
+from .commons.io_pool import IOPool
+from .commons.job_retention import JobPruner
+from .commons.job_statistics import JobCounters
+from .commons.metrics import Metrics
+from .commons.profiler import Profiler
+from .commons.read_pool import ReadProcessPool
+from .commons.slow_requests import SlowRequestLog
+from .commons.streams import StreamLimiter
+from .commons.timing import ServerTiming
 
-apispec = APISpecExt()
\ No newline at end of file
+apispec = APISpecExt()
+compressor = Compressor()
+request_decompressor = RequestDecompressor()
+entity_events = EntityEventBroker()
+job_events = JobEventBroker()
+job_counters = JobCounters(job_events)
+job_pruner = JobPruner()
+data_node_io = IOPool()
+data_node_reads = ReadProcessPool()
+metrics = Metrics()
+slow_requests = SlowRequestLog()
+server_timing = ServerTiming(slow_requests)
+profiler = Profiler()
+streams = StreamLimiter()
@@ -9,8 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 from taipy.config import Config
+from taipy.logger._taipy_logger import _TaipyLogger
 
 from .app import create_app as _create_app
+from .commons.server import _production_server_available, _production_settings, _run_production_server
 
 
 class Rest:
@@ -31,14 +33,55 @@ class Rest:
         However, editing these parameters is only recommended for advanced users. Indeed, the default behavior of the
         REST server without any required configuration satisfies all the standard and basic needs.
         """
-        self._app = _create_app(Config.global_config.testing or False, Config.global_config.env,
-                                Config.global_config.secret_key)
+        self._app = self.__create_app()
+
+    @staticmethod
+    def __create_app():
+        return _create_app(Config.global_config.testing or False, Config.global_config.env,
+                           Config.global_config.secret_key)
 
     def run(self, **kwargs):
         """
         Start a REST API server. This method is blocking.
 
+        By default, the Flask development server is used. When the `rest_server` property of the global config is
+        set to "production", a pre-forking multi-worker server is started instead (it requires the `gunicorn`
+        package, installed with the `taipy-rest[production]` extra). Each worker process creates its own application.
+        The production server is configured by the following properties of the global config:
+            - rest_workers (int): The number of worker processes. The default is 1.
+                Warning: each worker process orchestrates the jobs submitted through it, and only notifies the job
+                events, waits and event streams of these jobs. The job statistics of `/jobs/stats/` are also
+                counted per worker process and only cover the jobs of the worker serving the request. Use several
+                workers when the clients do not follow the jobs they submit, and scale with rest_threads otherwise.
+            - rest_threads (int): The number of threads handling requests in each worker. The default is 4.
+            - rest_keepalive (int): The number of seconds to wait for requests on a Keep-Alive connection.
+                The default is 5.
+            - rest_timeout (int): The number of seconds after which a silent worker is restarted. The default is 30.
+            - rest_graceful_timeout (int): The number of seconds given to the workers to finish their requests when
+                they are restarted. The default is 30.
+            - rest_max_requests (int): The number of requests after which a worker is recycled, 0 to disable it.
+                The default is 10000.
+            - rest_max_requests_jitter (int): The maximum random number of requests added to rest_max_requests, so
+                that workers are not all recycled at once. The default is 1000.
+            - rest_preload (bool): If True, the application is loaded and warmed up (Core managers, API spec) by the
+                server process before it forks the workers, which share its memory instead of each loading their own
+                application. The default is True.
+        Sending `SIGHUP` to the server process gracefully reloads its workers.
+
         Parameters:
-            **kwargs : Options to provide to the application server.
+            **kwargs : Options to provide to the application server. The production server accepts *host*, *port*
+                and any of its settings, which take precedence over the global config.
         """
-        self._app.run(**kwargs)
+        if str(Config.global_config.rest_server or "development").lower() != "production":
+            self._app.run(**kwargs)
+            return
+        if not _production_server_available():
+            _TaipyLogger._get_logger().warning(
+                "The production REST server requires the gunicorn package. The development server is used instead."
+            )
+            self._app.run(**kwargs)
+            return
+
+        settings = _production_settings(kwargs.pop("host", "127.0.0.1"), kwargs.pop("port", 5000), **kwargs)
+        # A preloaded application is shared by the workers: the one of this service is used.
+        _run_production_server((lambda: self._app) if settings["preload_app"] else self.__create_app, settings)
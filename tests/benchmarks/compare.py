@@ -0,0 +1,68 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare two benchmark result files
+
+    python -m tests.benchmarks.compare <baseline.json> <candidate.json> [--threshold 10]
+
+Print the p50, p95 and p99 latencies and the throughput of each operation of both files, and exit with status 1 if
+the p95 latency of an operation regressed by more than the threshold, in percent.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+
+def _changes(baseline: Dict, candidate: Dict) -> List[Dict]:
+    changes = []
+    for run, operations in candidate["results"].items():
+        for name, stats in operations.items():
+            if (before := baseline["results"].get(run, {}).get(name)) is None:
+                continue
+            changes.append(
+                {
+                    "operation": f"{run} {name}",
+                    **{key: (before[key], stats[key]) for key in ("p50", "p95", "p99", "throughput")},
+                }
+            )
+    return changes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    with open(args.baseline) as baseline, open(args.candidate) as candidate:
+        baseline_results, candidate_results = json.load(baseline), json.load(candidate)
+
+    print(f"{baseline_results.get('commit')} -> {candidate_results.get('commit')}")
+    regressions = []
+    for change in _changes(baseline_results, candidate_results):
+        cells = []
+        for key in ("p50", "p95", "p99", "throughput"):
+            before, after = change[key]
+            ratio = (after - before) / before * 100 if before else 0.0
+            cells.append(f"{key} {before:.2f} -> {after:.2f} ({ratio:+.1f}%)")
+            if key == "p95" and ratio > args.threshold:
+                regressions.append(change["operation"])
+        print(f"{change['operation']}: " + ", ".join(cells))
+    if regressions:
+        print(f"p95 regressions above {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
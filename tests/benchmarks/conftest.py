@@ -0,0 +1,152 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Benchmarks of the REST endpoints, only collected when the `TAIPY_REST_BENCHMARK` environment variable is set
+
+    TAIPY_REST_BENCHMARK=1 pytest tests/benchmarks
+
+The sizes of the seeded entities and of the runs are read from the `TAIPY_REST_BENCHMARK_*` environment variables
+(see `_Settings`). The results are written as JSON to `TAIPY_REST_BENCHMARK_OUTPUT`, by default
+`.benchmarks/<commit>.json`, and two result files are compared with `python -m tests.benchmarks.compare`.
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import uuid
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pandas as pd
+import pytest
+
+from taipy.core import Job, JobId
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+
+from .runner import configure
+
+collect_ignore_glob = [] if os.environ.get("TAIPY_REST_BENCHMARK") else ["test_*.py"]
+
+
+class _Settings:
+    """Sizes of the benchmark, overridden by the `TAIPY_REST_BENCHMARK_<NAME>` environment variables."""
+
+    def __init__(self):
+        self.scenarios = self.__read("SCENARIOS", 50)
+        self.jobs = self.__read("JOBS", 500)
+        self.rows = self.__read("ROWS", 10000)
+        self.write_rows = self.__read("WRITE_ROWS", 1000)
+        self.iterations = self.__read("ITERATIONS", 100)
+        self.warmup = self.__read("WARMUP", 10)
+        self.workers = self.__read("WORKERS", 2)
+        self.concurrency = self.__read("CONCURRENCY", 8)
+
+    @staticmethod
+    def __read(name: str, default: int) -> int:
+        return int(os.environ.get(f"TAIPY_REST_BENCHMARK_{name}", default))
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(vars(self))
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def build_managers():
+    _TaskManagerFactory._build_manager()
+    _JobManagerFactory._build_manager()
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings():
+    return _Settings()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(benchmark_settings):
+    """Results of the benchmarks by run and operation, written as JSON at the end of the session."""
+    results: Dict[str, Dict[str, Any]] = {}
+    yield results
+
+    commit = _commit()
+    output = os.environ.get("TAIPY_REST_BENCHMARK_OUTPUT") or os.path.join(
+        ".benchmarks", f"{commit[:12] if commit else 'local'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(
+            {
+                "commit": commit,
+                "date": datetime.now().isoformat(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "settings": benchmark_settings.to_dict(),
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+@pytest.fixture
+def benchmark_entities(benchmark_settings, tmp_path):
+    """Seed the scenarios, jobs and data nodes of every storage type benchmarked, and return their identifiers."""
+    rows = pd.DataFrame(
+        {"id": range(benchmark_settings.rows), "value": [i * 0.5 for i in range(benchmark_settings.rows)]}
+    )
+    with closing(sqlite3.connect(tmp_path / "benchmark.db")) as connection:
+        connection.execute("CREATE TABLE benchmark (id INTEGER, value REAL)")
+
+    data_node_configs, scenario_config = configure(str(tmp_path))
+    scenario_manager = _ScenarioManagerFactory._build_manager()
+    scenarios = [scenario_manager._create(scenario_config) for _ in range(benchmark_settings.scenarios)]
+    data_nodes = {}
+    data_manager = _DataManagerFactory._build_manager()
+    for storage_type, config in data_node_configs.items():
+        data_node = next(dn for dn in data_manager._get_all() if dn.config_id == config.id)
+        data_node.write(rows)
+        data_nodes[storage_type] = data_node.id
+
+    job_manager = _JobManagerFactory._build_manager()
+    jobs = []
+    for i in range(benchmark_settings.jobs):
+        scenario = scenarios[i % len(scenarios)]
+        task = scenario.benchmark_task
+        # Ten jobs by submission.
+        job = Job(JobId(f"JOB_{uuid.uuid4()}"), task, f"SUBMISSION_benchmark_{i // 10}", scenario.id)
+        job_manager._set(job)
+        jobs.append(job)
+
+    scenario = scenarios[0]
+    return {
+        "scenario_config_id": scenario_config.id,
+        "scenario_id": scenario.id,
+        "cycle_id": scenario.cycle.id,
+        "sequence_id": scenario.sequences["benchmark_sequence"].id,
+        "task_id": scenario.benchmark_task.id,
+        "job_id": jobs[0].id,
+        "submission_id": jobs[0].submit_id,
+        "data_nodes": data_nodes,
+        "write_data": rows.head(benchmark_settings.write_rows).to_dict(orient="records"),
+    }
@@ -0,0 +1,200 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+from flask import url_for
+from sqlalchemy import text
+
+from taipy.config import Config
+from taipy.config.common.frequency import Frequency
+from taipy.config.common.scope import Scope
+from taipy.core.config.data_node_config import DataNodeConfig
+from taipy.core.config.scenario_config import ScenarioConfig
+
+# Endpoints of the api blueprint not benchmarked, with the reason why.
+NOT_BENCHMARKED = {
+    "job_events": "streams the job events until the client disconnects",
+    "entity_events": "WebSocket endpoint",
+    "task_submit": "runs the jobs of the submitted entity",
+    "sequence_submit": "runs the jobs of the submitted entity",
+    "sequences_submit": "runs the jobs of the submitted entities",
+    "scenario_submit": "runs the jobs of the submitted entity",
+    "scenarios_submit": "runs the jobs of the submitted entities",
+    "job_cancel": "changes the status of the seeded jobs",
+    "jobs_cancel": "changes the status of the seeded jobs",
+}
+
+
+def _write_queries(data: Any) -> List[Tuple]:
+    rows = pd.DataFrame(data).to_dict(orient="records")
+    return [(text("DELETE FROM benchmark"),), (text("INSERT INTO benchmark VALUES (:id, :value)"), rows)]
+
+
+def configure(folder: str) -> Tuple[Dict[str, DataNodeConfig], ScenarioConfig]:
+    """Configure the benchmarked data nodes, one of each storage type stored in *folder*, and the scenario using them.
+
+    Return the data node configs by storage type and the scenario config.
+    """
+    data_node_configs = {
+        "csv": Config.configure_csv_data_node(
+            "benchmark_csv", default_path=os.path.join(folder, "benchmark.csv"), scope=Scope.GLOBAL
+        ),
+        "pickle": Config.configure_pickle_data_node(
+            "benchmark_pickle", default_path=os.path.join(folder, "benchmark.p"), scope=Scope.GLOBAL
+        ),
+        "in_memory": Config.configure_in_memory_data_node("benchmark_in_memory", scope=Scope.GLOBAL),
+        "sql": Config.configure_sql_data_node(
+            "benchmark_sql",
+            db_name="benchmark",
+            db_engine="sqlite",
+            read_query="SELECT * FROM benchmark",
+            write_query_builder=_write_queries,
+            sqlite_folder_path=folder,
+            scope=Scope.GLOBAL,
+        ),
+    }
+    input_config = Config.configure_data_node("benchmark_input", default_data=1)
+    task_config = Config.configure_task("benchmark_task", print, [input_config, *data_node_configs.values()], [])
+    scenario_config = Config.configure_scenario(
+        "benchmark_scenario",
+        [task_config],
+        frequency=Frequency.DAILY,
+        sequences={"benchmark_sequence": [task_config]},
+    )
+    return data_node_configs, scenario_config
+
+
+class Operation(NamedTuple):
+    name: str
+    endpoint: str
+    method: str
+    url: str
+    body: Optional[Any] = None
+
+
+def operations(entities: Dict[str, Any], storage_types: List[str]) -> List[Operation]:
+    """Return the operations benchmarked on the seeded *entities*, reads first, to be called in a request context.
+
+    The data nodes are read and written for each of *storage_types*. Deletions are not benchmarked, each of them would
+    need a new entity.
+    """
+    job_id, config_id = entities["job_id"], entities["scenario_config_id"]
+    result = [
+        Operation(name, name, "GET", url_for(f"api.{name}", **args))
+        for name, args in (
+            ("scenarios", {}),
+            ("cycles", {}),
+            ("sequences", {}),
+            ("tasks", {}),
+            ("datanodes", {}),
+            ("jobs", {}),
+            ("job_stats", {}),
+            ("job_retention", {}),
+            ("scenario_by_id", {"scenario_id": entities["scenario_id"]}),
+            ("cycle_by_id", {"cycle_id": entities["cycle_id"]}),
+            ("sequence_by_id", {"sequence_id": entities["sequence_id"]}),
+            ("task_by_id", {"task_id": entities["task_id"]}),
+            ("datanode_by_id", {"datanode_id": entities["data_nodes"][storage_types[0]]}),
+            ("job_by_id", {"job_id": job_id}),
+            ("job_stacktrace", {"job_id": job_id}),
+            ("job_wait", {"job_id": job_id, "timeout": 0}),
+            ("jobs_wait", {"job_id": job_id, "timeout": 0}),
+            ("submission_by_id", {"submission_id": entities["submission_id"]}),
+        )
+    ]
+    for storage_type in storage_types:
+        url = url_for("api.datanode_reader", datanode_id=entities["data_nodes"][storage_type])
+        result.append(Operation(f"datanode_reader[{storage_type}]", "datanode_reader", "GET", url))
+    for storage_type in storage_types:
+        url = url_for("api.datanode_writer", datanode_id=entities["data_nodes"][storage_type])
+        result.append(
+            Operation(f"datanode_writer[{storage_type}]", "datanode_writer", "PUT", url, entities["write_data"])
+        )
+    result.extend(
+        [
+            Operation("scenarios[create]", "scenarios", "POST", url_for("api.scenarios", config_id=config_id)),
+            Operation(
+                "scenarios_bulk",
+                "scenarios_bulk",
+                "POST",
+                url_for("api.scenarios_bulk", config_id=config_id),
+                {"count": 10},
+            ),
+            Operation(
+                "batch",
+                "batch",
+                "POST",
+                url_for("api.batch"),
+                {
+                    "operations": [
+                        {"operation": "create", "entity": "scenario", "params": {"config_id": config_id}},
+                        {
+                            "operation": "write",
+                            "entity": "datanode",
+                            "id": entities["data_nodes"][storage_types[0]],
+                            "data": entities["write_data"][:10],
+                        },
+                    ]
+                },
+            ),
+        ]
+    )
+    return result
+
+
+def _percentile(latencies: List[float], percent: float) -> float:
+    """Return the *percent* percentile of the sorted *latencies*, by the nearest rank method."""
+    return latencies[max(0, min(len(latencies) - 1, round(percent / 100 * len(latencies)) - 1))]
+
+
+def measure(call: Callable[[], int], iterations: int, warmup: int, concurrency: int) -> Dict[str, float]:
+    """Call *call*, returning a status code, *iterations* times from *concurrency* threads after *warmup* calls.
+
+    Return the throughput in requests per second and the latencies in milliseconds.
+    """
+    for _ in range(warmup):
+        call()
+
+    def timed(_) -> tuple:
+        started = time.perf_counter()
+        status = call()
+        return (time.perf_counter() - started) * 1000, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(timed, range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "requests": iterations,
+        "errors": sum(1 for _, status in results if status >= 400),
+        "throughput": iterations / elapsed,
+        "mean": sum(latencies) / len(latencies),
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "max": latencies[-1],
+    }
+
+
+def check_coverage(app, benchmarked: List[Operation]):
+    """Fail if an endpoint of the api blueprint is neither benchmarked nor listed in `NOT_BENCHMARKED`."""
+    endpoints = {
+        rule.endpoint.split(".", 1)[1] for rule in app.url_map.iter_rules() if rule.endpoint.startswith("api.")
+    }
+    missing = endpoints - {operation.endpoint for operation in benchmarked} - set(NOT_BENCHMARKED)
+    assert not missing, f"Endpoints not benchmarked: {sorted(missing)}"
@@ -0,0 +1,28 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Production server of the benchmarks, started by `test_server.py`
+
+python -m tests.benchmarks.server <port> <workers> <data node folder>
+"""
+
+import sys
+
+from src.taipy.rest.app import create_app
+from src.taipy.rest.commons.server import _production_settings, _run_production_server
+
+from .runner import configure
+
+if __name__ == "__main__":
+    port, workers, folder = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+    # The scenarios are created from the same config as the seeded ones.
+    configure(folder)
+    _run_production_server(create_app, _production_settings("127.0.0.1", port, workers=workers, loglevel="warning"))
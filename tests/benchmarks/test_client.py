@@ -0,0 +1,29 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from .runner import check_coverage, measure, operations
+
+_STORAGE_TYPES = ["csv", "pickle", "in_memory", "sql"]
+
+
+def test_benchmark_test_client(app, client, benchmark_settings, benchmark_entities, benchmark_results):
+    benchmarked = operations(benchmark_entities, _STORAGE_TYPES)
+    check_coverage(app, benchmarked)
+
+    results = benchmark_results.setdefault("test_client", {})
+    for operation in benchmarked:
+
+        def call():
+            return client.open(operation.url, method=operation.method, json=operation.body).status_code
+
+        # The test client serves the requests in this process: they are timed one at a time.
+        results[operation.name] = measure(call, benchmark_settings.iterations, benchmark_settings.warmup, 1)
+        assert results[operation.name]["errors"] == 0, operation.name
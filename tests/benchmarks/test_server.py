@@ -0,0 +1,101 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from .runner import measure, operations
+
+# The in-memory data nodes are not shared by the worker processes.
+_STORAGE_TYPES = ["csv", "pickle", "sql"]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _Client:
+    """HTTP client keeping one connection by thread."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self._local = threading.local()
+
+    def request(self, method: str, url: str, body=None) -> int:
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        data = json.dumps(body).encode() if body is not None else None
+        for attempt in range(2):
+            if (connection := getattr(self._local, "connection", None)) is None:
+                connection = self._local.connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=60)
+            try:
+                connection.request(method, url, body=data, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                return response.status
+            except (http.client.HTTPException, OSError):
+                # The worker closed the connection, after its keep-alive timeout or when it was recycled.
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+        return 0
+
+
+@pytest.fixture
+def server(benchmark_settings, benchmark_entities, tmp_path):
+    pytest.importorskip("gunicorn")
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tests.benchmarks.server", str(port), str(benchmark_settings.workers), str(tmp_path)],
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+    client = _Client(port)
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            if client.request("GET", "/api/v1/jobs/stats/") == 200:
+                break
+        except OSError:
+            pass
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail("The benchmark server did not start.")
+        time.sleep(0.2)
+    yield client
+    process.terminate()
+    try:
+        process.wait(60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def test_benchmark_server(app, server, benchmark_settings, benchmark_entities, benchmark_results):
+    results = benchmark_results.setdefault(f"server[{benchmark_settings.workers} workers]", {})
+    for operation in operations(benchmark_entities, _STORAGE_TYPES):
+        # The entities written are stored in files, which the workers must not write concurrently.
+        concurrency = benchmark_settings.concurrency if operation.method == "GET" else 1
+        results[operation.name] = measure(
+            lambda: server.request(operation.method, operation.url, operation.body),
+            benchmark_settings.iterations,
+            benchmark_settings.warmup,
+            concurrency,
+        )
+        assert results[operation.name]["errors"] == 0, operation.name
@@ -13,16 +13,19 @@ import os
 import shutil
 import uuid
 from datetime import datetime, timedelta
+from queue import Queue
 
 import pandas as pd
 import pytest
 from dotenv import load_dotenv
 
 from src.taipy.rest.app import create_app
+from src.taipy.rest.extensions import job_counters
 from taipy.config import Config
 from taipy.config.common.frequency import Frequency
 from taipy.config.common.scope import Scope
 from taipy.core import Cycle, DataNodeId, Job, JobId, Scenario, Sequence, Task
+from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core.cycle._cycle_manager import _CycleManager
 from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.job._job_manager import _JobManager
@@ -311,5 +314,8 @@ def create_job_list():
 @pytest.fixture(scope="function", autouse=True)
 def cleanup_files():
     Config.unblock_update()
+    _Orchestrator.jobs_to_run = Queue()
+    _Orchestrator.blocked_jobs = []
+    job_counters.reset()
     if os.path.exists(".data"):
         shutil.rmtree(".data")
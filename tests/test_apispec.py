@@ -0,0 +1,42 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from flask import url_for
+
+from src.taipy.rest.extensions import apispec
+
+
+def test_spec_built_on_first_access(app):
+    assert apispec._spec is None
+    spec = apispec.spec
+    assert "/api/v1/jobs/{job_id}/" in spec.to_dict()["paths"]
+    assert "PaginatedResult" in spec.to_dict()["components"]["schemas"]
+    assert apispec.spec is spec
+
+
+def test_swagger_json_cached(client):
+    rep = client.get(url_for("swagger.swagger_json"))
+    assert rep.status_code == 200
+    assert rep.mimetype == "application/json"
+    assert "/api/v1/datanodes/" in rep.json["paths"]
+    etag = rep.headers["ETag"]
+
+    rep = client.get(url_for("swagger.swagger_json"), headers={"If-None-Match": etag})
+    assert rep.status_code == 304
+
+
+def test_openapi_yaml_cached(client):
+    first = client.get(url_for("swagger.openapi_yaml"))
+    second = client.get(url_for("swagger.openapi_yaml"))
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert first.data.count(b"x-displayName: Authentication") == 1
+    assert "tags" not in apispec.spec.to_dict()
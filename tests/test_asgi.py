@@ -0,0 +1,244 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.taipy.rest.asgi import create_asgi_app
+from src.taipy.rest.extensions import compressor, metrics
+from taipy.config.common.scope import Scope
+from taipy.core import DataNodeId
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.in_memory import InMemoryDataNode
+from taipy.core.job._job_manager import _JobManager
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+
+
+@pytest.fixture(autouse=True)
+def build_managers():
+    _DataManagerFactory._build_manager()
+    _TaskManagerFactory._build_manager()
+    _JobManagerFactory._build_manager()
+
+
+def _request(asgi_app, method, path, query_string=b"", body=None, headers=()):
+    messages = _messages(asgi_app, method, path, query_string, body, headers)
+    content = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], json.loads(content)
+
+
+def _messages(asgi_app, method, path, query_string=b"", body=None, headers=()):
+    messages = []
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    requests = [{"type": "http.request", "body": body or b""}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": [(b"content-type", b"application/json"), *headers],
+    }
+    asyncio.run(asgi_app(scope, receive, send))
+    return messages
+
+
+def test_asgi_datanode_read_write(app):
+    asgi_app = create_asgi_app(app, max_workers=2)
+    data_node = InMemoryDataNode("input_ds", Scope.SCENARIO, DataNodeId("asgi_dn"), properties={"default_data": [1]})
+    _DataManager._set(data_node)
+
+    status, content = _request(asgi_app, "GET", "/api/v1/datanodes/foo/read/")
+    assert status == 404
+
+    status, content = _request(asgi_app, "PUT", f"/api/v1/datanodes/{data_node.id}/write/", body=[1, 2])
+    assert status == 200
+    status, content = _request(asgi_app, "GET", f"/api/v1/datanodes/{data_node.id}/read/")
+    assert status == 200
+    assert content == {"data": [1, 2]}
+
+    body = gzip.compress(json.dumps([3]).encode())
+    path = f"/api/v1/datanodes/{data_node.id}/write/"
+    status, content = _request(asgi_app, "PUT", path, body=body, headers=[(b"content-encoding", b"gzip")])
+    assert status == 200
+    assert _request(asgi_app, "GET", f"/api/v1/datanodes/{data_node.id}/read/")[1] == {"data": [3]}
+
+
+def test_asgi_job_wait(app, default_job):
+    asgi_app = create_asgi_app(app, max_workers=2)
+    _JobManager._set(default_job)
+
+    status, content = _request(asgi_app, "GET", f"/api/v1/jobs/{default_job.id}/wait/", b"timeout=0.1")
+    assert status == 200
+    assert content["is_finished"] is False
+
+    timer = threading.Timer(0.2, default_job.completed)
+    timer.start()
+    status, content = _request(asgi_app, "GET", "/api/v1/jobs/wait/", f"job_id={default_job.id}&timeout=10".encode())
+    timer.join()
+    assert status == 200
+    assert content["is_finished"] is True
+
+
+def test_asgi_wsgi_fallback(app, create_job_list):
+    asgi_app = create_asgi_app(app, max_workers=2)
+
+    status, content = _request(asgi_app, "GET", "/api/v1/jobs/")
+    assert status == 200
+    assert len(content) == 10
+
+
+def test_asgi_request_body_too_large(app):
+    asgi_app = create_asgi_app(app, max_workers=2)
+    app.config["MAX_CONTENT_LENGTH"] = 10
+    try:
+        status, content = _request(asgi_app, "PUT", "/api/v1/datanodes/asgi_dn_large/write/", body=list(range(100)))
+        assert status == 413
+        # The body is also rejected by the WSGI application, for the other routes.
+        status, _ = _request(asgi_app, "POST", "/api/v1/scenarios/", body=list(range(100)))
+        assert status == 413
+    finally:
+        app.config["MAX_CONTENT_LENGTH"] = None
+
+
+def test_asgi_compression_and_metrics(app):
+    asgi_app = create_asgi_app(app, max_workers=2)
+    data_node = InMemoryDataNode(
+        "input_ds", Scope.SCENARIO, DataNodeId("asgi_dn_gzip"), properties={"default_data": list(range(1000))}
+    )
+    _DataManager._set(data_node)
+    path = f"/api/v1/datanodes/{data_node.id}/read/"
+
+    messages = _messages(asgi_app, "GET", path, headers=[(b"accept-encoding", b"gzip")])
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert json.loads(gzip.decompress(messages[1]["body"])) == {"data": list(range(1000))}
+    assert b"content-encoding" not in dict(_messages(asgi_app, "GET", path)[0]["headers"])
+
+    compressor.enabled = False
+    try:
+        messages = _messages(asgi_app, "GET", path, headers=[(b"accept-encoding", b"gzip")])
+        assert b"content-encoding" not in dict(messages[0]["headers"])
+    finally:
+        compressor.enabled = True
+
+    rendered = metrics.render()
+    assert 'taipy_rest_requests_total{endpoint="datanode_reader",method="GET",status="200"}' in rendered
+
+
+def test_asgi_streamed_response_does_not_hold_workers(app):
+    app.config["JOB_EVENTS_KEEPALIVE"] = 2
+    asgi_app = create_asgi_app(app, max_workers=1, max_streams=1)
+
+    async def scenario():
+        stream_messages, disconnect = [], asyncio.Event()
+        requests = [{"type": "http.request", "body": b""}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            stream_messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/jobs/events/", "query_string": b"", "headers": []}
+        stream = asyncio.ensure_future(asgi_app(scope, receive, send))
+        while len(stream_messages) < 2:
+            await asyncio.sleep(0.01)
+
+        # The only worker thread is free while the job events are streamed.
+        other_messages = []
+
+        async def other_send(message):
+            other_messages.append(message)
+
+        other_requests = [{"type": "http.request", "body": b""}]
+
+        async def other_receive():
+            if other_requests:
+                return other_requests.pop()
+            await asyncio.sleep(3600)
+
+        other_scope = {**scope, "path": "/api/v1/jobs/"}
+        await asyncio.wait_for(asgi_app(other_scope, other_receive, other_send), timeout=1)
+        disconnect.set()
+        await asyncio.wait_for(stream, timeout=5)
+        return stream_messages[0]["status"], other_messages[0]["status"]
+
+    try:
+        assert asyncio.run(scenario()) == (200, 200)
+    finally:
+        app.config["JOB_EVENTS_KEEPALIVE"] = 15
+
+
+def test_asgi_concurrent_slow_reads(app):
+    asgi_app = create_asgi_app(app, max_workers=4)
+
+    def _slow_read(datanode_id, filters):
+        time.sleep(0.1)
+        return b'{"data": []}'
+
+    async def read(messages):
+        requests = [{"type": "http.request", "body": b""}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await asyncio.sleep(3600)
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/datanodes/slow_dn/read/", "headers": []}
+        await asgi_app(scope, receive, send)
+        return messages[0]["status"]
+
+    async def scenario():
+        return await asyncio.gather(*(read([]) for _ in range(20)))
+
+    # The reads wait for a free thread of the application instead of being rejected.
+    with mock.patch("src.taipy.rest.asgi._read", _slow_read):
+        assert asyncio.run(scenario()) == [200] * 20
+
+
+def test_asgi_websocket_rejected(app):
+    messages = []
+    connections = [{"type": "websocket.connect"}]
+
+    async def receive():
+        return connections.pop()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "websocket", "path": "/api/v1/events/", "query_string": b"", "headers": []}
+    asyncio.run(create_asgi_app(app)(scope, receive, send))
+    assert messages == [{"type": "websocket.close", "code": 1003}]
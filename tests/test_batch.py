@@ -0,0 +1,113 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gzip
+import json
+from unittest import mock
+
+from flask import url_for
+
+from src.taipy.rest.commons.timing import _timing
+from src.taipy.rest.extensions import compressor, server_timing
+
+
+def test_batch_create_and_delete_scenario(client, default_scenario_config):
+    operations = [
+        {"operation": "create", "entity": "scenario", "params": {"config_id": default_scenario_config.id}},
+        {"operation": "delete", "entity": "scenario", "id": "$0"},
+    ]
+    rep = client.post(url_for("api.batch"), json={"operations": operations})
+    assert rep.status_code == 200
+
+    results = rep.get_json()["results"]
+    assert [result["status"] for result in results] == [201, 200]
+    scenario_id = results[0]["response"]["scenario"]["id"]
+    assert client.get(url_for("api.scenario_by_id", scenario_id=scenario_id)).status_code == 404
+
+
+def test_batch_compressed_response(app, client, default_scenario_config):
+    operations = [
+        {"operation": "create", "entity": "scenario", "params": {"config_id": default_scenario_config.id}},
+        {"operation": "delete", "entity": "scenario", "id": "$0"},
+    ]
+    app.config["COMPRESS_MIN_SIZE"] = 1
+    compressor.init_app(app)
+    try:
+        rep = client.post(url_for("api.batch"), json={"operations": operations}, headers={"Accept-Encoding": "gzip"})
+    finally:
+        app.config["COMPRESS_MIN_SIZE"] = 500
+        compressor.init_app(app)
+    assert rep.status_code == 200
+    assert rep.headers["Content-Encoding"] == "gzip"
+
+    # The responses of the operations are not compressed, their content is kept in the results.
+    results = json.loads(gzip.decompress(rep.data))["results"]
+    assert [result["status"] for result in results] == [201, 200]
+    assert results[0]["response"]["scenario"]["id"]
+
+
+def test_batch_server_timing(app, client, default_scenario_config):
+    operations = [
+        {"operation": "create", "entity": "scenario", "params": {"config_id": default_scenario_config.id}},
+        {"operation": "delete", "entity": "scenario", "id": "$0"},
+    ]
+    app.config["SERVER_TIMING_ENABLED"] = True
+    server_timing.init_app(app)
+    try:
+        with mock.patch.object(server_timing, "_logger") as logger_mock:
+            rep = client.post(url_for("api.batch"), json={"operations": operations})
+    finally:
+        app.config["SERVER_TIMING_ENABLED"] = False
+        server_timing.init_app(app)
+    assert rep.status_code == 200
+
+    # The operations are timed as nested requests, without ending the timing of the batch.
+    assert "total;dur=" in rep.headers["Server-Timing"]
+    endpoints = [call.kwargs["extra"]["endpoint"] for call in logger_mock.info.call_args_list]
+    assert endpoints == ["scenarios", "scenario_by_id", "batch"]
+    assert _timing.get() is None
+
+
+def test_batch_continue_and_fail_fast(client):
+    operations = [
+        {"operation": "delete", "entity": "scenario", "id": "foo"},
+        {"operation": "write", "entity": "scenario", "id": "foo"},
+        {"operation": "delete", "entity": "job", "id": "$0"},
+    ]
+    rep = client.post(url_for("api.batch"), json={"operations": operations})
+    assert rep.status_code == 200
+    assert [result["status"] for result in rep.get_json()["results"]] == [404, 400, 400]
+
+    rep = client.post(url_for("api.batch"), json={"operations": operations, "fail_fast": True})
+    assert rep.status_code == 200
+    assert [result["status"] for result in rep.get_json()["results"]] == [404, 424, 424]
+
+
+def test_batch_validation(app, client):
+    rep = client.post(url_for("api.batch"), json={"operations": [{"operation": "read", "entity": "scenario"}]})
+    assert rep.status_code == 400
+
+    app.config["BATCH_MAX_OPERATIONS"] = 1
+    operations = [{"operation": "delete", "entity": "scenario", "id": "foo"}] * 2
+    rep = client.post(url_for("api.batch"), json={"operations": operations})
+    assert rep.status_code == 400
+
+
+def test_batch_reserved_params(client):
+    operations = [
+        {"operation": "delete", "entity": "scenario", "id": "foo", "params": {"scenario_id": "bar"}},
+        {"operation": "delete", "entity": "scenario", "id": "foo", "params": {"_anchor": "bar"}},
+    ]
+    rep = client.post(url_for("api.batch"), json={"operations": operations})
+    assert rep.status_code == 200
+    results = rep.get_json()["results"]
+    assert [result["status"] for result in results] == [400, 400]
+    assert results[0]["response"]["message"] == "Parameters scenario_id are reserved."
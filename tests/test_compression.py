@@ -0,0 +1,125 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gzip
+import json
+import zlib
+from unittest import mock
+
+import pytest
+from flask import Flask, Response, url_for
+
+from src.taipy.rest.commons.compression import Compressor
+from src.taipy.rest.extensions import request_decompressor
+from taipy.config.common.scope import Scope
+from taipy.core import DataNodeId
+from taipy.core.data.in_memory import InMemoryDataNode
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+
+
+@pytest.fixture(autouse=True)
+def build_managers():
+    _TaskManagerFactory._build_manager()
+    _JobManagerFactory._build_manager()
+
+
+def test_compress_list(client, create_job_list):
+    url = url_for("api.jobs")
+    plain = client.get(url)
+    assert "Content-Encoding" not in plain.headers
+
+    rep = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert rep.status_code == 200
+    assert rep.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in rep.headers["Vary"]
+    assert int(rep.headers["Content-Length"]) < len(plain.data)
+    assert json.loads(gzip.decompress(rep.data)) == plain.json
+
+
+def test_compress_negotiation(client, create_job_list):
+    brotli = pytest.importorskip("brotli")
+    zstandard = pytest.importorskip("zstandard")
+    url = url_for("api.jobs")
+    plain = client.get(url)
+
+    rep = client.get(url, headers={"Accept-Encoding": "gzip, br, zstd"})
+    assert rep.headers["Content-Encoding"] == "zstd"
+    assert json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(rep.data)) == plain.json
+
+    rep = client.get(url, headers={"Accept-Encoding": "gzip;q=0.5, br, zstd;q=0"})
+    assert rep.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(rep.data)) == plain.json
+
+    rep = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in rep.headers
+
+
+def test_compress_thresholds():
+    app = Flask(__name__)
+    app.config.update({"COMPRESS_MIN_SIZE": 100, "COMPRESS_ENCODINGS": ["gzip"]})
+    Compressor(app)
+
+    @app.route("/small")
+    def small():
+        return {"data": 1}
+
+    @app.route("/image")
+    def image():
+        return Response(b"0" * 1000, mimetype="image/png")
+
+    @app.route("/stream")
+    def stream():
+        return Response((f"data: {i}\n\n" for i in range(100)), mimetype="text/event-stream")
+
+    client = app.test_client()
+    headers = {"Accept-Encoding": "gzip"}
+    assert "Content-Encoding" not in client.get("/small", headers=headers).headers
+    assert "Content-Encoding" not in client.get("/image", headers=headers).headers
+
+    rep = client.get("/stream", headers=headers, buffered=False)
+    assert rep.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in rep.headers
+    chunks = list(rep.response)
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    # Each event is flushed: it can be decompressed as soon as it is received.
+    assert decompressor.decompress(chunks[0]) == b"data: 0\n\n"
+    assert decompressor.decompress(b"".join(chunks[1:])) == b"".join(f"data: {i}\n\n".encode() for i in range(1, 100))
+
+
+def test_decompress_request(app, client):
+    zstandard = pytest.importorskip("zstandard")
+    data_node = InMemoryDataNode("input_ds", Scope.SCENARIO, DataNodeId("compressed_dn"))
+    url = url_for("api.datanode_writer", datanode_id=data_node.id)
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock:
+        manager_mock.return_value = data_node
+        for encoding, body in (
+            ("gzip", gzip.compress(json.dumps([1, 2]).encode())),
+            ("zstd", zstandard.ZstdCompressor().compress(json.dumps([3, 4]).encode())),
+        ):
+            rep = client.put(url, data=body, headers={"Content-Encoding": encoding, "Content-Type": "application/json"})
+            assert rep.status_code == 200
+        assert data_node.read() == [3, 4]
+
+        headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+        assert client.put(url, data=b"not gzip", headers=headers).status_code == 400
+        headers["Content-Encoding"] = "compress"
+        assert client.put(url, data=b"[]", headers=headers).status_code == 415
+
+        app.config["REQUEST_DECOMPRESSED_MAX_SIZE"] = 1000
+        request_decompressor.init_app(app)
+        try:
+            bomb = gzip.compress(b"[" + b"0," * 10000 + b"0]")
+            headers["Content-Encoding"] = "gzip"
+            assert client.put(url, data=bomb, headers=headers).status_code == 413
+        finally:
+            app.config["REQUEST_DECOMPRESSED_MAX_SIZE"] = 2 * 1024**3
+            request_decompressor.init_app(app)
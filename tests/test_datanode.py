@@ -9,11 +9,20 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+import pandas as pd
 import pytest
 from flask import url_for
 
+from src.taipy.rest.commons.server import _request_threads
+from src.taipy.rest.extensions import data_node_io, data_node_reads, server_timing
+from taipy.config.common.scope import Scope
+from taipy.core.data.csv import CSVDataNode
+
 
 def test_get_datanode(client, default_datanode):
     # test 404
@@ -109,3 +118,96 @@ def test_write_datanode(client, default_datanode):
         rep = client.get(datanodes_read_url, json={})
         assert rep.status_code == 200
         assert rep.json == {"data": [1, 2, 3]}
+
+
+def test_read_datanode_io_pool_saturated(app, client, default_datanode):
+    app.config.update({"DATANODE_IO_MAX_WORKERS": 1, "DATANODE_IO_MAX_QUEUE": 0, "DATANODE_IO_RETRY_AFTER": 3})
+    data_node_io.init_app(app)
+    release = threading.Event()
+    try:
+        with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
+            config_mock.return_value = default_datanode
+            blocking = data_node_io.submit(release.wait)
+            rep = client.get(url_for("api.datanode_reader", datanode_id=default_datanode.id))
+            assert rep.status_code == 503
+            assert rep.headers["Retry-After"] == "3"
+            assert data_node_io.metrics["rejected"] >= 1
+
+            release.set()
+            blocking.result()
+            rep = client.get(url_for("api.datanode_reader", datanode_id=default_datanode.id))
+            assert rep.status_code == 200
+    finally:
+        release.set()
+        app.config.update({"DATANODE_IO_MAX_WORKERS": 3, "DATANODE_IO_MAX_QUEUE": 0, "DATANODE_IO_RETRY_AFTER": 1})
+        data_node_io.init_app(app)
+
+
+def test_read_datanode_io_pool_saturated_with_free_request_threads(app, client, default_datanode):
+    assert data_node_io.max_workers + data_node_io.max_queue < _request_threads()
+    release = threading.Event()
+
+    def _blocking_read(datanode_id, filters):
+        release.wait()
+        return b'{"data": []}'
+
+    url = url_for("api.datanode_reader", datanode_id=default_datanode.id)
+    request_threads = ThreadPoolExecutor(_request_threads())
+    try:
+        with mock.patch("src.taipy.rest.api.resources.datanode._read", _blocking_read):
+            blocked = [request_threads.submit(client.get, url) for _ in range(data_node_io.max_workers)]
+            while data_node_io.metrics["running"] < data_node_io.max_workers:
+                time.sleep(0.01)
+            rep = request_threads.submit(client.get, url).result(timeout=5)
+            assert rep.status_code == 503
+
+            release.set()
+            assert all(future.result(timeout=5).status_code == 200 for future in blocked)
+    finally:
+        release.set()
+        request_threads.shutdown()
+
+
+def test_read_datanode_in_process_pool(app, client, tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_csv(path, index=False)
+    data_node = CSVDataNode("csv_dn", Scope.SCENARIO, properties={"path": path, "has_header": True})
+    app.config.update(
+        {"DATANODE_READ_PROCESSES": 1, "DATANODE_READ_PROCESS_MIN_SIZE": 0, "DATANODE_READ_PROCESS_FOLDER": tmp_path}
+    )
+    data_node_reads.init_app(app)
+    try:
+        with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
+            config_mock.return_value = data_node
+            assert data_node_reads.accepts(data_node)
+            operators = {"operators": [{"key": "a", "value": 2, "operator": "GREATER_OR_EQUAL"}]}
+            rep = client.get(url_for("api.datanode_reader", datanode_id=data_node.id), json=operators)
+            assert rep.status_code == 200
+            assert rep.json == {"data": [{"a": 2, "b": "y"}, {"a": 3, "b": "z"}]}
+            assert not list(tmp_path.glob("*.json"))
+    finally:
+        data_node_reads.shutdown()
+        app.config.update({"DATANODE_READ_PROCESSES": 0, "DATANODE_READ_PROCESS_FOLDER": None})
+        data_node_reads.init_app(app)
+
+
+def test_datanode_server_timing(app, client, default_df_datanode):
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
+        config_mock.return_value = default_df_datanode
+        datanodes_url = url_for("api.datanode_reader", datanode_id="foo")
+        assert "Server-Timing" not in client.get(datanodes_url).headers
+
+        app.config["SERVER_TIMING_ENABLED"] = True
+        server_timing.init_app(app)
+        try:
+            with mock.patch.object(server_timing, "_logger") as logger_mock:
+                rep = client.get(datanodes_url)
+            assert rep.status_code == 200
+            phases = [metric.split(";dur=")[0] for metric in rep.headers["Server-Timing"].split(", ")]
+            assert phases == ["lookup", "io", "transform", "serialize", "total"]
+            logger_mock.info.assert_called_once()
+            assert logger_mock.info.call_args.kwargs["extra"]["endpoint"] == "datanode_reader"
+            assert set(logger_mock.info.call_args.kwargs["extra"]["timing"]) == {*phases}
+        finally:
+            app.config["SERVER_TIMING_ENABLED"] = False
+            server_timing.init_app(app)
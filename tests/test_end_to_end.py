@@ -23,7 +23,8 @@ def create_and_submit_scenario(config_id: str, client) -> Dict:
     assert (set(scenario) - set(json.load(open("tests/json/expected/scenario.json")))) == set()
 
     response = client.post(url_for("api.scenario_submit", scenario_id=scenario.get("id")))
-    assert response.status_code == 200
+    assert response.status_code == 202
+    assert response.headers["Location"].endswith(f"/submissions/{response.json.get('submission_id')}/")
 
     return scenario
 
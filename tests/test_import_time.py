@@ -0,0 +1,45 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+# Modules only needed to build the API spec or to serve WebSocket connections.
+_DEFERRED_MODULES = ("apispec_webframeworks", "pkg_resources", "flask_sock", "simple_websocket", "wsproto")
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Run *code* with `python -X importtime` and return the cumulative import time of each module in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    # Taipy Core is imported first, so that only the import time of the REST package is measured.
+    times = _import_times("import taipy.core; from src.taipy.rest.app import create_app; create_app()")
+
+    assert not [module for module in _DEFERRED_MODULES if module in times]
+    budget_ms = float(os.environ.get("TAIPY_REST_IMPORT_BUDGET_MS", 1000))
+    assert times["src.taipy.rest"] / 1000 < budget_ms
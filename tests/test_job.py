@@ -9,10 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
+import os
+import threading
+import time
 from unittest import mock
 
+import pytest
 from flask import url_for
 
+from src.taipy.rest.commons.job_retention import JobPruner
+from src.taipy.rest.extensions import job_events, job_pruner, streams
+from taipy.core.job._job_manager import _JobManager
+from taipy.core.job.status import Status
+from taipy.core.notification import EventEntityType, EventOperation
+from taipy.core.notification.event import Event
+
 
 def test_get_job(client, default_job):
     # test 404
@@ -81,3 +93,260 @@ def test_cancel_job(client, default_job):
         # test get_job
         rep = client.post(url_for("api.job_cancel", job_id="foo"))
         assert rep.status_code == 200
+
+
+def test_job_events(app, client, default_job):
+    app.config["JOB_EVENTS_KEEPALIVE"] = 0.1
+    _JobManager._set(default_job)
+
+    rep = client.get(
+        url_for("api.job_events", submission_id=default_job.submit_id, status="completed"),
+        headers={"Last-Event-ID": str(job_events.last_id)},
+    )
+    assert rep.status_code == 200
+    assert rep.mimetype == "text/event-stream"
+
+    stream = iter(rep.response)
+    assert next(stream).startswith(b"retry:")
+    default_job.running()
+    default_job.completed()
+
+    events = []
+    for _ in range(50):
+        chunk = next(stream).decode()
+        if chunk.startswith("id:"):
+            events.append(json.loads(chunk.split("data: ", 1)[1]))
+            break
+    rep.close()
+
+    assert len(events) == 1
+    assert events[0]["entity_id"] == default_job.id
+    assert events[0]["status"] == "COMPLETED"
+    assert events[0]["submission_id"] == default_job.submit_id
+
+
+def test_job_events_last_event_id_beyond_last(app, client, default_job):
+    app.config["JOB_EVENTS_KEEPALIVE"] = 0.1
+    _JobManager._set(default_job)
+
+    # The client received its last event from a previous server process, whose ids were larger.
+    rep = client.get(url_for("api.job_events"), headers={"Last-Event-ID": str(job_events.last_id + 1000)})
+    stream = iter(rep.response)
+    assert next(stream).startswith(b"retry:")
+    default_job.running()
+
+    events = []
+    for _ in range(50):
+        chunk = next(stream).decode()
+        if chunk.startswith("id:"):
+            events.append(json.loads(chunk.split("data: ", 1)[1]))
+            break
+    rep.close()
+    app.config["JOB_EVENTS_KEEPALIVE"] = 15
+
+    assert [event["entity_id"] for event in events] == [default_job.id]
+
+
+def test_job_streams_limit(app, client, default_job):
+    _JobManager._set(default_job)
+    app.config["WSGI_MAX_STREAMS"] = 1
+    streams.init_app(app)
+    try:
+        rep = client.get(url_for("api.job_events"))
+        assert rep.status_code == 200
+
+        busy = client.get(url_for("api.job_events"))
+        assert busy.status_code == 503
+        assert busy.headers["Retry-After"] == "5"
+        assert client.get(url_for("api.job_wait", job_id=default_job.id, timeout=0)).status_code == 503
+        # The other requests are still served.
+        assert client.get(url_for("api.job_by_id", job_id=default_job.id)).status_code == 200
+
+        rep.close()
+        assert client.get(url_for("api.job_wait", job_id=default_job.id, timeout=0)).status_code == 200
+    finally:
+        app.config["WSGI_MAX_STREAMS"] = 2
+        streams.init_app(app)
+
+
+def test_job_event_status_carried_by_event(default_job):
+    default_job.completed()
+    _JobManager._set(default_job)
+
+    event = Event(EventEntityType.JOB, default_job.id, EventOperation.UPDATE, "status")
+    assert job_events._to_record(event)["status"] == "COMPLETED"
+    event.attribute_value = Status.RUNNING
+    assert job_events._to_record(event)["status"] == "RUNNING"
+
+
+def test_wait_job(client, default_job):
+    rep = client.get(url_for("api.job_wait", job_id="foo"))
+    assert rep.status_code == 404
+
+    _JobManager._set(default_job)
+    rep = client.get(url_for("api.job_wait", job_id=default_job.id, timeout=0.1))
+    assert rep.status_code == 200
+    assert rep.json["is_finished"] is False
+
+    timer = threading.Timer(0.2, default_job.completed)
+    timer.start()
+    rep = client.get(url_for("api.job_wait", job_id=default_job.id, timeout=10))
+    timer.join()
+    assert rep.status_code == 200
+    assert rep.json["is_finished"] is True
+    assert rep.json["job"]["status"] == "Status.COMPLETED"
+
+
+def test_wait_jobs(client, create_job_list):
+    rep = client.get(url_for("api.jobs_wait"))
+    assert rep.status_code == 400
+    rep = client.get(url_for("api.jobs_wait", job_id="foo", mode="first"))
+    assert rep.status_code == 400
+
+    first_job, second_job = _JobManager._get_all()[:2]
+    job_ids = f"{first_job.id},{second_job.id}"
+    first_job.completed()
+
+    rep = client.get(url_for("api.jobs_wait", job_id=job_ids, timeout=10))
+    assert rep.status_code == 200
+    assert rep.json["is_finished"] is True
+    assert [job["id"] for job in rep.json["jobs"]] == [first_job.id, second_job.id]
+
+    rep = client.get(url_for("api.jobs_wait", job_id=job_ids, mode="all", timeout=0.1))
+    assert rep.status_code == 200
+    assert rep.json["is_finished"] is False
+
+
+def test_job_stats(client, create_job_list):
+    rep = client.get(url_for("api.job_stats", group_by="foo"))
+    assert rep.status_code == 400
+
+    rep = client.get(url_for("api.job_stats"))
+    assert rep.status_code == 200
+    assert rep.json["total"] == 10
+    assert rep.json["by_status"] == {"SUBMITTED": 10}
+    assert rep.json["by_task_config"] == {"foo": {"SUBMITTED": 10}}
+    assert "by_submission" not in rep.json
+
+    job = _JobManager._get_all()[0]
+    job.completed()
+    for _ in range(50):
+        rep = client.get(url_for("api.job_stats", group_by="task_config,submission"))
+        if "COMPLETED" in rep.json["by_status"]:
+            break
+        time.sleep(0.1)
+    assert rep.json["by_status"] == {"SUBMITTED": 9, "COMPLETED": 1}
+    assert rep.json["by_submission"][job.submit_id] == {"COMPLETED": 1}
+
+
+def test_bulk_cancel_jobs(client, create_job_list):
+    from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+    _OrchestratorFactory._build_orchestrator()
+    _OrchestratorFactory._build_dispatcher()
+
+    rep = client.post(url_for("api.jobs_cancel"), json={})
+    assert rep.status_code == 400
+
+    first_job, second_job = _JobManager._get_all()[:2]
+    first_job.completed()
+    rep = client.post(url_for("api.jobs_cancel"), json={"job_ids": [first_job.id, second_job.id, "foo"]})
+    assert rep.status_code == 200
+    assert {result["id"]: result["status"] for result in rep.json["results"]} == {
+        "foo": 404,
+        first_job.id: 409,
+        second_job.id: 200,
+    }
+    assert _JobManager._get(second_job.id).is_canceled()
+
+
+def test_bulk_delete_jobs(client, create_job_list):
+    first_job = _JobManager._get_all()[0]
+    first_job.failed()
+
+    rep = client.delete(url_for("api.jobs"), json={"status": ["FAILED"], "older_than": "2100-01-01T00:00:00"})
+    assert rep.status_code == 200
+    assert rep.json["results"] == [{"id": first_job.id, "status": 200, "message": f"Job {first_job.id} was deleted."}]
+
+    rep = client.delete(url_for("api.jobs"), json={"task_config_id": ["foo"]})
+    assert [result["status"] for result in rep.json["results"]] == [409] * 9
+
+    for force in ("false", "true", 1):
+        rep = client.delete(url_for("api.jobs"), json={"task_config_id": ["foo"], "force": force})
+        assert rep.status_code == 400
+    assert len(_JobManager._get_all()) == 9
+
+    rep = client.delete(url_for("api.jobs"), json={"task_config_id": ["foo"], "force": True})
+    assert [result["status"] for result in rep.json["results"]] == [200] * 9
+    assert len(_JobManager._get_all()) == 0
+
+
+def test_job_retention(app, client, create_job_list, monkeypatch, tmp_path):
+    with pytest.raises(ValueError):
+        app.config["JOB_RETENTION"] = {"RUNNING": {"max_age": 10}}
+        JobPruner(app)
+
+    jobs = _JobManager._get_all()
+    for job in jobs[:3]:
+        job.failed()
+    jobs[3].completed()
+    monkeypatch.setattr(job_pruner, "policy", {"FAILED": {"max_count": 1}, "COMPLETED": {"max_age": 3600}})
+    monkeypatch.setattr(job_pruner, "archive_folder", str(tmp_path))
+
+    rep = client.post(url_for("api.job_retention"))
+    assert rep.status_code == 200
+    assert rep.json["pruned"] == {"FAILED": 2}
+    assert len(_JobManager._get_all()) == 8
+    assert len(os.listdir(tmp_path / "jobs")) == 2
+
+    rep = client.get(url_for("api.job_retention"))
+    assert rep.json["policy"] == {"FAILED": {"max_count": 1}, "COMPLETED": {"max_age": 3600}}
+    assert rep.json["metrics"]["pruned"]["FAILED"] >= 2
+
+
+def test_job_retention_concurrent_runs(create_job_list, monkeypatch):
+    for job in _JobManager._get_all():
+        job.failed()
+    monkeypatch.setattr(job_pruner, "policy", {"FAILED": {"max_count": 0}})
+    deleted = []
+    delete = _JobManager._delete
+
+    def _slow_delete(job, *args, **kwargs):
+        deleted.append(job.id)
+        time.sleep(0.01)
+        delete(job, *args, **kwargs)
+
+    monkeypatch.setattr(_JobManager, "_delete", _slow_delete)
+    results = []
+    runs = [threading.Thread(target=lambda: results.append(job_pruner.prune())) for _ in range(2)]
+    for run in runs:
+        run.start()
+    for run in runs:
+        run.join()
+
+    assert sorted(deleted) == sorted(set(deleted))
+    assert sorted(result.get("FAILED", 0) for result in results) == [0, 10]
+
+
+def test_job_stacktraces(app, client, default_job):
+    app.config["JOB_STACKTRACE_MAX_LENGTH"] = 10
+    default_job._stacktrace = ["Traceback: first error", "Traceback: second error"]
+    _JobManager._set(default_job)
+
+    rep = client.get(url_for("api.jobs"))
+    assert "stacktrace" not in rep.json[0]
+    rep = client.get(url_for("api.jobs", stacktrace="truncated"))
+    assert rep.json[0]["stacktrace"] == ["...irst error", "...cond error"]
+    rep = client.get(url_for("api.jobs", stacktrace="full"))
+    assert rep.json[0]["stacktrace"] == default_job.stacktrace
+    rep = client.get(url_for("api.jobs", stacktrace="foo"))
+    assert rep.status_code == 400
+
+    rep = client.get(url_for("api.job_stacktrace", job_id="foo"))
+    assert rep.status_code == 404
+    rep = client.get(url_for("api.job_stacktrace", job_id=default_job.id))
+    assert rep.status_code == 200
+    assert rep.text == "Traceback: first error\n\nTraceback: second error"
+    rep = client.get(url_for("api.job_stacktrace", job_id=default_job.id), headers={"Range": "bytes=11-15"})
+    assert rep.status_code == 206
+    assert rep.text == "first"
@@ -0,0 +1,125 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from src.taipy.rest.commons.metrics import Metrics
+from taipy.config.common.scope import Scope
+from taipy.core import DataNodeId
+from taipy.core.data.in_memory import InMemoryDataNode
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+
+
+@pytest.fixture(autouse=True)
+def build_managers():
+    _TaskManagerFactory._build_manager()
+    _JobManagerFactory._build_manager()
+
+
+def _samples(client):
+    rep = client.get("/metrics")
+    assert rep.status_code == 200
+    assert rep.content_type.startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in rep.get_data(as_text=True).splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_request_metrics(client):
+    url = url_for("api.jobs")
+    labels = 'endpoint="jobs",method="GET",status="200"'
+    before = _samples(client)
+    for _ in range(3):
+        assert client.get(url).status_code == 200
+    assert client.get(url_for("api.job_by_id", job_id="foo")).status_code == 404
+    samples = _samples(client)
+
+    def delta(name):
+        return samples[name] - before.get(name, 0)
+
+    assert delta(f"taipy_rest_requests_total{{{labels}}}") == 3
+    assert delta('taipy_rest_requests_total{endpoint="job_by_id",method="GET",status="404"}') == 1
+    assert delta(f"taipy_rest_request_duration_seconds_count{{{labels}}}") == 3
+    assert delta(f'taipy_rest_request_duration_seconds_bucket{{{labels},le="+Inf"}}') == 3
+    assert delta('taipy_rest_response_size_bytes_count{endpoint="jobs"}') == 3
+    assert delta("taipy_rest_requests_in_flight") == 0
+    # The metrics endpoint is not served by the api blueprint.
+    assert not any('endpoint="metrics"' in name for name in samples)
+
+
+def test_batch_metrics(client):
+    operations = [
+        {"operation": "delete", "entity": "scenario", "id": "foo"},
+        {"operation": "delete", "entity": "cycle", "id": "foo"},
+    ]
+    before = _samples(client)
+    for _ in range(3):
+        assert client.post(url_for("api.batch"), json={"operations": operations}).status_code == 200
+    samples = _samples(client)
+
+    def delta(name):
+        return samples.get(name, 0) - before.get(name, 0)
+
+    # The operations are measured as nested requests, without ending the measure of the batch.
+    assert delta('taipy_rest_requests_total{endpoint="batch",method="POST",status="200"}') == 3
+    assert delta('taipy_rest_requests_total{endpoint="scenario_by_id",method="DELETE",status="404"}') == 3
+    assert delta('taipy_rest_requests_total{endpoint="cycle_by_id",method="DELETE",status="404"}') == 3
+    assert delta("taipy_rest_requests_in_flight") == 0
+
+
+def test_datanode_io_metrics(client):
+    data_node = InMemoryDataNode("input_ds", Scope.SCENARIO, DataNodeId("metrics_dn"))
+    read = 'operation="read",storage_type="in_memory"'
+    write = 'operation="write",storage_type="in_memory"'
+    before = _samples(client)
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock:
+        manager_mock.return_value = data_node
+        rep = client.put(url_for("api.datanode_writer", datanode_id=data_node.id), json=[1, 2, 3])
+        assert rep.status_code == 200
+        rep = client.get(url_for("api.datanode_reader", datanode_id=data_node.id))
+        assert rep.json == {"data": [1, 2, 3]}
+    samples = _samples(client)
+
+    assert samples[f"taipy_rest_datanode_io_bytes_total{{{write}}}"] - before.get(
+        f"taipy_rest_datanode_io_bytes_total{{{write}}}", 0
+    ) == len(b"[1, 2, 3]")
+    assert samples[f"taipy_rest_datanode_io_bytes_total{{{read}}}"] - before.get(
+        f"taipy_rest_datanode_io_bytes_total{{{read}}}", 0
+    ) == len(rep.data)
+    assert samples[f"taipy_rest_datanode_io_duration_seconds_count{{{read}}}"] >= 1
+
+
+def test_metrics_merge_threads():
+    metrics = Metrics()
+    threads = [
+        threading.Thread(target=lambda: [metrics.observe("taipy_rest_response_size_bytes", {}, 50) for _ in range(10)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics.inc("taipy_rest_requests_in_flight", {})
+
+    rendered = metrics.render()
+    assert 'taipy_rest_response_size_bytes_bucket{le="100"} 40' in rendered
+    assert "taipy_rest_response_size_bytes_count 40" in rendered
+    assert "taipy_rest_requests_in_flight 1" in rendered
+    # The stores of the threads that ended are merged once they are collected.
+    assert len(metrics._stores) == 1
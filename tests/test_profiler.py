@@ -0,0 +1,107 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import pstats
+import threading
+import time
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from src.taipy.rest.extensions import profiler
+from taipy.config.common.scope import Scope
+from taipy.core import DataNodeId
+from taipy.core.data.in_memory import InMemoryDataNode
+
+TOKEN = "admin-token"
+
+
+@pytest.fixture
+def admin(app):
+    app.config["ADMIN_TOKEN"] = TOKEN
+    yield {"Authorization": f"Bearer {TOKEN}"}
+    app.config["ADMIN_TOKEN"] = None
+
+
+def _slow_filter(*args, **kwargs):
+    time.sleep(0.5)
+    return [1]
+
+
+def _profile_slow_read(client, headers, **args):
+    data_node = InMemoryDataNode("input_ds", Scope.SCENARIO, DataNodeId("profiled_dn"))
+    url = url_for("api.datanode_reader", datanode_id=data_node.id)
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock, mock.patch.object(
+        InMemoryDataNode, "filter", _slow_filter
+    ):
+        manager_mock.return_value = data_node
+        reader = threading.Thread(target=client.get, args=(url,))
+        reader.start()
+        rep = client.get(url_for("admin_profile", seconds=0.3, interval=0.005, **args), headers=headers)
+        reader.join()
+    return rep
+
+
+def test_profile_protected(app, client):
+    url = url_for("admin_profile", seconds=0.01)
+    assert client.get(url).status_code == 404
+    app.config["ADMIN_TOKEN"] = TOKEN
+    try:
+        assert client.get(url).status_code == 401
+        assert client.get(url, headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert client.get(url, headers={"Authorization": f"Bearer {TOKEN}"}).status_code == 200
+    finally:
+        app.config["ADMIN_TOKEN"] = None
+
+
+def test_profile_collapsed(client, admin):
+    rep = _profile_slow_read(client, admin)
+    assert rep.status_code == 200
+    lines = rep.get_data(as_text=True).splitlines()
+    slow = [line for line in lines if "_slow_filter (test_profiler.py" in line]
+    assert slow
+    # The data node read runs on the I/O pool, on behalf of the reader endpoint.
+    assert all(line.startswith("datanode_reader;") for line in slow)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in slow) > 10
+
+
+def test_profile_pstats(client, admin, tmp_path):
+    rep = _profile_slow_read(client, admin, format="pstats")
+    assert rep.status_code == 200
+    path = tmp_path / "profile.pstats"
+    path.write_bytes(rep.data)
+    stats = pstats.Stats(str(path)).stats
+    slow = next(value for function, value in stats.items() if function[2] == "_slow_filter")
+    assert slow[3] > 0.05
+    assert any(function[2] == "<datanode_reader>" for function in stats)
+
+
+def test_profile_invalid(client, admin):
+    for args in ({"seconds": "a"}, {"seconds": 0}, {"seconds": 1000}, {"seconds": 1, "format": "svg"}):
+        assert client.get(url_for("admin_profile", **args), headers=admin).status_code == 400
+    with mock.patch.object(profiler, "_lock") as lock_mock:
+        lock_mock.acquire.return_value = False
+        assert client.get(url_for("admin_profile", seconds=0.01), headers=admin).status_code == 409
+
+
+def test_profile_nested_requests(app, client):
+    # The operations of a batch are nested requests served by the thread of the batch.
+    ident = threading.get_ident()
+    with app.test_request_context(url_for("api.batch"), method="POST"):
+        profiler._before_request()
+        with app.test_request_context(url_for("api.scenarios"), method="POST"):
+            profiler._before_request()
+            assert profiler._threads[ident] == "scenarios"
+            profiler._teardown_request(None)
+        assert profiler._threads[ident] == "batch"
+        profiler._teardown_request(None)
+    assert ident not in profiler._threads
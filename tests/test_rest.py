@@ -0,0 +1,113 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gc
+from unittest import mock
+
+from src.taipy.rest.commons.server import _after_fork, _warmup, _when_ready
+from src.taipy.rest.extensions import apispec, job_pruner
+from src.taipy.rest.rest import Rest
+from taipy.config import Config
+
+
+def test_run_development_server():
+    rest = Rest()
+    with mock.patch.object(rest._app, "run") as run_mock:
+        rest.run(port=5001)
+    run_mock.assert_called_once_with(port=5001)
+
+
+def test_run_production_server():
+    Config.configure_global_app(rest_server="production", rest_workers=3, rest_max_requests=0)
+    rest = Rest()
+    with mock.patch("src.taipy.rest.rest._production_server_available", return_value=True), mock.patch(
+        "src.taipy.rest.rest._run_production_server"
+    ) as server_mock, mock.patch.object(rest._app, "run") as run_mock:
+        rest.run(host="0.0.0.0", port=5001, threads=8)
+
+    run_mock.assert_not_called()
+    settings = server_mock.call_args.args[1]
+    assert settings["bind"] == "0.0.0.0:5001"
+    assert settings["workers"] == 3
+    assert settings["threads"] == 8
+    assert settings["max_requests"] == 0
+    assert settings["keepalive"] == 5
+    assert settings["preload_app"] is True
+    server_mock.assert_called_once()
+    assert server_mock.call_args.args[0]() is rest._app
+    Config.configure_global_app(rest_server="development", rest_workers=None, rest_max_requests=None)
+
+
+def test_run_production_server_without_preload():
+    Config.configure_global_app(rest_server="production", rest_preload="False")
+    rest = Rest()
+    with mock.patch("src.taipy.rest.rest._production_server_available", return_value=True), mock.patch(
+        "src.taipy.rest.rest._run_production_server"
+    ) as server_mock:
+        rest.run()
+
+    assert server_mock.call_args.args[1]["preload_app"] is False
+    assert server_mock.call_args.args[1]["workers"] == 1
+    assert server_mock.call_args.args[0]() is not rest._app
+    Config.configure_global_app(rest_server="development", rest_preload=None)
+
+
+def test_warmup(app):
+    try:
+        _warmup(app)
+        assert gc.get_freeze_count() > 0
+        assert not gc.isenabled()
+        assert apispec._rendered.keys() == {"json", "yaml"}
+        _when_ready()
+        assert gc.isenabled()
+    finally:
+        _after_fork(app)
+        gc.unfreeze()
+        job_pruner._background = True
+    assert gc.isenabled()
+
+
+def test_several_workers_warning():
+    Config.configure_global_app(rest_server="production", rest_workers=2)
+    rest = Rest()
+    with mock.patch("src.taipy.rest.rest._production_server_available", return_value=True), mock.patch(
+        "src.taipy.rest.rest._run_production_server"
+    ), mock.patch("src.taipy.rest.commons.server._TaipyLogger._get_logger") as logger_mock:
+        rest.run()
+    logger_mock.return_value.warning.assert_called_once()
+    assert "/jobs/stats/" in logger_mock.return_value.warning.call_args.args[0]
+    Config.configure_global_app(rest_server="development", rest_workers=None)
+
+
+def test_workers_do_not_prune_in_background(app):
+    app.config["JOB_RETENTION"] = {"COMPLETED": {"max_age": 3600}}
+    thread = job_pruner._thread
+    try:
+        _after_fork(app)
+        job_pruner._thread = None
+        job_pruner.init_app(app)
+        assert job_pruner._thread is None
+    finally:
+        job_pruner._background = True
+        job_pruner._thread = thread
+        app.config["JOB_RETENTION"] = {}
+        job_pruner.init_app(app)
+
+
+def test_run_production_server_without_gunicorn():
+    Config.configure_global_app(rest_server="production")
+    rest = Rest()
+    with mock.patch("src.taipy.rest.rest._production_server_available", return_value=False), mock.patch.object(
+        rest._app, "run"
+    ) as run_mock:
+        rest.run()
+    run_mock.assert_called_once_with()
+    Config.configure_global_app(rest_server="development")
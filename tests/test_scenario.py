@@ -14,6 +14,8 @@ from unittest import mock
 import pytest
 from flask import url_for
 
+from taipy.core.scenario._scenario_manager import _ScenarioManager
+
 
 def test_get_scenario(client, default_scenario):
     # test 404
@@ -87,4 +89,77 @@ def test_execute_scenario(client, default_scenario):
 
         # test get_scenario
         rep = client.post(url_for("api.scenario_submit", scenario_id="foo"))
-        assert rep.status_code == 200
+        assert rep.status_code == 202
+
+
+def test_bulk_create_scenarios(client, default_scenario_config):
+    # without config param
+    bulk_url = url_for("api.scenarios_bulk")
+    rep = client.post(bulk_url, json={"count": 2})
+    assert rep.status_code == 400
+
+    # without count nor scenarios
+    bulk_url = url_for("api.scenarios_bulk", config_id=default_scenario_config.id)
+    rep = client.post(bulk_url, json={})
+    assert rep.status_code == 400
+    for count in (0, 10**9):
+        assert client.post(bulk_url, json={"count": count}).status_code == 400
+
+    rep = client.post(bulk_url, json={"count": 3})
+    assert rep.status_code == 201
+    assert len(rep.get_json()["scenarios"]) == 3
+
+    scenarios = [
+        {"name": "january", "creation_date": "2022-01-01T00:00:00", "properties": {"region": "EU"}, "tags": ["a"]},
+        {"name": "february", "creation_date": "2022-02-01T00:00:00"},
+    ]
+    rep = client.post(bulk_url, json={"scenarios": scenarios})
+    assert rep.status_code == 201
+    created = rep.get_json()["scenarios"]
+    assert created[0]["properties"]["region"] == "EU"
+    assert created[0]["tags"] == ["a"]
+    assert created[1]["creation_date"].startswith("2022-02-01")
+
+    rep = client.get(url_for("api.scenario_by_id", scenario_id=created[0]["id"]))
+    assert rep.get_json()["scenario"]["properties"]["region"] == "EU"
+    assert len(client.get(url_for("api.scenarios")).get_json()) == 5
+
+
+def test_bulk_create_scenarios_unauthorized_tags(client, default_scenario_config):
+    default_scenario_config._properties["authorized_tags"] = ["ok"]
+    bulk_url = url_for("api.scenarios_bulk", config_id=default_scenario_config.id)
+    count = len(client.get(url_for("api.scenarios")).get_json())
+
+    rep = client.post(bulk_url, json={"scenarios": [{"tags": ["ok"]}, {"tags": ["ok"]}, {"tags": ["bad"]}]})
+    assert rep.status_code == 400
+    assert list(rep.get_json()["scenarios"]) == ["2"]
+    assert len(client.get(url_for("api.scenarios")).get_json()) == count
+
+    with mock.patch(
+        "taipy.core.scenario._scenario_manager._ScenarioManager._set",
+        side_effect=_ScenarioManager._set,
+    ) as set_mock:
+        rep = client.post(bulk_url, json={"scenarios": [{"tags": ["ok"], "properties": {"region": "EU"}}]})
+    assert rep.status_code == 201
+    assert rep.get_json()["scenarios"][0]["tags"] == ["ok"]
+    # The scenario is written once by its creation and once with its properties and tags.
+    assert set_mock.call_count == 2
+
+
+def test_bulk_execute_scenarios(client, default_scenario_config):
+    submit_url = url_for("api.scenarios_submit")
+    rep = client.post(submit_url, json={})
+    assert rep.status_code == 400
+
+    rep = client.post(submit_url, json={"cycle_id": "foo"})
+    assert rep.status_code == 404
+
+    bulk_url = url_for("api.scenarios_bulk", config_id=default_scenario_config.id)
+    scenario_ids = [scenario["id"] for scenario in client.post(bulk_url, json={"count": 2}).get_json()["scenarios"]]
+
+    rep = client.post(submit_url, json={"scenario_ids": scenario_ids + ["foo"]})
+    assert rep.status_code == 202
+    submissions = rep.get_json()["submissions"]
+    assert [submission["id"] for submission in submissions] == scenario_ids + ["foo"]
+    assert [submission["status"] for submission in submissions] == [202, 202, 404]
+    assert all(submission["submission_id"] and len(submission["job_ids"]) == 1 for submission in submissions[:2])
@@ -99,4 +99,25 @@ def test_execute_sequence(client, default_sequence):
 
         # test get_sequence
         rep = client.post(url_for("api.sequence_submit", sequence_id="foo"))
-        assert rep.status_code == 200
+        assert rep.status_code == 202
+
+
+def test_bulk_execute_sequences(client, default_scenario_config):
+    submit_url = url_for("api.sequences_submit")
+    rep = client.post(submit_url, json={"scenario_id": "foo", "sequence_ids": []})
+    assert rep.status_code == 400
+
+    rep = client.post(submit_url, json={"scenario_id": "foo"})
+    assert rep.status_code == 404
+
+    scenario = client.post(url_for("api.scenarios", config_id=default_scenario_config.id)).get_json()["scenario"]
+    rep = client.post(submit_url, json={"scenario_id": scenario["id"]})
+    assert rep.status_code == 202
+    submissions = rep.get_json()["submissions"]
+    assert len(submissions) == 1
+    assert submissions[0]["status"] == 202
+    assert len(submissions[0]["job_ids"]) == 1
+
+    rep = client.post(submit_url, json={"sequence_ids": ["foo"]})
+    assert rep.status_code == 202
+    assert rep.get_json()["submissions"][0]["status"] == 404
@@ -0,0 +1,69 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from src.taipy.rest.extensions import slow_requests
+
+TOKEN = "admin-token"
+
+
+@pytest.fixture
+def slow_log(app):
+    app.config.update({"ADMIN_TOKEN": TOKEN, "SLOW_REQUEST_THRESHOLD": 0, "SLOW_REQUEST_LOG_SIZE": 2})
+    slow_requests.init_app(app)
+    yield {"Authorization": f"Bearer {TOKEN}"}
+    app.config.update({"ADMIN_TOKEN": None, "SLOW_REQUEST_THRESHOLD": None, "SLOW_REQUEST_LOG_SIZE": 100})
+    slow_requests.init_app(app)
+
+
+def test_slow_requests(client, default_df_datanode, slow_log):
+    operators = {"operators": [{"key": "a", "value": 5, "operator": "LESS_THAN"}]}
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as manager_mock, mock.patch.object(
+        slow_requests, "_logger"
+    ) as logger_mock:
+        manager_mock.return_value = default_df_datanode
+        rep = client.get(url_for("api.datanode_reader", datanode_id=default_df_datanode.id), json=operators)
+        assert rep.status_code == 200
+        assert "Server-Timing" not in rep.headers
+        rows = len(rep.json["data"])
+        logger_mock.warning.assert_called_once()
+        assert logger_mock.warning.call_args.kwargs["extra"]["slow_request"]["endpoint"] == "datanode_reader"
+
+    rep = client.get(url_for("admin_slow_requests"), headers=slow_log)
+    assert rep.status_code == 200
+    assert rep.json["threshold"] == 0
+    slow = rep.json["requests"][0]
+    assert slow["method"] == "GET"
+    assert slow["endpoint"] == "datanode_reader"
+    assert slow["entity_id"] == default_df_datanode.id
+    assert slow["status"] == 200
+    assert slow["storage_type"] == "in_memory"
+    assert slow["operators"] == [{"key": "a", "value": 5, "operator": "LESS_THAN"}]
+    assert slow["rows"] == rows
+    assert {"lookup", "io", "transform", "serialize"} <= set(slow["phases"])
+    assert slow["duration"] >= sum(slow["phases"].values())
+
+
+def test_slow_requests_threshold(app, client, slow_log):
+    for _ in range(3):
+        client.get(url_for("api.jobs"))
+    # Only the last SLOW_REQUEST_LOG_SIZE slow requests are kept.
+    assert [slow["endpoint"] for slow in slow_requests.requests] == ["jobs", "jobs"]
+
+    app.config["SLOW_REQUEST_THRESHOLD"] = 60
+    slow_requests.init_app(app)
+    client.get(url_for("api.cycles"))
+    assert [slow["endpoint"] for slow in slow_requests.requests] == ["jobs", "jobs"]
+    assert client.get(url_for("admin_slow_requests")).status_code == 401
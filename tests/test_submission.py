@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from flask import url_for
+
+from taipy.core import JobId
+from taipy.core.job._job_manager import _JobManager
+from taipy.core.job.job import Job
+
+
+def test_get_submission(client, default_job):
+    # test 404
+    rep = client.get(url_for("api.submission_by_id", submission_id="foo"))
+    assert rep.status_code == 404
+
+    _JobManager._set(default_job)
+    rep = client.get(url_for("api.submission_by_id", submission_id=default_job.submit_id))
+    assert rep.status_code == 200
+    submission = rep.get_json()["submission"]
+    assert submission["id"] == default_job.submit_id
+    assert submission["status"] == "SUBMITTED"
+    assert not submission["is_finished"]
+    assert [job["id"] for job in submission["jobs"]] == [default_job.id]
+
+
+def test_get_abandoned_submission(client, default_job):
+    completed_job = Job(
+        id=JobId("JOB_completed"),
+        task=default_job.task,
+        submit_id=default_job.submit_id,
+        submit_entity_id=default_job.submit_entity_id,
+    )
+    _JobManager._set(default_job)
+    _JobManager._set(completed_job)
+    default_job.abandoned()
+    completed_job.completed()
+
+    rep = client.get(url_for("api.submission_by_id", submission_id=default_job.submit_id))
+    assert rep.status_code == 200
+    submission = rep.get_json()["submission"]
+    assert submission["status"] == "ABANDONED"
+    assert submission["is_finished"]
+
+
+def test_submit_returns_submission_location(client, default_scenario_config):
+    scenario = client.post(url_for("api.scenarios", config_id=default_scenario_config.id)).get_json()["scenario"]
+
+    rep = client.post(url_for("api.scenario_submit", scenario_id=scenario["id"]))
+    assert rep.status_code == 202
+    assert len(rep.get_json()["job_ids"]) == 1
+
+    rep = client.get(rep.headers["Location"])
+    assert rep.status_code == 200
+    assert rep.get_json()["submission"]["entity_id"] == scenario["id"]
+    assert rep.get_json()["submission"]["status"] == "COMPLETED"
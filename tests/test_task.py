@@ -85,4 +85,4 @@ def test_execute_task(client, default_task):
 
         # test get_task
         rep = client.post(url_for("api.task_submit", task_id="foo"))
-        assert rep.status_code == 200
+        assert rep.status_code == 202
@@ -0,0 +1,66 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from src.taipy.rest.api.websocket import _EntityEventSubscription
+from src.taipy.rest.app import _serves_entity_events, create_app
+from src.taipy.rest.extensions import entity_events
+
+
+def test_websocket_route(app):
+    pytest.importorskip("flask_sock")
+    rules = [rule for rule in app.url_map.iter_rules() if rule.websocket]
+    assert [rule.rule for rule in rules] == ["/api/v1/events/"]
+
+
+def test_entity_events_only_relayed_with_websocket_route(app):
+    pytest.importorskip("flask_sock")
+    assert _serves_entity_events(app)
+
+    with mock.patch("src.taipy.rest.app.register_blueprints"), mock.patch.object(
+        entity_events, "init_app"
+    ) as init_mock:
+        assert not _serves_entity_events(create_app(testing=True))
+    init_mock.assert_not_called()
+
+
+def test_subscription_receives_rest_mutations(client, cycle_data):
+    subscription = _EntityEventSubscription({"entity_type": ["cycle"], "operation": "creation"})
+
+    rep = client.post(url_for("api.cycles"), json=cycle_data)
+    assert rep.status_code == 201
+    cycle_id = rep.json["cycle"]["id"]
+
+    messages = []
+    for _ in range(50):
+        messages.extend(subscription.next_messages(0.1))
+        if messages:
+            break
+    assert [(message["entity_id"], message["operation"]) for message in messages] == [(cycle_id, "CREATION")]
+
+
+def test_subscription_update_and_dropped_events():
+    subscription = _EntityEventSubscription(last_id=2)
+    assert subscription.update('{"subscribe": {"entity_id": ["SCENARIO_foo"]}}') is None
+    assert subscription.update("foo") is not None
+
+    events = [
+        {"id": 5, "entity_type": "SCENARIO", "entity_id": "SCENARIO_foo", "operation": "UPDATE"},
+        {"id": 6, "entity_type": "SCENARIO", "entity_id": "SCENARIO_bar", "operation": "UPDATE"},
+    ]
+    with mock.patch.object(entity_events, "wait", return_value=events):
+        messages = subscription.next_messages(0)
+    assert messages == [{"dropped": 2}, events[0]]
+    assert subscription.last_id == 6